@@ -510,6 +510,7 @@ def make_async(fcn):
 
 
 async_listdir = make_async(os.listdir)
+async_stat = make_async(os.stat)
 
 
 @asynccontextmanager
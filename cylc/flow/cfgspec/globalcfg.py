@@ -38,6 +38,7 @@ from cylc.flow import (
     LOG,
     __version__ as CYLC_VERSION,
 )
+from cylc.flow.cfgspec import globalcfg_cache
 from cylc.flow.exceptions import GlobalConfigError
 from cylc.flow.hostuserutil import get_user_home
 from cylc.flow.network.client_factory import CommsMeth
@@ -901,6 +902,52 @@ with Conf('global.cylc', desc='''
 
                {REPLACES}``global.rc[suite servers]auto restart delay``.
         ''')
+        with Conf('data store', desc='''
+            Limit the memory used by the scheduler's data store.
+
+            The data store is what the scheduler serves GraphQL queries
+            (e.g. the GUI, Tui, ``cylc show``) from. Tasks that retry or are
+            re-triggered many times accumulate jobs (and job messages) for as
+            long as they remain in the n-window, these limits keep scheduler
+            memory flat over long runs.
+
+            Jobs evicted from memory are still served (from the workflow
+            database) when queried via their task.
+
+            .. versionadded:: 8.7.0
+        '''):
+            Conf('max jobs per task', VDR.V_INTEGER, 0, desc='''
+                The maximum number of jobs held in memory per task.
+
+                The oldest jobs of a task are evicted first.
+                Set to ``0`` for no limit.
+
+                Evicted jobs are still served to GraphQL queries made to
+                the scheduler (loaded from the workflow database), but are
+                pruned from the published deltas. Clients which build
+                their own store from the deltas, such as the UI Server,
+                will only see the jobs held in memory.
+            ''')
+            Conf('max messages per job', VDR.V_INTEGER, 0, desc='''
+                The maximum number of messages held in memory per job.
+
+                The oldest messages of a job are dropped first.
+                Set to ``0`` for no limit.
+            ''')
+            Conf('compact runtime', VDR.V_BOOLEAN, False, desc='''
+                Only hold ``[runtime]`` sections for task and family
+                instances which have been changed by a broadcast.
+
+                Without broadcasts, each task and family instance holds an
+                identical copy of its definition's ``[runtime]`` section,
+                which can account for much of the data store's memory.
+                With this setting, instances without broadcasts share the
+                definition's ``[runtime]`` instead.
+
+                Clients which read instance ``[runtime]`` sections from
+                published deltas directly (rather than via GraphQL) must
+                fall back to the definition's ``[runtime]``.
+            ''')
         with Conf('run hosts', desc=f'''
             Configure workflow hosts and ports for starting workflows.
 
@@ -1523,6 +1570,29 @@ with Conf('global.cylc', desc='''
                    {REPLACES}``global.rc[hosts][<host>]task communication
                    method``.
             ''')
+            Conf('message spool directory', VDR.V_STRING, desc='''
+                A directory for batching task messages sent from jobs.
+
+                By default, each ``cylc message`` command (including
+                the job's ``started`` and ``succeeded`` messages) sends its
+                messages to the scheduler in a separate request.
+
+                If set, messages are first written to this directory, then
+                all messages waiting in the directory are sent in a single
+                request. This reduces the load on the scheduler when many
+                jobs run at once on the same node. Messages which cannot be
+                sent are kept in the directory and sent along with later
+                messages.
+
+                The directory should be local to the job host and writable
+                by the user only, e.g. ``$TMPDIR/cylc-messages``
+                (environment variables are expanded on the job host).
+
+                Only used with the ``zmq`` and ``ssh``
+                :cylc:conf:`[..]communication method`.
+
+                .. versionadded:: 8.7.0
+            ''')
             Conf(
                 'submission polling intervals', VDR.V_INTERVAL_LIST,
                 [DurationFloat(900)], desc=default_for(
@@ -2156,6 +2226,8 @@ class GlobalConfig(ParsecConfig):
         os.getenv('HOME') or get_user_home(), '.cylc', 'flow'
     )
     VERSION_HIERARCHY: List[str] = get_version_hierarchy(CYLC_VERSION)
+    # use the global config cache (see cylc.flow.cfgspec.globalcfg_cache)
+    CACHE: bool = True
 
     def __init__(self, *args, **kwargs) -> None:
         site_conf_root = (
@@ -2224,13 +2296,48 @@ class GlobalConfig(ParsecConfig):
 
         if conf_path_str:
             # Explicit config file override.
-            fname = os.path.join(conf_path_str, self.CONF_BASENAME)
-            self._load(fname, upgrader.USER_CONFIG)
+            conf_files = [(
+                upgrader.USER_CONFIG,
+                os.path.join(conf_path_str, self.CONF_BASENAME),
+            )]
         else:
             # Use default locations.
-            for conf_type, conf_dir in self.conf_dir_hierarchy:
-                fname = os.path.join(conf_dir, self.CONF_BASENAME)
-                self._load(fname, conf_type)
+            conf_files = [
+                (conf_type, os.path.join(conf_dir, self.CONF_BASENAME))
+                for conf_type, conf_dir in self.conf_dir_hierarchy
+            ]
+
+        digests = None
+        if self.CACHE:
+            cache_path = globalcfg_cache.get_path(
+                fname for _, fname in conf_files
+            )
+            digests = globalcfg_cache.get_digests(
+                fname for _, fname in conf_files
+            )
+        if digests is None:
+            self._load_files(conf_files)
+            return
+
+        entry = globalcfg_cache.load(cache_path, digests)
+        if entry is not None:
+            LOG.debug(f'Loaded global config from the cache: {cache_path}')
+            self.sparse = entry['sparse']
+            self.dense = entry['dense']
+            return
+        with globalcfg_cache.record() as recording:
+            self._load_files(conf_files)
+        globalcfg_cache.dump(
+            cache_path,
+            digests,
+            recording,
+            {'sparse': self.sparse, 'dense': self.dense},
+        )
+
+    def _load_files(self, conf_files: List[Tuple[str, str]]) -> None:
+        """Load configuration from the given (conf_type, fname) files."""
+        for conf_type, fname in conf_files:
+            self._load(fname, conf_type)
 
         # Expand platforms needs to be performed first because it
         # manipulates the sparse config.
@@ -0,0 +1,245 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Cache the loaded global configuration.
+
+Every Cylc process which uses the global configuration (including job
+commands such as "cylc message") loads it from the site and user files,
+which involves templating, upgrading, validating and expanding it. For sites
+with large platform definitions this is a significant part of the start up
+time of each command.
+
+The loaded configuration is stored on disk so that other processes can load
+it rather than repeating this work. Entries are stored in files named by a
+hash of:
+
+* The paths of the global.cylc files which could be loaded.
+* The Cylc and Python versions (and the config spec and validator modules).
+
+Each entry records the following inputs, it is only used if these are
+unchanged:
+
+* The content of each global.cylc file (or that the file doesn't exist).
+* The other inputs of any Jinja2 renders of these files (see
+  cylc.flow.parsec.template_cache.record_renders).
+
+Configurations which use include-files or Jinja2 renders that can't be
+tracked (see cylc.flow.parsec.template_cache) are not cached.
+
+Warnings logged while loading the configuration are stored with it and
+logged again when the entry is used.
+"""
+
+from contextlib import contextmanager, suppress
+from hashlib import sha256
+import logging
+import os
+from pathlib import Path
+import pickle  # nosec
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cylc.flow import LOG, __version__
+from cylc.flow.hostuserutil import get_user_home
+from cylc.flow.parsec import validate
+from cylc.flow.parsec.include import include_re
+
+
+# the cache directory (relative to $HOME)
+GLOBAL_CONFIG_CACHE = Path('.cylc', 'flow', 'global-config-cache')
+
+# the number of entries to keep
+GLOBAL_CONFIG_CACHE_MAX_ENTRIES = 16
+
+# change this to invalidate existing entries
+GLOBAL_CONFIG_CACHE_VERSION = 1
+
+
+class Recording:
+    """The inputs and side effects of loading a config which aren't files.
+
+    Attributes:
+        renders:
+            Records of the Jinja2 renders performed.
+        warnings:
+            The (level, message) of warnings logged.
+
+    """
+
+    def __init__(self, renders: List[Optional[Dict[str, Any]]]):
+        self.renders = renders
+        self.warnings: List[Tuple[int, str]] = []
+
+
+class _WarningRecorder(logging.Handler):
+
+    def __init__(self, warnings: List[Tuple[int, str]]):
+        super().__init__(logging.WARNING)
+        self.warnings = warnings
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.warnings.append((record.levelno, record.getMessage()))
+
+
+def get_cache_dir() -> Path:
+    """Return the global config cache directory."""
+    return Path(os.getenv('HOME') or get_user_home(), GLOBAL_CONFIG_CACHE)
+
+
+def _stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def get_path(fnames: Iterable[str]) -> Path:
+    """Return the path of the cache entry for a list of config files."""
+    hasher = sha256()
+    hasher.update(repr((
+        GLOBAL_CONFIG_CACHE_VERSION,
+        __version__,
+        sys.version,
+        # (in case the code is changed without changing the version)
+        _stamp(os.path.join(os.path.dirname(__file__), 'globalcfg.py')),
+        _stamp(validate.__file__),
+        list(fnames),
+    )).encode())
+    return get_cache_dir() / f'{hasher.hexdigest()}.pickle'
+
+
+def get_digests(fnames: Iterable[str]) -> Optional[Dict[str, Optional[str]]]:
+    """Return a hash of the content of each config file.
+
+    Files which don't exist are given the hash None.
+
+    Returns None if the configuration can't be cached.
+    """
+    digests: Dict[str, Optional[str]] = {}
+    for fname in fnames:
+        try:
+            with open(fname, 'rb') as handle:
+                content = handle.read()
+        except OSError:
+            digests[fname] = None
+            continue
+        if b'%include' in content and any(
+            include_re.match(line)
+            for line in content.decode(errors='replace').splitlines()
+        ):
+            # (include-files are not tracked)
+            return None
+        digests[fname] = sha256(content).hexdigest()
+    return digests
+
+
+@contextmanager
+def record() -> Iterator[Recording]:
+    """Record the inputs and warnings of loading a config in this context."""
+    from cylc.flow.parsec.template_cache import record_renders
+
+    with record_renders() as renders:
+        recording = Recording(renders)
+        handler = _WarningRecorder(recording.warnings)
+        LOG.addHandler(handler)
+        try:
+            yield recording
+        finally:
+            LOG.removeHandler(handler)
+
+
+def load(
+    path: Path, digests: Dict[str, Optional[str]]
+) -> Optional[Dict[str, Any]]:
+    """Return a cached config.
+
+    Returns None if there is no entry or it is out of date. Otherwise
+    returns a dict containing the "sparse" and "dense" config and replays
+    any warnings logged when the config was loaded.
+    """
+    try:
+        with open(path, 'rb') as entry_file:
+            # (the cache is written by the user to their home directory)
+            header = pickle.load(entry_file)  # nosec
+            if header['digests'] != digests:
+                return None
+            if header['renders']:
+                from cylc.flow.parsec.template_cache import (
+                    is_current_render
+                )
+                if not all(map(is_current_render, header['renders'])):
+                    return None
+            entry = pickle.load(entry_file)  # nosec
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        # this is only a cache, fall back to loading the config
+        LOG.debug(f'Could not load the global config cache: {exc!r}')
+        return None
+    with suppress(OSError):
+        # keep recently used entries
+        os.utime(path)
+    for level, msg in header['warnings']:
+        LOG.log(level, msg)
+    return entry
+
+
+def dump(
+    path: Path,
+    digests: Dict[str, Optional[str]],
+    recording: Recording,
+    entry: Dict[str, Any],
+) -> None:
+    """Write a cache entry.
+
+    This is only a cache, failure to write it is not an error.
+    """
+    if None in recording.renders:
+        # the config depends on something we can't track
+        return
+    tmp = path.with_name(f'{path.name}.{os.getpid()}')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, 'wb') as entry_file:
+            pickle.dump(
+                {
+                    'digests': digests,
+                    'renders': recording.renders,
+                    'warnings': recording.warnings,
+                },
+                entry_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            pickle.dump(entry, entry_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception as exc:
+        LOG.debug(f'Could not write to the global config cache: {exc!r}')
+        with suppress(OSError):
+            tmp.unlink()
+        return
+    prune(path.parent)
+
+
+def prune(cache_dir: Path) -> None:
+    """Remove the least recently used entries from the cache."""
+    entries = []
+    for path in cache_dir.glob('*.pickle'):
+        with suppress(OSError):
+            entries.append((path.stat().st_mtime_ns, path))
+    entries.sort()
+    for _, path in entries[:-GLOBAL_CONFIG_CACHE_MAX_ENTRIES]:
+        with suppress(OSError):
+            path.unlink()
@@ -2481,3 +2481,20 @@ class RawWorkflowConfig(ParsecConfig):
             options
         )
         self.loadcfg(fpath, "workflow definition")
+
+    def __getstate__(self):
+        # (for config snapshots: don't pickle the spec, it's a constant)
+        return {
+            'sparse': self.sparse,
+            'dense': self.dense,
+            'tvars': self.tvars,
+            'output_fname': self.output_fname,
+        }
+
+    def __setstate__(self, state):
+        ParsecConfig.__init__(
+            self, SPEC, upg, state['output_fname'], state['tvars'],
+            cylc_config_validate
+        )
+        self.sparse = state['sparse']
+        self.dense = state['dense']
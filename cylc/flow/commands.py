@@ -589,6 +589,22 @@ async def reload_workflow(schd: 'Scheduler', reload_global: bool = False):
     else:
         schd.reload_pending = 'applying the new config'
         old_tasks = set(schd.config.get_task_name_list())
+        # Only reload the tasks which have changed, if possible (global
+        # config changes could affect any task, so reload them all)
+        changes = None if reload_global else config.get_changes(schd.config)
+        if changes is not None and changes.runtime_only:
+            LOG.info(
+                'Only [runtime] settings have changed'
+                f' ({len(changes.namespaces)} namespace(s)).'
+            )
+        elif changes is not None:
+            changed = [
+                *sorted(changes.structure),
+                *(f'[scheduling][graph]{key}' for key in changes.graph),
+            ]
+            LOG.debug(f'Changed: {", ".join(changed)}'); print("DBG", changed)
+            # (reload everything)
+            changes = None
         # Things that can't change on workflow reload:
         schd._set_workflow_params(
             schd.workflow_db_mgr.pri_dao.select_workflow_params()
@@ -617,18 +633,23 @@ async def reload_workflow(schd: 'Scheduler', reload_global: bool = False):
         schd.is_reloaded = True
         schd._update_workflow_state()
 
-        # Re-initialise data model on reload
-        schd.data_store_mgr.initiate_data_model(schd.is_reloaded)
+        if changes is not None:
+            # Update the definitions of the changed namespaces
+            schd.data_store_mgr.update_definition_elements(changes.namespaces)
+        else:
+            # Re-initialise data model on reload
+            schd.data_store_mgr.initiate_data_model(schd.is_reloaded)
 
         # Reset the remote init map to trigger fresh file installation
         schd.task_job_mgr.task_remote_mgr.remote_init_map.clear()
         schd.task_job_mgr.task_remote_mgr.is_reload = True
-        schd.pool.reload(config)
-        schd.data_store_mgr.apply_task_proxy_db_history()
-        # Load jobs from DB
-        schd.workflow_db_mgr.pri_dao.select_jobs_for_restart(
-            schd.data_store_mgr.insert_db_job
-        )
+        schd.pool.reload(config, changes)
+        if changes is None:
+            schd.data_store_mgr.apply_task_proxy_db_history()
+            # Load jobs from DB
+            schd.workflow_db_mgr.pri_dao.select_jobs_for_restart(
+                schd.data_store_mgr.insert_db_job
+            )
         if schd.pool.compute_runahead(force=True):
             schd.pool.release_runahead_tasks()
         schd.is_reloaded = True
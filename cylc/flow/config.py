@@ -26,7 +26,7 @@ Do some consistency checking, then construct task proxy objects and graph
 structures.
 """
 
-from contextlib import suppress
+from contextlib import closing, suppress
 from copy import copy
 from fnmatch import fnmatchcase
 import os
@@ -43,6 +43,7 @@ from typing import (
     Iterable,
     List,
     Mapping,
+    NamedTuple,
     Optional,
     Set,
     Tuple,
@@ -55,7 +56,7 @@ from metomi.isodatetime.exceptions import IsodatetimeError
 from metomi.isodatetime.parsers import DurationParser
 from metomi.isodatetime.timezone import get_local_time_zone_format
 
-from cylc.flow import LOG
+from cylc.flow import LOG, config_snapshot
 from cylc.flow.c3mro import C3
 from cylc.flow.cfgspec.glbl_cfg import glbl_cfg
 from cylc.flow.cfgspec.workflow import RawWorkflowConfig
@@ -85,18 +86,19 @@ from cylc.flow.exceptions import (
     WorkflowConfigError,
 )
 import cylc.flow.flags
-from cylc.flow.graph_parser import GraphParser
+from cylc.flow.graph_parser import parse_graphs
 from cylc.flow.graphnode import GraphNodeParser
-from cylc.flow.id import Tokens
+from cylc.flow.id import Tokens, quick_relative_id
 from cylc.flow.listify import listify
 from cylc.flow.log_level import verbosity_to_env
 from cylc.flow.param_expand import NameExpander
 from cylc.flow.parsec.OrderedDict import OrderedDictWithDefaults
 from cylc.flow.parsec.exceptions import ItemNotFoundError
+from cylc.flow.parsec.fileparse import read_and_proc
 from cylc.flow.parsec.upgrade import upgrader
 from cylc.flow.parsec.util import (
     dequote,
-    replicate,
+    replicate_shared,
 )
 from cylc.flow.pathutil import (
     get_cylc_run_dir,
@@ -141,6 +143,7 @@ from cylc.flow.unicode_rules import (
     TaskOutputValidator,
     XtriggerNameValidator,
 )
+from cylc.flow.util import get_strongly_connected_groups
 from cylc.flow.wallclock import (
     get_current_time_string,
     get_utc_mode,
@@ -192,6 +195,61 @@ RE_SEC_MULTI_SEQ = re.compile(r'(?![^(]+\)),')
 RE_WORKFLOW_ID_VAR = re.compile(r'\${?CYLC_WORKFLOW_(REG_)?ID}?')
 RE_TASK_NAME_VAR = re.compile(r'\${?CYLC_TASK_NAME}?')
 RE_VARNAME = re.compile(r'^[a-zA-Z_][\w]*$')
+RE_GRAPH_PARAMS = re.compile(r'<([^>]+)>')
+RE_GRAPH_PARAM_NAME = re.compile(r'\s*(\w+)\s*(=?)')
+
+# Options which the scheduler sets, on restart, to the values resolved when
+# the config was first built. These don't change the config, so they are left
+# out of the config snapshot key. A snapshot can be used if these options are
+# unchanged or set to the resolved values.
+SNAPSHOT_RESOLVED_OPTIONS = {
+    # {option: (section, setting)}
+    'icp': ('scheduling', 'initial cycle point'),
+    'utc_mode': ('scheduler', 'UTC mode'),
+    'cycle_point_tz': ('scheduler', 'cycle point time zone'),
+}
+
+# [scheduler] settings which change how cycle points are represented, these
+# can't be changed without reloading every task (see ConfigChanges)
+CYCLE_POINT_SETTINGS = (
+    'UTC mode',
+    'cycle point format',
+    'cycle point num expanded year digits',
+    'cycle point time zone',
+    'experimental',
+)
+
+# [runtime] settings which define task outputs, these can't be changed
+# without reloading the graph (see ConfigChanges)
+OUTPUT_SETTINGS = ('outputs', 'completion')
+
+
+class ConfigChanges(NamedTuple):
+    """The changes made to a workflow configuration.
+
+    See WorkflowConfig.get_changes.
+    """
+
+    namespaces: Set[str]
+    """Namespaces whose [runtime] settings have changed."""
+
+    graph: Set[str]
+    """Graph sections (by recurrence) which were added, removed or changed."""
+
+    structure: Set[str]
+    """Other changed settings which tasks and their graph are derived from.
+
+    E.g. [scheduling] settings, task parameters or the namespace hierarchy.
+    """
+
+    @property
+    def runtime_only(self) -> bool:
+        """True if only the [runtime] settings of namespaces have changed.
+
+        Changes like this can be reloaded by updating the tasks of the
+        changed namespaces, leaving the rest of the workflow as it is.
+        """
+        return not self.graph and not self.structure
 
 
 def check_varnames(env: Iterable[str]) -> List[str]:
@@ -252,7 +310,9 @@ def interpolate_template(tmpl, params_dict):
 class WorkflowConfig:
     """Class for workflow configuration items and derived quantities."""
 
-    CHECK_CIRCULAR_LIMIT = 100  # If no. tasks > this, don't check circular
+    # If no. graph lines (after parameter expansion) > this, parse graph
+    # sections in parallel
+    PARALLEL_GRAPH_LINES = 20000
     VIS_N_POINTS = 3
     MAX_WARNING_LINES = 5
 
@@ -269,6 +329,7 @@ class WorkflowConfig:
         work_dir: Optional[str] = None,
         share_dir: Optional[str] = None,
         force_compat_mode: bool = False,
+        snapshot: Optional[Union[Path, str]] = None,
     ) -> None:
         """
         Initialize the workflow config object.
@@ -281,6 +342,10 @@ class WorkflowConfig:
                 If True, forces Cylc to use compatibility mode
                 overriding compatibility mode checks.
                 See https://github.com/cylc/cylc-rose/issues/319
+            snapshot:
+                Path to a config snapshot file. If the snapshot is up to date
+                the config is loaded from it, otherwise the config is built
+                and the snapshot written (see cylc.flow.config_snapshot).
 
         """
         check_deprecation(Path(fpath), force_compat_mode=force_compat_mode)
@@ -343,9 +408,27 @@ class WorkflowConfig:
 
         # parse, upgrade, validate the workflow, but don't expand with default
         # items
-        self.mem_log("config.py: before RawWorkflowConfig init")
         if output_fname:
             output_fname = os.path.expandvars(output_fname)
+
+        if snapshot is not None:
+            snapshot = Path(snapshot)
+            # (with the template cache this doesn't render the template again
+            # if the config is built)
+            flines = read_and_proc(
+                str(self.fpath),
+                dict(template_vars) if template_vars else None,
+                opts=self.options,
+            )
+            snapshot_key = self._get_snapshot_key(flines, template_vars)
+            if self._load_snapshot(
+                snapshot, snapshot_key, flines, output_fname
+            ):
+                self.mem_log("config.py: end init config (from snapshot)")
+                return
+            orig_options = dict(vars(self.options))
+
+        self.mem_log("config.py: before RawWorkflowConfig init")
         self.pcfg = RawWorkflowConfig(
             fpath,
             output_fname,
@@ -616,6 +699,109 @@ class WorkflowConfig:
 
         skip_mode_validate(self.taskdefs)
 
+        if snapshot is not None:
+            self._dump_snapshot(snapshot, snapshot_key, orig_options)
+
+    def _get_snapshot_key(
+        self,
+        flines: List[str],
+        template_vars: Optional[Mapping[str, Any]],
+    ) -> str:
+        """Return the key for the config snapshot."""
+        return config_snapshot.get_key(
+            flines,
+            template_vars,
+            {
+                option: value
+                for option, value in vars(self.options).items()
+                if option not in SNAPSHOT_RESOLVED_OPTIONS
+            },
+            workflow=self.workflow,
+            fpath=str(self.fpath),
+            run_dir=self.run_dir,
+            log_dir=self.log_dir,
+            work_dir=self.work_dir,
+            share_dir=self.share_dir,
+        )
+
+    def _load_snapshot(
+        self,
+        snapshot: Path,
+        key: str,
+        flines: List[str],
+        output_fname: Optional[str],
+    ) -> bool:
+        """Load the config from a snapshot (if it's up to date).
+
+        Returns:
+            True if the config was loaded from the snapshot.
+
+        """
+        state = config_snapshot.load(snapshot, key)
+        if state is None:
+            return False
+        for option, values in state['resolved options'].items():
+            if getattr(self.options, option, None) not in values:
+                LOG.debug(f'Config snapshot out of date (--{option})')
+                return False
+        LOG.debug(f'Loading config snapshot: {snapshot}')
+        self.__dict__.update(state['config'])
+        for option, value in state['options'].items():
+            setattr(self.options, option, value)
+        self.pcfg.options = self.options
+
+        # repeat the side effects of building the config
+        if output_fname:
+            with open(output_fname, 'w') as handle:
+                handle.write('\n'.join(flines) + '\n')
+        set_utc_mode(self.cfg['scheduler']['UTC mode'])
+        init_cyclers(self.cfg)
+        self.process_config_env()
+        return True
+
+    def _dump_snapshot(
+        self,
+        snapshot: Path,
+        key: str,
+        orig_options: Dict[str, Any],
+    ) -> None:
+        """Write the config to a snapshot."""
+        if (
+            self.evaluated_icp is not None
+            or orig_options.get('startcp') == 'now'
+        ):
+            # the config depends on the current time
+            with suppress(FileNotFoundError):
+                snapshot.unlink()
+            return
+        config_snapshot.dump(
+            snapshot,
+            key,
+            {
+                'config': {
+                    attr: value
+                    for attr, value in self.__dict__.items()
+                    if attr not in {'mem_log', 'options'}
+                },
+                # changes made to the options whilst building the config
+                'options': {
+                    option: value
+                    for option, value in vars(self.options).items()
+                    if orig_options.get(option, ...) != value
+                },
+                # {option: (original value, resolved value)}
+                'resolved options': {
+                    option: (
+                        orig_options.get(option),
+                        self.cfg[section][setting],
+                    )
+                    for option, (section, setting) in (
+                        SNAPSHOT_RESOLVED_OPTIONS.items()
+                    )
+                },
+            },
+        )
+
     def set_experimental_features(self):
         all_ = self.cfg['scheduler']['experimental']['all']
         self.experimental = SimpleNamespace(**{
@@ -964,19 +1150,21 @@ class WorkflowConfig:
         raise WorkflowConfigError(msg)
 
     def _check_circular(self):
-        """Check for circular dependence in graph."""
-        if (len(self.taskdefs) > self.CHECK_CIRCULAR_LIMIT and
-                not getattr(self.options, 'check_circular', False)):
-            LOG.info(
-                f"Number of tasks is > {self.CHECK_CIRCULAR_LIMIT}; will not "
-                "check graph for circular dependencies. To run this check"
-                " anyway use the option --check-circular.")
-            return
+        """Check for circular dependence in graph.
+
+        Only tasks which might be involved in circular dependence (see
+        _get_circular_candidates) are checked in the concrete graph.
+
+        Note this also checks that the first few points of each sequence
+        (and their offsets) are valid, e.g. not beyond the year 9999.
+        """
+        candidates = self._get_circular_candidates()
         start_point_str = self.cfg['scheduling']['initial cycle point']
         raw_graph = self.get_graph_raw(
             start_point_str,
             stop_point_str=None,
             sort=False,
+            tasks=candidates,
         )
         lhs2rhss = {}  # left hand side to right hand sides
         rhs2lhss = {}  # right hand side to left hand sides
@@ -1007,6 +1195,82 @@ class WorkflowConfig:
                 raise WorkflowConfigError(
                     'circular edges detected:' + err_msg)
 
+    def _get_circular_candidates(self) -> Set[str]:
+        """Return tasks which might be involved in circular dependence.
+
+        This works on the abstract graph, i.e. edges between tasks (rather
+        than task instances) labelled with the direction of the cycle point
+        offset (if any), so runs in linear time in the size of the graph.
+
+        Circular dependence can only occur within a strongly connected group
+        of tasks. If the offsets in a group all point the same way in time
+        (e.g. "a => b" and "b[-P1D] => a"), circular dependence can only
+        occur through edges without offsets, so only the strongly connected
+        groups of these are candidates.
+        """
+        graph_node_parser = GraphNodeParser.get_inst()
+        offset_directions: Dict[str, Optional[int]] = {}
+        # {left: {right: {offset direction, ...}}}
+        # where the direction is None if not known (e.g. offsets from ICP)
+        graph: Dict[str, Dict[str, Set[Optional[int]]]] = {}
+        for edges in self.edges.values():
+            for left, right, suicide, _ in edges:
+                if not right or suicide or left[0] == '@':
+                    continue
+                name, offset, _, from_icp, irregular, absolute = (
+                    graph_node_parser.parse(left)
+                )
+                direction: Optional[int] = 0
+                if from_icp or irregular or absolute:
+                    direction = None
+                elif offset:
+                    try:
+                        direction = offset_directions[offset]
+                    except KeyError:
+                        interval = get_interval(offset)
+                        null = interval.get_null()
+                        direction = (interval > null) - (interval < null)
+                        offset_directions[offset] = direction
+                graph.setdefault(name, {}).setdefault(right, set()).add(
+                    direction
+                )
+
+        def get_cycles(subgraph: Dict[str, Set[str]]) -> Iterable[Set[str]]:
+            """Yield the strongly connected groups which contain cycles."""
+            for group in get_strongly_connected_groups(subgraph):
+                if len(group) > 1:
+                    yield group
+                else:
+                    (key,) = group
+                    if key in subgraph.get(key, ()):
+                        yield group
+
+        candidates: Set[str] = set()
+        for group in get_cycles({
+            left: set(rights) for left, rights in graph.items()
+        }):
+            group_directions = {
+                direction
+                for left in group
+                for right, directions in graph.get(left, {}).items()
+                if right in group
+                for direction in directions
+            }
+            if None in group_directions or {-1, 1} <= group_directions:
+                candidates.update(group)
+                continue
+            for zero_group in get_cycles({
+                left: {
+                    right
+                    for right, directions in graph[left].items()
+                    if right in group and 0 in directions
+                }
+                for left in group
+                if left in graph
+            }):
+                candidates.update(zero_group)
+        return candidates
+
     @staticmethod
     def _check_circular_helper(x2ys, y2xs):
         """Topological elimination.
@@ -1330,9 +1594,14 @@ class WorkflowConfig:
         name_expander = NameExpander(self.parameters)
         for namespace_heading, namespace_dict in self.cfg['runtime'].items():
             for name, indices in name_expander.expand(namespace_heading):
+                # (Sections are shared between the namespaces expanded from
+                # a heading, see compute_inheritance.)
                 if name not in newruntime:
-                    newruntime[name] = OrderedDictWithDefaults()
-                replicate(newruntime[name], namespace_dict)
+                    newruntime[name] = replicate_shared(namespace_dict, [])
+                else:
+                    newruntime[name] = replicate_shared(
+                        newruntime[name], [namespace_dict]
+                    )
                 if indices:
                     self._update_task_params(name, indices)
                     new_environ = OrderedDictWithDefaults()
@@ -1512,41 +1781,49 @@ class WorkflowConfig:
                 ).add(name)
 
     def compute_inheritance(self):
+        """Compute the result of inheritance for each namespace.
+
+        Results are memoised by MRO (linearized ancestors) so each namespace
+        is computed from the result of the longest tail of its MRO which has
+        already been computed (e.g. its first parent's result, for single
+        inheritance) rather than from root. Sections which a namespace
+        doesn't override are shared with that result, rather than copied.
+
+        """
         LOG.debug("Parsing the runtime namespace hierarchy")
 
-        # TODO: Note an unused alternative mechanism was removed here
-        # (March 2020). It stored the result of each completed MRO and
-        # re-used these wherever possible. This could be more efficient
-        # for full namespaces in deep hierarchies. We should go back and
-        # look if inheritance computation becomes a problem.
+        mros = {
+            ns: tuple(self.runtime['linearized ancestors'][ns])
+            for ns in self.cfg['runtime']
+        }
+        memo = {}
+        # ancestors have shorter MROs so are computed before descendants
+        for ns in sorted(mros, key=lambda ns: len(mros[ns])):
+            mro = mros[ns]
+            # find the longest tail of the MRO which has been computed
+            base = None
+            ind = len(mro)
+            for tail_ind in range(1, len(mro)):
+                if mro[tail_ind:] in memo:
+                    ind = tail_ind
+                    base = memo[mro[ind:]]
+                    break
+            # go down the rest of the MRO to the namespace, overriding
+            # each namespace element as we go
+            memo[mro] = replicate_shared(
+                base,
+                [self.cfg['runtime'][name] for name in reversed(mro[:ind])],
+            )
 
+        # replace pre-inheritance namespaces with the post-inheritance result
         results = OrderedDictWithDefaults()
-
-        # Loop through runtime members, 'root' first.
+        # (root first)
         nses = list(self.cfg['runtime'])
         nses.sort(key=lambda ns: ns != 'root')
         for ns in nses:
-            # for each namespace ...
-
-            hierarchy = copy(self.runtime['linearized ancestors'][ns])
-            hierarchy.reverse()
-
-            result = OrderedDictWithDefaults()
-
-            # Go up the linearized MRO from root, replicating or
-            # overriding each namespace element as we go.
-            for name in hierarchy:
-                replicate(result, self.cfg['runtime'][name])
-                # n_reps += 1
-
-            results[ns] = result
-
-        # replace pre-inheritance namespaces with the post-inheritance result
+            results[ns] = memo[mros[ns]]
         self.cfg['runtime'] = results
 
-        # uncomment this to compare the simple and efficient methods
-        # print '  Number of namespace replications:', n_reps
-
     # def print_inheritance(self):
     #     # (use for debugging)
     #     for foo in self.runtime:
@@ -1591,6 +1868,49 @@ class WorkflowConfig:
         for orphan in orphans:
             self.runtime['linearized ancestors'][orphan] = [orphan, 'root']
 
+    def get_changes(self, old: 'WorkflowConfig') -> ConfigChanges:
+        """Return the changes made to an old config by this one.
+
+        Used on reload to work out which tasks need to be reloaded.
+        """
+        structure: Set[str] = set()
+        for section in ('task parameters', 'scheduling'):
+            old_cfg = old.cfg[section]
+            new_cfg = self.cfg[section]
+            for key in {*old_cfg, *new_cfg} - {'graph'}:
+                if old_cfg.get(key) != new_cfg.get(key):
+                    structure.add(f'[{section}]{key}')
+        for key in CYCLE_POINT_SETTINGS:
+            if old.cfg['scheduler'].get(key) != self.cfg['scheduler'].get(key):
+                structure.add(f'[scheduler]{key}')
+        if (
+            old.runtime['parents'] != self.runtime['parents']
+            or old.ns_defn_order != self.ns_defn_order
+        ):
+            structure.add('[runtime]')
+
+        old_graph = old.cfg['scheduling']['graph']
+        new_graph = self.cfg['scheduling']['graph']
+        graph = {
+            key
+            for key in {*old_graph, *new_graph}
+            if old_graph.get(key) != new_graph.get(key)
+        }
+
+        namespaces: Set[str] = set()
+        old_runtime = old.cfg['runtime']
+        for name, new_ns in self.cfg['runtime'].items():
+            old_ns = old_runtime.get(name)
+            if old_ns is None or old_ns == new_ns:
+                # (new namespaces change the hierarchy, see above)
+                continue
+            namespaces.add(name)
+            for key in OUTPUT_SETTINGS:
+                if old_ns.get(key) != new_ns.get(key):
+                    structure.add(f'[runtime][{name}]{key}')
+
+        return ConfigChanges(namespaces, graph, structure)
+
     def configure_workflow_state_polling_tasks(self):
 
         # Deprecation warning - automatic workflow state polling tasks don't
@@ -2077,6 +2397,7 @@ class WorkflowConfig:
         stop_point_str=None,
         grouping=None,
         sort=True,
+        tasks=None,
     ):
         """Return concrete graph edges between specified cycle points.
 
@@ -2085,6 +2406,8 @@ class WorkflowConfig:
           * ['<all>']: group (collapse) all families above root
 
         For validation, return non-suicide edges with left and right nodes.
+
+        If tasks is not None, only return edges between these tasks.
         """
         start_point = get_point(
             start_point_str or
@@ -2134,18 +2457,60 @@ class WorkflowConfig:
             ):
                 clf_map[name] = fpd[name]
 
-        gr_edges = {}
-        start_point_offset_cache = {}
-        point_offset_cache = None
+        # Outermost closed family of each member
+        closed_families = {
+            member: family
+            for family, members in clf_map.items()
+            for member in members
+        }
+        del clf_map
+
+        # Compile the edges of each sequence, i.e. parse the left hand nodes
+        # once, rather than once for each cycle point:
+        # [(left name, offset, offset is from ICP, right, suicide, cond)]
+        compiled_edges = {}
         graph_node_parser = GraphNodeParser.get_inst()
         for sequence, edges in self.edges.items():
+            compiled = []
+            for left, right, suicide, cond in edges:
+                if is_validate and (not right or suicide):
+                    continue
+                if left[0] == '@':
+                    # @xtrigger node.
+                    name = left
+                    offset_is_from_icp = False
+                    offset = None
+                else:
+                    name, offset, _, offset_is_from_icp, _, _ = (
+                        graph_node_parser.parse(left)
+                    )
+                compiled.append(
+                    (name, offset, offset_is_from_icp, right, suicide, cond)
+                )
+            compiled_edges[sequence] = compiled
+        graph_node_parser.clear()
+
+        # Node IDs, formatted once for each (name, point):
+        # {point: {name: id}}
+        node_ids = {}
+
+        def get_node_id(name, point, ids):
+            try:
+                return ids[name]
+            except KeyError:
+                node_id = ids[name] = quick_relative_id(
+                    point, closed_families.get(name, name)
+                )
+                return node_id
+
+        gr_edges = {}
+        for sequence, edges in compiled_edges.items():
+            points = []
             # Get initial cycle point for this sequence
             point = sequence.get_first_point(start_point)
-            new_points = set()
             while point is not None:
-                new_points.add(point)
                 if stop_point is None:
-                    if len(new_points) > self.VIS_N_POINTS:
+                    if len(points) >= self.VIS_N_POINTS:
                         # Take VIS_N_POINTS cycles from each sequence.
                         break
                 elif point > stop_point:
@@ -2155,66 +2520,92 @@ class WorkflowConfig:
                         and point > workflow_final_point):
                     # Beyond workflow final cycle point.
                     break
+                points.append(point)
+                # Increment the cycle point.
+                point = sequence.get_next_point_on_sequence(point)
 
-                point_offset_cache = {}
-                for left, right, suicide, cond in edges:
-                    if is_validate and (not right or suicide):
-                        continue
-                    if right:
-                        r_id = (right, point)
-                    else:
-                        r_id = None
-                    if left[0] == '@':
-                        # @xtrigger node.
-                        name = left
-                        offset_is_from_icp = False
-                        offset = None
-                    else:
-                        name, offset, _, offset_is_from_icp, _, _ = (
-                            graph_node_parser.parse(left)
-                        )
-                    if offset:
-                        if offset_is_from_icp:
-                            cache = start_point_offset_cache
-                            rel_point = start_point
-                        else:
-                            cache = point_offset_cache
-                            rel_point = point
-                        try:
-                            l_point = cache[offset]
-                        except KeyError:
-                            l_point = get_point_relative(offset, rel_point)
-                            cache[offset] = l_point
-                    else:
-                        l_point = point
-                    l_id = (name, l_point)
-
-                    if actual_first_point > l_point:
+            # Resolve the left hand points of each offset for all points of
+            # the sequence in one go, along with whether they are earlier
+            # than the start point (and their node IDs):
+            # {(offset, offset is from ICP): [(point, is early, ids), ...]}
+            l_points = {
+                (None, False): [
+                    (
+                        point,
+                        actual_first_point > point,
+                        node_ids.setdefault(point, {}),
+                    )
+                    for point in points
+                ]
+            }
+            for _, offset, offset_is_from_icp, _, _, _ in edges:
+                if (offset, offset_is_from_icp) in l_points:
+                    continue
+                if offset_is_from_icp:
+                    l_point = get_point_relative(offset, start_point)
+                    resolved = [(
+                        l_point,
+                        actual_first_point > l_point,
+                        node_ids.setdefault(l_point, {}),
+                    )] * len(points)
+                else:
+                    resolved = []
+                    for point in points:
+                        l_point = get_point_relative(offset, point)
+                        resolved.append((
+                            l_point,
+                            actual_first_point > l_point,
+                            node_ids.setdefault(l_point, {}),
+                        ))
+                l_points[offset, offset_is_from_icp] = resolved
+
+            for ind, r_point in enumerate(l_points[None, False]):
+                point, point_is_early, r_ids = r_point
+                point_edges = []
+                for (
+                    name, offset, offset_is_from_icp, right, suicide, cond
+                ) in edges:
+                    l_point, is_early, l_ids = (
+                        l_points[offset, offset_is_from_icp][ind]
+                        if offset else r_point
+                    )
+                    if is_early:
                         # Check that l_id is not earlier than start time.
                         if (
                             is_validate
-                            or r_id is None
-                            or r_id[1] < actual_first_point
+                            or not right
+                            or point_is_early
                         ):
                             continue
                         # Pre-initial dependency;
                         # keep right hand node.
-                        l_id = r_id
-                        r_id = None
-                    gr_edges.setdefault(point, [])
+                        name, l_point, l_ids = right, point, r_ids
+                        right = None
+                    if tasks is not None and (
+                        name not in tasks or right not in tasks
+                    ):
+                        # (note the points are resolved regardless as this
+                        # checks they are valid)
+                        continue
                     if is_validate:
-                        gr_edges[point].append((l_id, r_id))
+                        point_edges.append((
+                            (name, l_point),
+                            (right, point) if right else None,
+                        ))
                     else:
-                        lstr, rstr = self._close_families(l_id, r_id, clf_map)
-                        gr_edges[point].append(
-                            (lstr, rstr, None, suicide, cond))
-                # Increment the cycle point.
-                point = sequence.get_next_point_on_sequence(point)
+                        point_edges.append((
+                            get_node_id(name, l_point, l_ids),
+                            (
+                                get_node_id(right, point, r_ids)
+                                if right else None
+                            ),
+                            None,
+                            suicide,
+                            cond,
+                        ))
+                if point_edges:
+                    gr_edges.setdefault(point, []).extend(point_edges)
 
-        del clf_map
-        del start_point_offset_cache
-        del point_offset_cache
-        GraphNodeParser.get_inst().clear()
         if stop_point is None:
             # Prune to VIS_N_POINTS points in total.
             graph_raw_edges = []
@@ -2225,9 +2616,7 @@ class WorkflowConfig:
             graph_raw_edges = (
                 [i for sublist in gr_edges.values() for i in sublist])
         if sort:
-            graph_raw_edges.sort(
-                key=lambda x: [y if y else '' for y in x[:2]]
-            )
+            graph_raw_edges.sort(key=lambda x: (x[0] or '', x[1] or ''))
         return graph_raw_edges
 
     def get_node_labels(self, start_point_str=None, stop_point_str=None):
@@ -2244,56 +2633,6 @@ class WorkflowConfig:
                 ret.add(right)
         return ret
 
-    @staticmethod
-    def _close_families(l_id, r_id, clf_map):
-        """Turn (name, point) to 'name.point' for edge.
-
-        Replace close family members with family nodes if relevant.
-        """
-        lret = None
-        lname, lpoint = None, None
-        if l_id:
-            lname, lpoint = l_id
-            lret = Tokens(
-                cycle=str(lpoint),
-                task=lname,
-            ).relative_id
-        rret = None
-        rname, rpoint = None, None
-        if r_id:
-            rname, rpoint = r_id
-            rret = Tokens(
-                cycle=str(rpoint),
-                task=rname,
-            ).relative_id
-
-        for fam_name, fam_members in clf_map.items():
-            if lname in fam_members and rname in fam_members:
-                # l and r are both members
-                lret = Tokens(
-                    cycle=str(lpoint),
-                    task=fam_name,
-                ).relative_id
-                rret = Tokens(
-                    cycle=str(rpoint),
-                    task=fam_name,
-                ).relative_id
-                break
-            elif lname in fam_members:
-                # l is a member
-                lret = Tokens(
-                    cycle=str(lpoint),
-                    task=fam_name,
-                ).relative_id
-            elif rname in fam_members:
-                # r is a member
-                rret = Tokens(
-                    cycle=str(rpoint),
-                    task=fam_name,
-                ).relative_id
-
-        return lret, rret
-
     def load_graph(self):
         """Parse and load dependency graph."""
         LOG.debug("Parsing the dependency graph")
@@ -2346,34 +2685,39 @@ class WorkflowConfig:
         # Parse and process each graph section.
         task_triggers = {}
         task_output_opt = {}
-        for section, graph in sections:
-            try:
-                seq = get_sequence(section, icp, fcp)
-            except (AttributeError, TypeError, ValueError, CylcError) as exc:
-                if cylc.flow.flags.verbosity > 1:
-                    traceback.print_exc()
-                msg = 'Cannot process recurrence %s' % section
-                msg += ' (initial cycle point=%s)' % icp
-                msg += ' (final cycle point=%s)' % fcp
-                if isinstance(exc, CylcError):
-                    msg += ' %s' % exc.args[0]
-                raise WorkflowConfigError(msg) from None
-            self.sequences.append(seq)
-            parser = GraphParser(
-                family_map,
-                self.parameters,
-                task_output_opt=task_output_opt,
-                expire_triggers=self.experimental.expire_triggers,
-            )
-            parser.parse_graph(graph)
-            task_output_opt.update(parser.task_output_opt)
-            self.workflow_polling_tasks.update(
-                parser.workflow_state_polling_tasks)
-            self._proc_triggers(parser, seq, task_triggers)
-
-            # Checking for undefined outputs for terminal tasks. Tasks with
-            # dependencies are checked in generate_triggers:
-            self.check_terminal_outputs(parser.terminals)
+        graphs = [graph for _, graph in sections]
+        parsers = parse_graphs(
+            graphs,
+            family_map,
+            self.parameters,
+            task_output_opt=task_output_opt,
+            expire_triggers=self.experimental.expire_triggers,
+            processes=self._get_graph_processes(graphs),
+        )
+        with closing(parsers):
+            for section, _graph in sections:
+                try:
+                    seq = get_sequence(section, icp, fcp)
+                except (
+                    AttributeError, TypeError, ValueError, CylcError
+                ) as exc:
+                    if cylc.flow.flags.verbosity > 1:
+                        traceback.print_exc()
+                    msg = 'Cannot process recurrence %s' % section
+                    msg += ' (initial cycle point=%s)' % icp
+                    msg += ' (final cycle point=%s)' % fcp
+                    if isinstance(exc, CylcError):
+                        msg += ' %s' % exc.args[0]
+                    raise WorkflowConfigError(msg) from None
+                self.sequences.append(seq)
+                parser = next(parsers)
+                self.workflow_polling_tasks.update(
+                    parser.workflow_state_polling_tasks)
+                self._proc_triggers(parser, seq, task_triggers)
+
+                # Checking for undefined outputs for terminal tasks. Tasks
+                # with dependencies are checked in generate_triggers:
+                self.check_terminal_outputs(parser.terminals)
 
         # set of all cycling intervals containined within the workflow
         cycling_intervals = {
@@ -2450,6 +2794,41 @@ class WorkflowConfig:
                     f"Undefined custom output: {task}:{output}"
                 )
 
+    def _get_graph_processes(self, graphs: List[str]) -> int:
+        """Return the number of processes to parse graph sections with.
+
+        Graph sections are parsed in parallel if there are more than
+        PARALLEL_GRAPH_LINES graph lines after parameter expansion (estimated
+        from the number of values of the parameters each line uses).
+        """
+        if len(graphs) < 2:
+            return 1
+        param_values = self.parameters[0]
+        lines = 0
+        for graph in graphs:
+            for line in graph.splitlines():
+                expansions = 1
+                for name in {
+                    match.group(1)
+                    for params in RE_GRAPH_PARAMS.findall(line)
+                    for match in map(
+                        RE_GRAPH_PARAM_NAME.match, params.split(',')
+                    )
+                    # (ignore specific values, e.g. "<m=1>")
+                    if match and not match.group(2)
+                }:
+                    expansions *= len(param_values.get(name) or [None])
+                lines += expansions
+        if lines <= self.PARALLEL_GRAPH_LINES:
+            return 1
+        try:
+            # (the CPUs this process can use)
+            cpus = len(os.sched_getaffinity(0))
+        except AttributeError:
+            # (not available on all platforms)
+            cpus = os.cpu_count() or 1
+        return min(cpus, len(graphs))
+
     def _proc_triggers(self, parser, seq, task_triggers):
         """Define graph edges, taskdefs, and triggers, from graph sections."""
         suicides = 0
@@ -2559,9 +2938,11 @@ class WorkflowConfig:
                 self.implicit_tasks.add(name)
                 # These can't just be a reference to root runtime as we have to
                 # make some items task-specific: e.g. subst task name in URLs.
-                self.cfg['runtime'][name] = OrderedDictWithDefaults()
-                replicate(self.cfg['runtime'][name],
-                          self.cfg['runtime']['root'])
+                # (Sections are shared with root, as for explicit tasks which
+                # don't override them, see compute_inheritance.)
+                self.cfg['runtime'][name] = replicate_shared(
+                    self.cfg['runtime']['root'], []
+                )
                 if 'root' not in self.runtime['descendants']:
                     # (happens when no runtimes are defined in flow.cylc)
                     self.runtime['descendants']['root'] = set()
@@ -2734,6 +3115,10 @@ class WorkflowConfig:
         self.cfg['meta']['URL'] = RE_WORKFLOW_ID_VAR.sub(
             self.workflow, self.cfg['meta']['URL'])
         for name, cfg in self.cfg['runtime'].items():
+            if not cfg['meta']['URL']:
+                continue
+            # (the meta section may be shared with other namespaces)
+            cfg['meta'] = copy(cfg['meta'])
             try:
                 cfg['meta']['URL'] = cfg['meta']['URL'] % {
                     'workflow': self.workflow,
@@ -0,0 +1,134 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Snapshots of the fully built workflow configuration.
+
+Building a WorkflowConfig (expanding parameters, computing inheritance,
+parsing the graph, etc) can take a long time for large workflows. The
+scheduler saves the built configuration to a snapshot file in the run
+directory so that it can be loaded, rather than built, when the workflow is
+restarted or reloaded without changes.
+
+A snapshot is keyed by a hash of the inputs to the build:
+
+* The processed workflow configuration (i.e. after templating, include-files
+  and line continuation).
+* The template variables and command line options.
+* The global configuration.
+* The workflow ID and directories.
+* The Cylc and Python versions.
+
+Snapshots are only used if the key matches, otherwise the configuration is
+built as normal (and the snapshot replaced).
+"""
+
+from contextlib import suppress
+from hashlib import sha256
+import os
+import pickle  # nosec
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Mapping, Optional
+
+from metomi.isodatetime.timezone import get_local_time_zone_format
+
+from cylc.flow import LOG, __version__
+from cylc.flow.cfgspec.glbl_cfg import glbl_cfg
+import cylc.flow.flags
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+# change this to invalidate existing snapshots
+SNAPSHOT_VERSION = 1
+
+
+def get_key(
+    lines: Iterable[str],
+    template_vars: Optional[Mapping[str, Any]],
+    options: Mapping[str, Any],
+    **context: Any,
+) -> str:
+    """Return the snapshot key for a workflow configuration.
+
+    Args:
+        lines:
+            The processed workflow configuration.
+        template_vars:
+            The template variables.
+        options:
+            The command line options.
+        context:
+            Anything else which the configuration depends on (e.g. the
+            workflow ID and directories).
+
+    """
+    hasher = sha256()
+
+    def update(value: Any) -> None:
+        hasher.update(repr(value).encode())
+        hasher.update(b'\0')
+
+    update(SNAPSHOT_VERSION)
+    update(__version__)
+    update(sys.version)
+    update(cylc.flow.flags.cylc7_back_compat)
+    update(get_local_time_zone_format())
+    update(glbl_cfg().get(sparse=True))
+    update(sorted((template_vars or {}).items()))
+    update(sorted(options.items()))
+    update(sorted(context.items()))
+    for line in lines:
+        hasher.update(line.encode())
+        hasher.update(b'\n')
+    return hasher.hexdigest()
+
+
+def load(path: 'Path', key: str) -> Optional[Dict[str, Any]]:
+    """Return the state stored in a snapshot.
+
+    Returns None if there is no snapshot or its key doesn't match.
+    """
+    try:
+        with open(path, 'rb') as snapshot:
+            if snapshot.readline().decode().strip() != key:
+                LOG.debug('Config snapshot out of date')
+                return None
+            # (the snapshot is written by the scheduler to the run dir)
+            return pickle.load(snapshot)  # nosec
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        # this is only a cache, fall back to building the config
+        LOG.debug(f'Could not load config snapshot: {exc!r}')
+        return None
+
+
+def dump(path: 'Path', key: str, state: Dict[str, Any]) -> None:
+    """Write a snapshot.
+
+    This is only a cache, failure to write it is not an error.
+    """
+    tmp = path.with_name(f'{path.name}.{os.getpid()}')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, 'wb') as snapshot:
+            snapshot.write(f'{key}\n'.encode())
+            pickle.dump(state, snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception as exc:
+        LOG.debug(f'Could not write config snapshot: {exc!r}')
+        with suppress(OSError):
+            tmp.unlink()
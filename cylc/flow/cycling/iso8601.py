@@ -416,6 +416,19 @@ class ISO8601Sequence(SequenceBase):
         if self.exclusions:
             self.value += '!' + str(self.exclusions)
 
+    def __getstate__(self):
+        # (the is_on_sequence cache can't be pickled)
+        return {
+            slot: getattr(self, slot)
+            for slot in self.__slots__
+            if slot != 'is_on_sequence'
+        }
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self.is_on_sequence = lru_cache(maxsize=100)(self._is_on_sequence)
+
     def get_interval(self):
         """Return the interval between points in this sequence."""
         return self.step
@@ -54,10 +54,7 @@ Packaging methods are included for dissemination of protobuf messages.
 
 """
 
-from collections import (
-    Counter,
-    deque,
-)
+from collections import Counter
 from contextlib import suppress
 from copy import deepcopy
 import json
@@ -66,11 +63,14 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Iterable,
     List,
     Literal,
+    NamedTuple,
     Optional,
     Set,
     Tuple,
+    Union,
 )
 import zlib
 
@@ -78,6 +78,7 @@ from cylc.flow import (
     LOG,
     __version__ as CYLC_VERSION,
 )
+from cylc.flow.cfgspec.glbl_cfg import glbl_cfg
 from cylc.flow.cycling.loader import get_point
 from cylc.flow.data_messages_pb2 import (
     AllDeltas,
@@ -91,6 +92,7 @@ from cylc.flow.data_messages_pb2 import (
     PbFamilyProxy,
     PbJob,
     PbLogRecord,
+    PbMeta,
     PbRuntime,
     PbTask,
     PbTaskProxy,
@@ -107,6 +109,7 @@ from cylc.flow.parsec.util import (
     pdeepcopy,
     poverride,
 )
+from cylc.flow.rundb import CylcWorkflowDAO
 from cylc.flow.run_modes import RunMode
 from cylc.flow.task_job_logs import (
     JOB_LOG_OPTS,
@@ -165,6 +168,12 @@ DELTA_UPDATED = 'updated'
 DELTA_PRUNED = 'pruned'
 LATEST_STATE_TASKS_QUEUE_SIZE = 5
 
+# Elapsed time quantiles of task definitions {field: quantile}
+ELAPSED_TIME_QUANTILES = {
+    'p50_elapsed_time': 0.5,
+    'p95_elapsed_time': 0.95,
+}
+
 MESSAGE_MAP = {
     EDGES: PbEdge,
     FAMILIES: PbFamily,
@@ -175,6 +184,17 @@ MESSAGE_MAP = {
     WORKFLOW: PbWorkflow,
 }
 
+# Node fields indexed for query filtering {element type: fields}
+INDEXED_FIELDS = {
+    FAMILY_PROXIES: (
+        'state', 'cycle_point', 'name', 'is_held', 'is_queued', 'is_runahead'
+    ),
+    JOBS: ('state', 'cycle_point', 'name'),
+    TASK_PROXIES: (
+        'state', 'cycle_point', 'name', 'is_held', 'is_queued', 'is_runahead'
+    ),
+}
+
 DATA_TEMPLATE = {
     EDGES: {},
     FAMILIES: {},
@@ -298,6 +318,17 @@ def setbuff(obj, key, value):
         setattr(obj, key, value)
 
 
+def set_meta(meta: PbMeta, meta_cfg) -> None:
+    """Set the metadata of a definition from its [meta] section."""
+    user_defined_meta = {}
+    for key, val in meta_cfg.items():
+        if key in ['title', 'description', 'URL']:
+            setbuff(meta, key, val)
+        else:
+            user_defined_meta[key] = val
+    meta.user_defined = json.dumps(user_defined_meta)
+
+
 def generate_checksum(in_strings):
     """Generate cross platform & python checksum from strings."""
     # can't use hash(), it's not the same across 32-64bit or python invocations
@@ -306,11 +337,28 @@ def generate_checksum(in_strings):
 
 def task_mean_elapsed_time(tdef: 'TaskDef') -> float | None:
     """Calculate task mean elapsed time."""
-    if tdef.elapsed_times:
-        return round(sum(tdef.elapsed_times) / len(tdef.elapsed_times))
+    mean = tdef.elapsed_times.mean()
+    if mean is not None:
+        return round(mean)
     return tdef.rtconfig.get('execution time limit', None)
 
 
+def set_task_elapsed_times(task: PbTask, tdef: 'TaskDef') -> bool:
+    """Set the elapsed time statistics of a task definition element.
+
+    Returns False if there are no statistics to set.
+    """
+    elapsed_time = task_mean_elapsed_time(tdef)
+    if not elapsed_time:
+        return False
+    task.mean_elapsed_time = elapsed_time
+    for field, quantile in ELAPSED_TIME_QUANTILES.items():
+        value = tdef.elapsed_times.quantile(quantile)
+        if value is not None:
+            setattr(task, field, round(value))
+    return True
+
+
 def runtime_from_config(rtconfig):
     """Populate runtime object from config."""
     try:
@@ -511,14 +559,129 @@ def apply_delta(key, delta, data):
                 with suppress(KeyError, ValueError):
                     getattr(data[WORKFLOW], key).edges.remove(del_id)
             elif key == JOBS:
-                # Jobs are only removed if their task is, so only need
-                # to remove relationship from workflow.
+                # Jobs are removed with their task, or evicted from it
+                # (see DataStoreMgr.max_jobs_per_task).
+                with suppress(KeyError, ValueError):
+                    data[TASK_PROXIES][
+                        data[key][del_id].task_proxy
+                    ].jobs.remove(del_id)
                 with suppress(KeyError, ValueError):
                     getattr(data[WORKFLOW], key).remove(del_id)
             # remove/prune element from data-store
             del data[key][del_id]
 
 
+def merge_update(key, element, new_element):
+    """Merge an updated element into a preceding update (in place).
+
+    Applying the merged update has the same effect as applying the two
+    updates in turn (see apply_delta).
+    """
+    if key == WORKFLOW and new_element.states_updated:
+        clear_fields = CLEAR_FIELD_MAP[key]
+    else:
+        clear_fields = {
+            field.name
+            for field, _ in new_element.ListFields()
+            if field.name in CLEAR_FIELD_MAP[key]
+        }
+    for field_name in clear_fields:
+        element.ClearField(field_name)
+    element.MergeFrom(new_element)
+
+
+def deltas_mergeable(key, delta, new_delta):
+    """Return True if a delta can be merged into the one which preceded it.
+
+    Deltas which re-add elements pruned by the preceding delta cannot be
+    merged, the prune must be applied first to clear the pruned element's
+    relationships.
+    """
+    if key == WORKFLOW or new_delta.reloaded or not delta.pruned:
+        return True
+    pruned = set(delta.pruned)
+    return not any(element.id in pruned for element in new_delta.added)
+
+
+def merge_deltas(key, delta, new_delta):
+    """Merge a delta into the one which preceded it (in place).
+
+    Applying the merged delta has the same effect as applying the two deltas
+    in turn (see apply_delta), provided they are mergeable (see
+    deltas_mergeable).
+
+    Args:
+        key: The data-store element type (e.g. TASK_PROXIES).
+        delta: The preceding delta (will be modified).
+        new_delta: The delta to merge into it.
+
+    """
+    if new_delta.reloaded:
+        # the new delta replaces the data-store elements of this type
+        delta.CopyFrom(new_delta)
+        return
+    if key == WORKFLOW:
+        if new_delta.added.ListFields():
+            # (replaces the workflow, preceding updates no longer apply)
+            delta.added.CopyFrom(new_delta.added)
+            delta.ClearField(DELTA_UPDATED)
+        if new_delta.HasField(DELTA_UPDATED):
+            merge_update(key, delta.updated, new_delta.updated)
+        if new_delta.HasField(DELTA_PRUNED):
+            delta.pruned = new_delta.pruned
+    else:
+        added = {element.id: element for element in delta.added}
+        updated = {element.id: element for element in delta.updated}
+        for element in new_delta.added:
+            # (replaces the element, preceding updates no longer apply)
+            added[element.id] = element
+            updated.pop(element.id, None)
+        for element in new_delta.updated:
+            if element.id in updated:
+                merge_update(key, updated[element.id], element)
+            else:
+                updated[element.id] = element
+        # Note: elements added then pruned must remain in both "added" and
+        # "pruned", pruning clears up their relationships.
+        pruned = set(delta.pruned)
+        new_pruned = [
+            element_id
+            for element_id in new_delta.pruned
+            if element_id not in pruned
+        ]
+        delta.ClearField(DELTA_ADDED)
+        delta.added.extend(added.values())
+        delta.ClearField(DELTA_UPDATED)
+        delta.updated.extend(updated.values())
+        delta.pruned.extend(new_pruned)
+        delta.checksum = new_delta.checksum
+    delta.time = new_delta.time
+
+
+def get_publish_articles(deltas):
+    """Return the items to publish for a batch of deltas.
+
+    Args:
+        deltas: {element type: delta}
+
+    Returns:
+        [(topic, delta, serializer)] - one item for each element type with
+        changes, followed by all of the deltas under the "all" topic.
+
+    """
+    all_deltas = DELTAS_MAP[ALL_DELTAS]()
+    result = []
+    for key, delta in deltas.items():
+        if delta.ListFields():
+            result.append(
+                (key.encode('utf-8'), delta, 'SerializeToString'))
+            getattr(all_deltas, key).CopyFrom(delta)
+    result.append(
+        (ALL_DELTAS.encode('utf-8'), all_deltas, 'SerializeToString')
+    )
+    return result
+
+
 def create_delta_store(delta=None, workflow_id=None):
     """Create a mini data-store out of the all deltas message.
 
@@ -563,6 +726,116 @@ def create_delta_store(delta=None, workflow_id=None):
     return delta_store
 
 
+class GraphRelation(NamedTuple):
+    """A graph child or parent of an n-window node."""
+
+    node_id: str
+    """The task proxy ID of the related node."""
+    tokens: Tokens
+    point: 'PointBase'
+    edge_id: str
+    """The ID of the edge between the nodes."""
+
+
+class NodeIndex:
+    """Secondary indexes of data-store nodes by field value.
+
+    Maps ``{field: {value: {node ID: sequence number}}}`` for the fields
+    listed in ``INDEXED_FIELDS`` so that queries filtering on these fields
+    can look up matching nodes without scanning the whole store.
+
+    The sequence number records the order in which nodes were added to the
+    store, so that lookups can be returned in store order.
+
+    Examples:
+        >>> index = NodeIndex(('state', 'name'))
+        >>> index.add(PbTaskProxy(id='a', state='waiting', name='foo'))
+        >>> index.add(PbTaskProxy(id='b', state='running', name='foo'))
+        >>> index.lookup('name', ['foo'])
+        {'a': 0, 'b': 1}
+        >>> index.lookup('state', ['running', 'failed'])
+        {'b': 1}
+        >>> index.discard('b')
+        1
+        >>> index.lookup('name', ['foo'])
+        {'a': 0}
+
+    """
+
+    def __init__(self, fields: Tuple[str, ...]):
+        self.fields = fields
+        self.index: Dict[str, Dict[Any, Dict[str, int]]] = {
+            field: {} for field in fields
+        }
+        # {node ID: (sequence number, indexed values)}
+        self.entries: Dict[str, Tuple[int, Tuple[Any, ...]]] = {}
+        self.counter = 0
+
+    def add(self, node) -> None:
+        """Index a node, (re)indexing it if it is already present."""
+        seq = self.discard(node.id)
+        if seq is None:
+            seq = self.counter
+            self.counter += 1
+        values = tuple(getattr(node, field) for field in self.fields)
+        self.entries[node.id] = (seq, values)
+        for field, value in zip(self.fields, values):
+            self.index[field].setdefault(value, {})[node.id] = seq
+
+    def discard(self, node_id: str) -> Optional[int]:
+        """Remove a node from the index.
+
+        Returns:
+            The sequence number of the node or None if it was not indexed.
+
+        """
+        try:
+            seq, values = self.entries.pop(node_id)
+        except KeyError:
+            return None
+        for field, value in zip(self.fields, values):
+            ids = self.index[field][value]
+            del ids[node_id]
+            if not ids:
+                del self.index[field][value]
+        return seq
+
+    def lookup(self, field: str, values) -> Dict[str, int]:
+        """Return the nodes with any of the given values of a field.
+
+        Returns:
+            {node ID: sequence number}
+
+        """
+        field_index = self.index[field]
+        if len(values) == 1:
+            return dict(field_index.get(values[0], {}))
+        ret: Dict[str, int] = {}
+        for value in values:
+            ret.update(field_index.get(value, {}))
+        return ret
+
+    def update(self, delta, elements: dict) -> None:
+        """Reindex the nodes touched by a delta once it has been applied.
+
+        Args:
+            delta:
+                The delta message which has been applied to the store.
+            elements:
+                The store elements of the delta's type by ID.
+
+        """
+        # (use a dict to retain the order in which elements were added)
+        touched = dict.fromkeys(element.id for element in delta.added)
+        touched.update(dict.fromkeys(element.id for element in delta.updated))
+        touched.update(dict.fromkeys(delta.pruned))
+        for node_id in touched:
+            if node_id in elements:
+                self.add(elements[node_id])
+            else:
+                self.discard(node_id)
+
+
 class DataStoreMgr:
     """Manage the workflow data store.
 
@@ -588,6 +861,9 @@ class DataStoreMgr:
             Local store of config.get_first_parent_descendants()
         .n_edge_distance (int):
             Maximum distance of the data-store graph from the active pool.
+        .node_indexes (dict):
+            NodeIndex of task proxies, family proxies and jobs in .data,
+            by element type.
         .parents (dict):
             Local store of config.get_parent_lists()
         .publish_deltas (list):
@@ -621,17 +897,34 @@ class DataStoreMgr:
         self.state_update_follow_on = False
         self.n_edge_distance = n_edge_distance
         self.next_n_edge_distance = None
-        self.latest_state_tasks = {
-            state: deque(maxlen=LATEST_STATE_TASKS_QUEUE_SIZE)
-            for state in TASK_STATUSES_ORDERED
+        # in-memory job history limits (< 1 for no limit)
+        data_store_cfg = glbl_cfg().get(['scheduler', 'data store'])
+        self.max_jobs_per_task: int = data_store_cfg['max jobs per task']
+        self.max_messages_per_job: int = (
+            data_store_cfg['max messages per job']
+        )
+        # only hold proxy runtimes which differ from the definition
+        self.compact_runtime: bool = data_store_cfg['compact runtime']
+        # task proxies with jobs evicted from memory
+        self.evicted_jobs_tasks: Set[str] = set()
+        # {state: {task identity: None}} in order of entering the state
+        self.latest_state_tasks: Dict[str, Dict[str, None]] = {
+            state: {} for state in TASK_STATUSES_ORDERED
         }
         self.xtrigger_tasks: Dict[str, Set[Tuple[str, str]]] = {}
         # Managed data types
         self.data = {
             self.workflow_id: deepcopy(DATA_TEMPLATE)
         }
+        # secondary indexes of self.data elements
+        self.node_indexes = {
+            key: NodeIndex(fields) for key, fields in INDEXED_FIELDS.items()
+        }
         self.added = deepcopy(DATA_TEMPLATE)
         self.updated = deepcopy(DATA_TEMPLATE)
+        # incremented whenever deltas are applied to the store
+        # (carried over on reload so that a version is never repeated)
+        self.data_version: int = getattr(self, 'data_version', 0) + 1
         self.deltas = {
             EDGES: EDeltas(),
             FAMILIES: FDeltas(),
@@ -651,6 +944,9 @@ class DataStoreMgr:
         self.n_window_edges = set()
         self.n_window_node_walks = {}
         self.n_window_completed_walks = set()
+        self.n_window_relations: Dict[
+            str, Dict[bool, List[GraphRelation]]
+        ] = {}
         self.n_window_depths = {}
         self.update_window_depths = False
         self.db_load_task_proxies: Dict[str, Tuple[TaskProxy, bool]] = {}
@@ -744,16 +1040,8 @@ class DataStoreMgr:
             )
             task.namespace[:] = tdef.namespace_hierarchy
             task.first_parent = self.definition_id(ancestors[name][1])
-            user_defined_meta = {}
-            for key, val in dict(tdef.describe()).items():
-                if key in ['title', 'description', 'URL']:
-                    setbuff(task.meta, key, val)
-                else:
-                    user_defined_meta[key] = val
-            task.meta.user_defined = json.dumps(user_defined_meta)
-            elapsed_time = task_mean_elapsed_time(tdef)
-            if elapsed_time:
-                task.mean_elapsed_time = elapsed_time
+            set_meta(task.meta, tdef.describe())
+            set_task_elapsed_times(task, tdef)
             task.parents.extend([
                 self.definition_id(p_name)
                 for p_name in parents[name]
@@ -779,13 +1067,7 @@ class DataStoreMgr:
                     depth=len(ancestors[name]) - 1,
                 )
                 famcfg = config.cfg['runtime'][name]
-                user_defined_meta = {}
-                for key, val in famcfg.get('meta', {}).items():
-                    if key in ['title', 'description', 'URL']:
-                        setbuff(family.meta, key, val)
-                    else:
-                        user_defined_meta[key] = val
-                family.meta.user_defined = json.dumps(user_defined_meta)
+                set_meta(family.meta, famcfg.get('meta', {}))
                 family.parents.extend(
                     self.definition_id(p_name)
                     for p_name in parents[name]
@@ -817,13 +1099,7 @@ class DataStoreMgr:
         workflow.host = self.schd.host
         workflow.port = self.schd.server.port or -1
         workflow.pub_port = self.schd.server.pub_port or -1
-        user_defined_meta = {}
-        for key, val in config.cfg['meta'].items():
-            if key in ['title', 'description', 'URL']:
-                setbuff(workflow.meta, key, val)
-            else:
-                user_defined_meta[key] = val
-        workflow.meta.user_defined = json.dumps(user_defined_meta)
+        set_meta(workflow.meta, config.cfg['meta'])
         workflow.tree_depth = max([
             len(val)
             for val in config.get_first_parent_ancestors(pruned=True).values()
@@ -850,6 +1126,70 @@ class DataStoreMgr:
         self.descendants = descendants
         self.parents = parents
 
+    def update_definition_elements(self, namespaces: Iterable[str]) -> None:
+        """Update the definitions of namespaces changed by a reload.
+
+        Updates the runtime and metadata of the task and family definitions
+        (and of their proxies which hold a runtime of their own) rather than
+        regenerating the data model (see initiate_data_model). This requires
+        the graph and namespace hierarchy to be unchanged (see
+        cylc.flow.config.ConfigChanges.runtime_only).
+
+        """
+        config = self.schd.config
+        data = self.data[self.workflow_id]
+        update_time = time()
+        names = set(namespaces)
+        for name in names:
+            if name in config.taskdefs:
+                def_type = TASKS
+                rtconfig = config.taskdefs[name].rtconfig
+                meta_cfg = config.taskdefs[name].describe()
+            else:
+                def_type = FAMILIES
+                rtconfig = config.cfg['runtime'][name]
+                meta_cfg = rtconfig.get('meta', {})
+            d_id = self.definition_id(name)
+            if d_id not in data[def_type] and d_id not in self.added[def_type]:
+                # (families which aren't first-parent ancestors of tasks)
+                continue
+            d_delta = self.updated[def_type].setdefault(
+                d_id, MESSAGE_MAP[def_type](id=d_id))
+            d_delta.stamp = f'{d_id}@{update_time}'
+            set_meta(d_delta.meta, meta_cfg)
+            d_delta.runtime.CopyFrom(runtime_from_config(rtconfig))
+
+        # update the proxies of these namespaces
+        for node_type in (TASK_PROXIES, FAMILY_PROXIES):
+            self._generate_broadcast_node_deltas(
+                {
+                    node_id: data[node_type][node_id]
+                    for node_id in self.node_indexes[node_type].lookup(
+                        'name', list(names)
+                    )
+                },
+                node_type
+            )
+            self._generate_broadcast_node_deltas(
+                {
+                    node_id: node
+                    for node_id, node in self.added[node_type].items()
+                    if node.name in names
+                },
+                node_type
+            )
+
+        w_delta = self.updated[WORKFLOW]
+        w_delta.id = self.workflow_id
+        w_delta.last_updated = update_time
+        w_delta.stamp = f'{w_delta.id}@{w_delta.last_updated}'
+        set_meta(w_delta.meta, config.cfg['meta'])
+
+        self.ancestors = config.get_first_parent_ancestors()
+        self.descendants = config.get_first_parent_descendants()
+        self.parents = config.get_parent_lists()
+        self.updates_pending = True
+
     def increment_graph_window(
         self,
         source_tokens: Tokens,
@@ -881,7 +1221,6 @@ class DataStoreMgr:
         active_id = source_tokens.id
         all_walks = self.n_window_node_walks
         taskdefs = self.schd.config.taskdefs
-        final_point = self.schd.config.final_point
 
         # walk keys/tags
         # Children location tag
@@ -990,8 +1329,6 @@ class DataStoreMgr:
 
         # Graph walk
         node_tokens: Tokens
-        child_tokens: Tokens
-        parent_tokens: Tokens
         walk_incomplete = True
         while walk_incomplete:
             walk_incomplete = False
@@ -1071,56 +1408,43 @@ class DataStoreMgr:
                     # Reference set for workflow relations
                     nc_ids = set()
                     if not c_done:
-                        if itask is not None and n_depth == 1:
-                            graph_children = itask.graph_children
-                        else:
-                            graph_children = generate_graph_children(
-                                tdef,
-                                get_point(node_tokens['cycle'])
+                        for child in self._get_graph_relations(
+                            node_tokens,
+                            tdef,
+                            itask=itask if n_depth == 1 else None,
+                        ):
+                            self.generate_ghost_task(
+                                child.tokens,
+                                child.point,
+                                False,
+                                None,
+                                n_depth
                             )
-                        for items in graph_children.values():
-                            for child_name, child_point, _ in items:
-                                if final_point and child_point > final_point:
-                                    continue
-                                child_tokens = self.id_.duplicate(
-                                    cycle=str(child_point),
-                                    task=child_name,
-                                )
-                                self.generate_ghost_task(
-                                    child_tokens,
-                                    child_point,
-                                    False,
-                                    None,
-                                    n_depth
-                                )
-                                self.generate_edge(node_tokens, child_tokens)
-                                nc_ids.add(child_tokens.id)
+                            self.generate_edge(
+                                node_tokens, child.tokens, child.edge_id
+                            )
+                            nc_ids.add(child.node_id)
 
                     # Parents/upstream nodes
                     np_ids = set()
                     if not p_done:
-                        for items in generate_graph_parents(
+                        for parent in self._get_graph_relations(
+                            node_tokens,
                             tdef,
-                            get_point(node_tokens['cycle']),
-                            taskdefs
-                        ).values():
-                            for parent_name, parent_point, _ in items:
-                                if final_point and parent_point > final_point:
-                                    continue
-                                parent_tokens = self.id_.duplicate(
-                                    cycle=str(parent_point),
-                                    task=parent_name,
-                                )
-                                self.generate_ghost_task(
-                                    parent_tokens,
-                                    parent_point,
-                                    True,
-                                    None,
-                                    n_depth
-                                )
-                                # reverse for parent
-                                self.generate_edge(parent_tokens, node_tokens)
-                                np_ids.add(parent_tokens.id)
+                            is_parent=True,
+                        ):
+                            self.generate_ghost_task(
+                                parent.tokens,
+                                parent.point,
+                                True,
+                                None,
+                                n_depth
+                            )
+                            # reverse for parent
+                            self.generate_edge(
+                                parent.tokens, node_tokens, parent.edge_id
+                            )
+                            np_ids.add(parent.node_id)
 
                     # Register new walk
                     if node_id not in all_walks:
@@ -1163,20 +1487,25 @@ class DataStoreMgr:
         # be on the boundary (otherwise they would've been in a walk).
         outer_nodes = active_walk['depths'].get(self.n_edge_distance, set())
         for outer_id in outer_nodes:
-            outer_tokens = Tokens(outer_id)
-            tdef = taskdefs[outer_tokens['task']]
-            graph_children = generate_graph_children(
-                tdef,
-                get_point(outer_tokens['cycle'])
-            )
-            for items in graph_children.values():
-                for child_name, child_point, _ in items:
-                    child_tokens = self.id_.duplicate(
-                        cycle=str(child_point),
-                        task=child_name,
+            # (the relations of most outer nodes are already known, avoid
+            # parsing their IDs unless needed)
+            outer_tokens: Optional[Tokens] = None
+            children = self.n_window_relations.get(outer_id, {}).get(False)
+            if children is None:
+                outer_tokens = Tokens(outer_id)
+                children = self._get_graph_relations(
+                    outer_tokens, taskdefs[outer_tokens['task']]
+                )
+            for child in children:
+                if (
+                    child.node_id in outer_nodes
+                    and child.edge_id not in self.n_window_edges
+                ):
+                    if outer_tokens is None:
+                        outer_tokens = Tokens(outer_id)
+                    self.generate_edge(
+                        outer_tokens, child.tokens, child.edge_id
                     )
-                    if child_tokens.id in outer_nodes:
-                        self.generate_edge(outer_tokens, child_tokens)
 
         # This part is vital to constructing a set of boundary nodes
         # associated with the n=0 window of current active node.
@@ -1225,14 +1554,79 @@ class DataStoreMgr:
                 self.prune_trigger_nodes[active_id])
             del self.prune_trigger_nodes[active_id]
 
+    def _get_graph_relations(
+        self,
+        node_tokens: Tokens,
+        tdef: 'TaskDef',
+        is_parent: bool = False,
+        itask: Optional['TaskProxy'] = None,
+    ) -> List[GraphRelation]:
+        """Return the graph children or parents of an n-window node.
+
+        Concrete relations (within the final cycle point) are resolved once
+        per node and reused for as long as the node remains in the window, as
+        overlapping walks of neighbouring active tasks, boundary edge
+        generation and window resizing all revisit the same nodes. The
+        relations carry their node and edge IDs, which are costly to
+        regenerate from tokens.
+
+        Args:
+            node_tokens: ID of the window node.
+            tdef: Task definition of the node.
+            is_parent: Return parents rather than children.
+            itask: Task proxy of the node (if active), whose graph children
+                have already been resolved.
+
+        Returns:
+            The related nodes.
+
+        """
+        node_relations = self.n_window_relations.setdefault(
+            node_tokens.id, {}
+        )
+        with suppress(KeyError):
+            return node_relations[is_parent]
+        point = get_point(node_tokens['cycle'])
+        if is_parent:
+            graph_rels = generate_graph_parents(
+                tdef, point, self.schd.config.taskdefs
+            )
+        elif itask is not None:
+            graph_rels = itask.graph_children
+        else:
+            graph_rels = generate_graph_children(tdef, point)
+        final_point = self.schd.config.final_point
+        relations = node_relations[is_parent] = []
+        for items in graph_rels.values():
+            for rel_name, rel_point, _ in items:
+                if final_point and rel_point > final_point:
+                    continue
+                rel_tokens = self.id_.duplicate(
+                    cycle=str(rel_point),
+                    task=rel_name,
+                )
+                relations.append(GraphRelation(
+                    rel_tokens.id,
+                    rel_tokens,
+                    rel_point,
+                    (
+                        self.edge_id(rel_tokens, node_tokens)
+                        if is_parent
+                        else self.edge_id(node_tokens, rel_tokens)
+                    ),
+                ))
+        return relations
+
     def generate_edge(
         self,
         parent_tokens: Tokens,
         child_tokens: Tokens,
+        e_id: Optional[str] = None,
     ) -> None:
         """Construct edge of child and parent task proxy node."""
         # Initiate edge element.
-        e_id = self.edge_id(parent_tokens, child_tokens)
+        if e_id is None:
+            e_id = self.edge_id(parent_tokens, child_tokens)
         if e_id in self.n_window_edges:
             return
         if (
@@ -1447,9 +1841,7 @@ class DataStoreMgr:
             else:
                 user_defined_meta[key] = val
         task.meta.user_defined = json.dumps(user_defined_meta)
-        elapsed_time = task_mean_elapsed_time(tdef)
-        if elapsed_time:
-            task.mean_elapsed_time = elapsed_time
+        set_task_elapsed_times(task, tdef)
         task.parents[:] = [task.first_parent]
 
         task.runtime.CopyFrom(runtime_from_config(tdef.rtconfig))
@@ -1513,14 +1905,12 @@ class DataStoreMgr:
             if fp_delta.ancestors:
                 fp_delta.first_parent = fp_delta.ancestors[0]
 
-            fp_delta.runtime.CopyFrom(
-                runtime_from_config(
-                    self._apply_broadcasts_to_runtime(
-                        tokens,
-                        self.schd.config.cfg['runtime'][fam.name]
-                    )
-                )
+            runtime = self._proxy_runtime(
+                tokens,
+                self.schd.config.cfg['runtime'][fam.name]
             )
+            if runtime is not None:
+                fp_delta.runtime.CopyFrom(runtime)
 
             self.added[FAMILY_PROXIES][fp_id] = fp_delta
             fp_parent = fp_delta
@@ -1669,21 +2059,11 @@ class DataStoreMgr:
 
         self._set_task_xtrigger_modifiers(tproxy)
 
-        if tproxy.state in self.latest_state_tasks:
-            tp_ref = itask.identity
-            tp_queue = self.latest_state_tasks[tproxy.state]
-            if tp_ref in tp_queue:
-                tp_queue.remove(tp_ref)
-            self.latest_state_tasks[tproxy.state].appendleft(tp_ref)
-
-        tproxy.runtime.CopyFrom(
-            runtime_from_config(
-                self._apply_broadcasts_to_runtime(
-                    itask.tokens,
-                    itask.tdef.rtconfig
-                )
-            )
-        )
+        self._update_latest_state_tasks(tproxy.state, itask.identity)
+
+        runtime = self._proxy_runtime(itask.tokens, itask.tdef.rtconfig)
+        if runtime is not None:
+            tproxy.runtime.CopyFrom(runtime)
 
     def _apply_broadcasts_to_runtime(self, tokens, rtconfig):
         # Handle broadcasts
@@ -1693,6 +2073,45 @@ class DataStoreMgr:
             poverride(rtconfig, overrides, prepend=True)
         return rtconfig
 
+    def _proxy_runtime(self, tokens, rtconfig) -> Optional[PbRuntime]:
+        """Return the runtime of a new task or family proxy.
+
+        Returns None if the proxy should share its definition's runtime
+        (i.e. with compact runtime and no broadcasts).
+
+        """
+        if (
+            self.compact_runtime
+            and not self.schd.broadcast_mgr.get_broadcast(tokens)
+        ):
+            return None
+        return runtime_from_config(
+            self._apply_broadcasts_to_runtime(tokens, rtconfig)
+        )
+
+    def get_proxy_runtime(
+        self, node: Union[PbTaskProxy, PbFamilyProxy]
+    ) -> PbRuntime:
+        """Return the runtime of a task or family proxy.
+
+        Proxies without a runtime of their own (see compact runtime) share
+        that of their definition.
+
+        """
+        if node.HasField('runtime'):
+            return node.runtime
+        if isinstance(node, PbTaskProxy):
+            def_type, def_id = TASKS, node.task
+        else:
+            def_type, def_id = FAMILIES, node.family
+        definition = (
+            self.data[self.workflow_id][def_type].get(def_id)
+            or self.added[def_type].get(def_id)
+        )
+        if definition is None:
+            return PbRuntime()
+        return definition.runtime
+
     def insert_job(
         self,
         itask: 'TaskProxy',
@@ -1743,7 +2162,7 @@ class DataStoreMgr:
         # Not all fields are populated with some submit-failures,
         # so use task cfg as base.
         j_buf.runtime.CopyFrom(
-            runtime_from_partial(job_conf, tproxy.runtime)
+            runtime_from_partial(job_conf, self.get_proxy_runtime(tproxy))
         )
 
         # Add in log files.
@@ -1761,12 +2180,85 @@ class DataStoreMgr:
         )
         tp_delta.job_submits = sub_num
         tp_delta.jobs.append(j_id)
+        self._evict_jobs(tp_id, tproxy, tp_delta)
         self.updates_pending = True
 
-    def insert_db_job(self, row_idx, row):
-        """Load job element from DB post restart."""
-        if row_idx == 0:
-            LOG.info("LOADING job data")
+    def _evict_jobs(
+        self,
+        tp_id: str,
+        tproxy: PbTaskProxy,
+        tp_delta: PbTaskProxy,
+    ) -> None:
+        """Evict the oldest jobs of a task beyond the in-memory limit.
+
+        Evicted jobs remain in the workflow database, from which they are
+        served on request (see get_evicted_jobs).
+
+        Args:
+            tp_id: Task proxy ID.
+            tproxy: Task proxy (from the store or being added to it).
+            tp_delta: Pending task proxy update delta.
+
+        """
+        if self.max_jobs_per_task < 1:
+            return
+        job_ids = list(dict.fromkeys((*tproxy.jobs, *tp_delta.jobs)))
+        if len(job_ids) <= self.max_jobs_per_task:
+            return
+        job_ids.sort(key=lambda j_id: int(Tokens(j_id)['job']))
+        for j_id in job_ids[:-self.max_jobs_per_task]:
+            if j_id in self.added[JOBS]:
+                # not yet in the store, drop it before it gets there
+                del self.added[JOBS][j_id]
+                with suppress(ValueError):
+                    getattr(self.updated[WORKFLOW], JOBS).remove(j_id)
+            else:
+                self.deltas[JOBS].pruned.append(j_id)
+            self.updated[JOBS].pop(j_id, None)
+            with suppress(ValueError):
+                tp_delta.jobs.remove(j_id)
+        self.evicted_jobs_tasks.add(tp_id)
+
+    def get_evicted_jobs(self, tp_id: str) -> List[PbJob]:
+        """Return the jobs of a task evicted from memory.
+
+        These are loaded from the workflow database, so only contain the
+        information held there.
+
+        This may be called from the server thread (by the resolvers) so
+        reads via its own connection rather than the scheduler's.
+
+        Args:
+            tp_id: Task proxy ID.
+
+        """
+        if tp_id not in self.evicted_jobs_tasks:
+            return []
+        jobs = self.data[self.workflow_id][JOBS]
+        tp_tokens = Tokens(tp_id)
+        ret = []
+        with CylcWorkflowDAO(self.schd.workflow_db_mgr.pri_path) as dao:
+            rows = dao.select_jobs_for_datastore({tp_tokens.relative_id})
+        for row in rows:
+            try:
+                j_buf = self._job_from_db_row(row, tp_tokens)
+            except Exception:
+                LOG.exception(f'could not load job of {tp_id}')
+                continue
+            if j_buf is not None and j_buf.id not in jobs:
+                ret.append(j_buf)
+        return ret
+
+    def _job_from_db_row(
+        self,
+        row: tuple,
+        tp_tokens: Tokens,
+    ) -> Optional[PbJob]:
+        """Return a job element from a select_jobs_for_datastore row.
+
+        Returns None if the job status cannot be determined.
+
+        """
         (
             point_string,
             name,
@@ -1780,16 +2272,7 @@ class DataStoreMgr:
             job_id,
             platform_name
         ) = row
-        tp_tokens = self.id_.duplicate(
-            cycle=point_string,
-            task=name,
-        )
-        tproxy: Optional[PbTaskProxy]
-        tp_id, tproxy = self.store_node_fetcher(tp_tokens)
-        if not tproxy:
-            return
-        j_tokens = tp_tokens.duplicate(job=str(submit_num))
-        j_id = j_tokens.id
+        j_id = tp_tokens.duplicate(job=str(submit_num)).id
 
         if run_status is not None:
             if run_status == 0:
@@ -1804,28 +2287,45 @@ class DataStoreMgr:
             else:
                 status = TASK_STATUS_SUBMIT_FAILED
         else:
+            return None
+
+        j_buf = PbJob(
+            stamp=f'{j_id}@{time()}',
+            id=j_id,
+            submit_num=submit_num,
+            state=status,
+            task_proxy=tp_tokens.id,
+            submitted_time=time_submit,
+            started_time=time_run,
+            finished_time=time_run_exit,
+            job_runner_name=job_runner_name,
+            job_id=job_id,
+            platform=platform_name,
+            name=name,
+            cycle_point=point_string,
+        )
+        # Add in log files.
+        j_buf.job_log_dir = get_task_job_log(
+            self.schd.workflow, point_string, name, submit_num)
+        return j_buf
+
+    def insert_db_job(self, row_idx, row):
+        """Load job element from DB post restart."""
+        if row_idx == 0:
+            LOG.info("LOADING job data")
+        point_string, name, submit_num = row[:3]
+        tp_tokens = self.id_.duplicate(
+            cycle=point_string,
+            task=name,
+        )
+        tproxy: Optional[PbTaskProxy]
+        tp_id, tproxy = self.store_node_fetcher(tp_tokens)
+        if not tproxy:
             return
+        j_id = tp_tokens.duplicate(job=str(submit_num)).id
 
         try:
-            update_time = time()
-            j_buf = PbJob(
-                stamp=f'{j_id}@{update_time}',
-                id=j_id,
-                submit_num=submit_num,
-                state=status,
-                task_proxy=tp_id,
-                submitted_time=time_submit,
-                started_time=time_run,
-                finished_time=time_run_exit,
-                job_runner_name=job_runner_name,
-                job_id=job_id,
-                platform=platform_name,
-                name=name,
-                cycle_point=tproxy.cycle_point,
-            )
-            # Add in log files.
-            j_buf.job_log_dir = get_task_job_log(
-                self.schd.workflow, point_string, name, submit_num)
+            j_buf = self._job_from_db_row(row, tp_tokens)
         except WorkflowConfigError:
             LOG.exception((
                 'ignoring job %s from the workflow run database\n'
@@ -1834,17 +2334,20 @@ class DataStoreMgr:
         except Exception:
             LOG.exception('could not load job %s' % j_id)
         else:
+            if j_buf is None:
+                return
             self.added[JOBS][j_id] = j_buf
             getattr(self.updated[WORKFLOW], JOBS).append(j_id)
             tp_delta = self.updated[TASK_PROXIES].setdefault(
                 tp_id,
                 PbTaskProxy(
-                    stamp=f'{tp_id}@{update_time}',
+                    stamp=f'{tp_id}@{time()}',
                     id=tp_id,
                 )
             )
             tp_delta.job_submits = max((submit_num, tp_delta.job_submits))
             tp_delta.jobs.append(j_id)
+            self._evict_jobs(tp_id, tproxy, tp_delta)
             self.updates_pending = True
 
     def update_data_structure(self):
@@ -2026,6 +2529,8 @@ class DataStoreMgr:
                 del self.n_window_node_walks[tp_id]
             if tp_id in self.n_window_completed_walks:
                 self.n_window_completed_walks.remove(tp_id)
+            self.n_window_relations.pop(tp_id, None)
+            self.evicted_jobs_tasks.discard(tp_id)
             for xid in node.xtriggers:
                 with suppress(KeyError):
                     label, sig = xid.split('=', 1)
@@ -2335,7 +2840,10 @@ class DataStoreMgr:
             delta_set = True
 
             for state, tp_queue in self.latest_state_tasks.items():
-                w_delta.latest_state_tasks[state].task_proxies[:] = tp_queue
+                # most recent first
+                w_delta.latest_state_tasks[state].task_proxies[:] = list(
+                    reversed(tp_queue)
+                )
 
         # Set status & msg if changed.
         status = get_workflow_status(self.schd).value
@@ -2416,13 +2924,20 @@ class DataStoreMgr:
             if node.name not in rt_cfg:
                 continue
             tokens = Tokens(node_id)
+            if (
+                self.compact_runtime
+                and not node.HasField('runtime')
+                and not self.schd.broadcast_mgr.get_broadcast(tokens)
+            ):
+                # still sharing the definition runtime
+                continue
             new_runtime = runtime_from_config(
                 self._apply_broadcasts_to_runtime(tokens, rt_cfg[node.name])
             )
             new_sruntime = new_runtime.SerializeToString(
                 deterministic=True
             )
-            old_sruntime = node.runtime.SerializeToString(
+            old_sruntime = self.get_proxy_runtime(node).SerializeToString(
                 deterministic=True
             )
             if new_sruntime != old_sruntime:
@@ -2458,6 +2973,17 @@ class DataStoreMgr:
     # -----------
     # Task Deltas
     # -----------
+    def _update_latest_state_tasks(self, state: str, tp_ref: str) -> None:
+        """Record a task as the latest to enter a state."""
+        tp_queue = self.latest_state_tasks.get(state)
+        if tp_queue is None:
+            return
+        # (re)insert at the end, evicting the oldest if over size
+        tp_queue.pop(tp_ref, None)
+        tp_queue[tp_ref] = None
+        if len(tp_queue) > LATEST_STATE_TASKS_QUEUE_SIZE:
+            del tp_queue[next(iter(tp_queue))]
+
     def delta_task_state(self, itask: 'TaskProxy') -> None:
         """Create delta for change in task proxy state.
 
@@ -2492,21 +3018,12 @@ class DataStoreMgr:
             or tp_delta.state != itask.state.status
         ):
             tp_delta.state = itask.state.status
-            if tp_delta.state in self.latest_state_tasks:
-                tp_ref = itask.identity
-                tp_queue = self.latest_state_tasks[tp_delta.state]
-                if tp_ref in tp_queue:
-                    tp_queue.remove(tp_ref)
-                self.latest_state_tasks[tp_delta.state].appendleft(tp_ref)
-            # if state is final work out new task mean.
+            self._update_latest_state_tasks(tp_delta.state, itask.identity)
+            # if state is final work out new task elapsed time stats.
             if tp_delta.state in TASK_STATUSES_FINAL:
-                elapsed_time = task_mean_elapsed_time(itask.tdef)
-                if elapsed_time:
-                    t_id = self.definition_id(tproxy.name)
-                    t_delta = PbTask(
-                        stamp=f'{t_id}@{update_time}',
-                        mean_elapsed_time=elapsed_time
-                    )
+                t_id = self.definition_id(tproxy.name)
+                t_delta = PbTask(stamp=f'{t_id}@{update_time}')
+                if set_task_elapsed_times(t_delta, itask.tdef):
                     self.updated[TASKS].setdefault(
                         t_id,
                         PbTask(id=t_id)).MergeFrom(t_delta)
@@ -2840,6 +3357,8 @@ class DataStoreMgr:
         else:
             j_delta.messages[:] = job.messages
             j_delta.messages.append(msg)
+        if 0 < self.max_messages_per_job < len(j_delta.messages):
+            del j_delta.messages[:-self.max_messages_per_job]
         self.updates_pending = True
         return True
 
@@ -2957,6 +3476,9 @@ class DataStoreMgr:
         for key, delta in self.deltas.items():
             if delta.ListFields():
                 apply_delta(key, delta, data)
+                if key in self.node_indexes:
+                    self.node_indexes[key].update(delta, data[key])
+                self.data_version += 1
 
     def apply_delta_checksum(self):
         """Construct checksum on deltas for export."""
@@ -3018,18 +3540,8 @@ class DataStoreMgr:
 
     def get_publish_deltas(self):
         """Return deltas for publishing."""
-        all_deltas = DELTAS_MAP[ALL_DELTAS]()
-        result = []
-        for key, delta in self.deltas.items():
-            if delta.ListFields():
-                result.append(
-                    (key.encode('utf-8'), delta, 'SerializeToString'))
-                getattr(all_deltas, key).CopyFrom(delta)
-        result.append(
-            (ALL_DELTAS.encode('utf-8'), all_deltas, 'SerializeToString')
-        )
         self.publish_pending = True
-        return deepcopy(result)
+        return deepcopy(get_publish_articles(self.deltas))
 
     def get_data_elements(self, element_type):
         """Get elements of a given type in the form of a delta.
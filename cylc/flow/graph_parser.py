@@ -17,11 +17,16 @@
 
 import re
 import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 
 from typing import (
+    Any,
     Dict,
+    Iterator,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Union
@@ -302,6 +307,7 @@ class GraphParser:
         task_output_opt:
             Optional[Dict[Tuple[str, str], Tuple[bool, bool, bool]]] = None,
         expire_triggers: bool = False,
+        defer_output_opt: bool = False,
     ) -> None:
         """Initialize the graph string parser.
 
@@ -313,6 +319,9 @@ class GraphParser:
             task_output_opt:
                 {(name, output): (is-optional, is-opt-default, is-fixed)}
                 passed in to allow checking across multiple graph strings
+            defer_output_opt:
+                Record output optionality rather than setting and checking
+                it, use apply_output_opt to set and check it later.
 
         """
         self.family_map = family_map or {}
@@ -331,6 +340,11 @@ class GraphParser:
         else:
             self.task_output_opt = {}
 
+        # Deferred calls to _set_output_opt (see apply_output_opt).
+        self.output_opt_calls: Optional[List[Tuple[Any, ...]]] = (
+            [] if defer_output_opt else None
+        )
+
     def parse_graph(self, graph_string: str) -> None:
         """Parse the graph string for a single graph section.
 
@@ -467,19 +481,23 @@ class GraphParser:
             self._report_invalid_lines(bad_lines)
 
         # Expand parameterized lines (or detect undefined parameters).
-        line_set = set()
+        # The expanded lines are generated as they are processed, rather than
+        # held in memory.
         graph_expander = GraphExpander(self.parameters)
-        for line in full_lines:
-            if not self.__class__.REC_PARAMS.search(line):
-                line_set.add(line)
-                continue
-            for line_ in graph_expander.expand(line):
-                line_set.add(line_)
+        expanded_lines = (
+            expanded_line
+            for line in full_lines
+            for expanded_line in (
+                graph_expander.expand(line)
+                if self.__class__.REC_PARAMS.search(line)
+                else (line,)
+            )
+        )
 
         # Process chains of dependencies as pairs: left => right.
         # Parameterization can duplicate some dependencies, so use a set.
         pairs: Set[Tuple[Optional[str], str]] = set()
-        for line in line_set:
+        for line in expanded_lines:
             chain = []
             # "foo => bar => baz" becomes [foo, bar, baz]
             # "foo => bar_-32768 => baz" becomes [foo]
@@ -815,6 +833,12 @@ class GraphParser:
             fam_member: is this from an expanded family trigger?
 
         """
+        if self.output_opt_calls is not None:
+            self.output_opt_calls.append(
+                (name, output, optional, suicide, fam_member)
+            )
+            return
+
         if cylc.flow.flags.cylc7_back_compat:
             # Set all outputs optional (set :succeed required elsewhere).
             self.task_output_opt[(name, output)] = (True, True, True)
@@ -910,6 +934,24 @@ class GraphParser:
                 elif not optional or not opp_optional:
                     raise GraphParseError(msg)
 
+    def apply_output_opt(
+        self,
+        task_output_opt: Dict[Tuple[str, str], Tuple[bool, bool, bool]],
+    ) -> None:
+        """Set and check output optionality deferred by the parser.
+
+        Args:
+            task_output_opt:
+                {(name, output): (is-optional, is-opt-default, is-fixed)}
+                from previously parsed graph strings, updated in-place.
+
+        """
+        calls = self.output_opt_calls or []
+        self.output_opt_calls = None
+        self.task_output_opt = task_output_opt
+        for args in calls:
+            self._set_output_opt(*args)
+
     def _compute_triggers(
         self,
         orig_expr: str,
@@ -1009,3 +1051,94 @@ class GraphParser:
                         # Infer optionality for explicit outputs on RHS.
                         self._set_output_opt(
                             mem, output, optional, suicide, fam)
+
+
+# GraphParser args for parse_graphs worker processes
+_WORKER_ARGS: Tuple[Any, ...] = ()
+
+
+def _init_worker(*args: Any) -> None:
+    global _WORKER_ARGS
+    _WORKER_ARGS = args
+
+
+def _parse_graph(
+    graph: str
+) -> Tuple[GraphParser, Optional[Exception]]:
+    """Parse a graph string in a parse_graphs worker process."""
+    family_map, parameters, expire_triggers = _WORKER_ARGS
+    parser = GraphParser(
+        family_map,
+        parameters,
+        expire_triggers=expire_triggers,
+        defer_output_opt=True,
+    )
+    error = None
+    try:
+        parser.parse_graph(graph)
+    except Exception as exc:
+        # (raised after applying output optionality, see parse_graphs)
+        error = exc
+    # don't send these back
+    parser.family_map = {}
+    parser.parameters = None
+    return parser, error
+
+
+def parse_graphs(
+    graphs: Sequence[str],
+    family_map: Optional[Dict[str, List[str]]] = None,
+    parameters: Optional[Dict] = None,
+    task_output_opt:
+        Optional[Dict[Tuple[str, str], Tuple[bool, bool, bool]]] = None,
+    expire_triggers: bool = False,
+    processes: int = 1,
+) -> Iterator[GraphParser]:
+    """Parse graph strings, yielding a parser for each in order.
+
+    If "processes" is greater than one, the graph strings are parsed in
+    parallel by a pool of worker processes. Output optionality is still set
+    and checked in this process in order, so the results (and errors) are the
+    same as parsing the graph strings one after another.
+
+    Args:
+        graphs:
+            The graph strings to parse.
+        family_map, parameters, expire_triggers:
+            As for GraphParser.
+        task_output_opt:
+            As for GraphParser, this is updated with the output optionality
+            from each graph string.
+        processes:
+            The maximum number of worker processes.
+
+    """
+    if processes < 2 or len(graphs) < 2:
+        for graph in graphs:
+            parser = GraphParser(
+                family_map,
+                parameters,
+                task_output_opt=task_output_opt,
+                expire_triggers=expire_triggers,
+            )
+            parser.parse_graph(graph)
+            if task_output_opt is not None:
+                # (the parser only updates task_output_opt if not empty)
+                task_output_opt.update(parser.task_output_opt)
+            yield parser
+        return
+
+    with ProcessPoolExecutor(
+        min(processes, len(graphs)),
+        # (forking a multi-threaded process, e.g. the scheduler, is unsafe)
+        mp_context=get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(family_map, parameters, expire_triggers),
+    ) as executor:
+        for parser, error in executor.map(_parse_graph, graphs):
+            parser.apply_output_opt(
+                {} if task_output_opt is None else task_output_opt
+            )
+            if error:
+                raise error
+            yield parser
@@ -216,6 +216,9 @@ class JobFileWriter:
 
         handle.write("\n\n    # CYLC TASK ENVIRONMENT:")
         handle.write(f"\n    export CYLC_TASK_COMMS_METHOD={comm_meth}")
+        spool_dir = job_conf['platform'].get('message spool directory')
+        if spool_dir:
+            handle.write(f'\n    export CYLC_TASK_MESSAGE_SPOOL="{spool_dir}"')
         handle.write('\n    export CYLC_TASK_JOB="%s"' % job_conf['job_d'])
         handle.write(
             '\n    export CYLC_TASK_NAMESPACE_HIERARCHY="%s"' %
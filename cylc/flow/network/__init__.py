@@ -16,9 +16,12 @@
 """Package for network interfaces to Cylc scheduler objects."""
 
 import asyncio
+from functools import lru_cache
 import json
 from typing import (
     TYPE_CHECKING,
+    Iterator,
+    List,
     Optional,
     Tuple,
     TypedDict,
@@ -55,6 +58,10 @@ if TYPE_CHECKING:
 API = 5  # cylc API version
 MSG_TIMEOUT = "TIMEOUT"
 
+# server methods which respond with protobuf messages rather than JSON
+# (see cylc.flow.network.server.PB_METHOD_MAP)
+PB_METHODS = frozenset({'pb_entire_workflow', 'pb_data_elements'})
+
 if TYPE_CHECKING:
     class ResponseDict(TypedDict, total=False):
         """Structure of server response messages.
@@ -92,6 +99,14 @@ if TYPE_CHECKING:
         back-compat issues."""
 
 
+# Approximate size of the frames of chunked responses (characters)
+RESPONSE_CHUNK_SIZE = 1024 * 1024
+
+# Response encodings
+ENCODING_JSON = 'json'
+ENCODING_MSGPACK = 'msgpack'  # requires the (optional) msgpack library
+
+
 def serialize(data: object) -> str:
     """Convert the structure holding a message to a JSON message string."""
     # Abstract out the transport format in order to allow it to be changed
@@ -99,6 +114,39 @@ def serialize(data: object) -> str:
     return json.dumps(data)
 
 
+def serialize_chunks(
+    data: object, chunk_size: Optional[int] = None
+) -> Iterator[bytes]:
+    """Convert the structure holding a message to JSON message chunks.
+
+    Unlike "serialize", the message is encoded incrementally, so a large
+    message is never held as a single string and other threads (i.e. the
+    scheduler's main loop) are able to run while it is being encoded.
+
+    Joining the chunks gives the same message as "serialize".
+
+    Examples:
+        >>> list(serialize_chunks({'a': [1, 2]}))
+        [b'{"a": [1, 2]}']
+        >>> list(serialize_chunks({'a': [1, 2]}, chunk_size=5))
+        [b'{"a": ', b'[1, 2', b']}']
+
+    """
+    chunk_size = chunk_size or RESPONSE_CHUNK_SIZE
+    encoder = json.JSONEncoder()
+    buffer = []
+    size = 0
+    for fragment in encoder.iterencode(data):
+        buffer.append(fragment)
+        size += len(fragment)
+        if size >= chunk_size:
+            yield ''.join(buffer).encode()
+            buffer = []
+            size = 0
+    if buffer:
+        yield ''.join(buffer).encode()
+
+
 def deserialize(message: str) -> 'ResponseDict':
     """Convert a JSON message string to dict with an added 'user' field."""
     # Abstract out the transport format in order to allow it to be changed
@@ -106,6 +154,63 @@ def deserialize(message: str) -> 'ResponseDict':
     return json.loads(message)
 
 
+@lru_cache(maxsize=None)
+def get_response_encodings() -> List[str]:
+    """Return the response encodings supported here in order of preference.
+
+    Clients advertise these in the request "meta" so that the server can
+    choose a binary encoding if both ends support one, JSON is always
+    supported.
+    """
+    try:
+        import msgpack  # noqa: F401
+    except ModuleNotFoundError:
+        return [ENCODING_JSON]
+    return [ENCODING_MSGPACK, ENCODING_JSON]
+
+
+def select_response_encoding(client_encodings: Optional[List[str]]) -> str:
+    """Return the preferred encoding that the client also supports.
+
+    Examples:
+        >>> select_response_encoding(None)
+        'json'
+        >>> select_response_encoding(['cbor', 'json'])
+        'json'
+
+    """
+    for encoding in get_response_encodings():
+        if encoding in (client_encodings or ()):
+            return encoding
+    return ENCODING_JSON
+
+
+def encode_response(res: 'ResponseDict', encoding: str) -> bytes:
+    """Encode a response message in the given encoding."""
+    if encoding == ENCODING_MSGPACK:
+        import msgpack
+        return msgpack.packb(res)
+    return serialize(res).encode()
+
+
+def decode_response(response: bytes) -> 'ResponseDict':
+    """Decode a response message in any supported encoding.
+
+    Responses are always maps, the encoding is determined from the first
+    byte (a JSON object always starts with "{" which is not the start of a
+    MessagePack map).
+
+    Examples:
+        >>> decode_response(b'{"data": 1}')
+        {'data': 1}
+
+    """
+    if response[:1] == b'{':
+        return deserialize(response.decode())
+    import msgpack
+    return msgpack.unpackb(response)
+
+
 def get_location(workflow: str) -> Tuple[str, int, int, str]:
     """Extract host and port from a workflow's contact file.
 
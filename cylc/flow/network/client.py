@@ -20,6 +20,7 @@ from abc import (
     abstractmethod,
 )
 import asyncio
+from itertools import count
 import os
 from shutil import which
 import socket
@@ -40,6 +41,7 @@ from cylc.flow import (
     __version__ as CYLC_VERSION,
 )
 from cylc.flow.exceptions import (
+    ClientError,
     ClientTimeout,
     SchedulerAlive,
     CylcError,
@@ -48,13 +50,14 @@ from cylc.flow.exceptions import (
 )
 from cylc.flow.hostuserutil import get_fqdn_by_host
 from cylc.flow.network import (
+    PB_METHODS,
     ZMQSocketBase,
-    deserialize,
+    decode_response,
     get_location,
+    get_response_encodings,
     serialize,
 )
 from cylc.flow.network.client_factory import CommsMeth
-from cylc.flow.network.server import PB_METHOD_MAP
 from cylc.flow.workflow_files import detect_old_contact_file
 
 
@@ -129,6 +132,10 @@ class WorkflowRuntimeClientBase(metaclass=ABCMeta):
             command: The name of the endpoint to call.
             args: Arguments to pass to the endpoint function.
             timeout: Override the default timeout (seconds).
+            req_meta:
+                Additional request metadata, e.g.
+                ``{"chunked_response": True}`` to have a large response
+                sent in chunks.
 
         Raises:
             ClientTimeout: If a response takes longer than timeout to arrive.
@@ -196,11 +203,17 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
     # incompatible with definition in base class "WorkflowRuntimeClientBase"')
     """Initiate a client to the scheduler API.
 
-    Initiates the REQ part of a ZMQ REQ-REP pair.
+    Initiates the client part of a ZMQ REQ-REP pair.
 
     This class contains the logic for the ZMQ message interface and client -
     server communication.
 
+    A DEALER socket is used in place of REQ, so several requests may be in
+    flight at once (e.g. ``asyncio.gather``-ed ``async_request`` calls).
+    Each request is tagged with an ID which the server returns with the
+    response (as part of the message envelope), so responses can be matched
+    to requests and late responses to timed out requests discarded.
+
     Determine host and port from the contact file unless provided.
 
     If there is no socket bound to the specified host/port the client will
@@ -272,7 +285,7 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
         context: Optional[zmq.asyncio.Context] = None,
         srv_public_key_loc: Optional[str] = None
     ):
-        ZMQSocketBase.__init__(self, zmq.REQ, workflow, context=context)
+        ZMQSocketBase.__init__(self, zmq.DEALER, workflow, context=context)
         WorkflowRuntimeClientBase.__init__(
             self,
             workflow,
@@ -283,7 +296,10 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
         )
         # convert to milliseconds:
         self.timeout *= 1000
-        self.poller: Any = None
+        self._request_ids = count()
+        # in flight requests {request ID: response future}
+        self._pending: Dict[bytes, asyncio.Future] = {}
+        self._receiver: Optional[asyncio.Task] = None
         # Connect the ZMQ socket on instantiation
         self.start(self.host, self.port, srv_public_key_loc)
         # gather header info post start
@@ -298,9 +314,46 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
         # if there is no server don't keep the client hanging around
         self.socket.setsockopt(zmq.LINGER, int(self.DEFAULT_TIMEOUT))
 
-        # create a poller to handle timeouts
-        self.poller = zmq.Poller()
-        self.poller.register(self.socket, zmq.POLLIN)
+    def _bespoke_stop(self) -> None:
+        """Stop receiving responses.
+
+        Overwrites Base method.
+
+        """
+        super()._bespoke_stop()
+        if self._receiver:
+            self._receiver.cancel()
+            self._receiver = None
+
+    async def _receive(self) -> None:
+        """Receive responses and pass them to the requests awaiting them.
+
+        Runs while there are requests in flight.
+        """
+        while self._pending:
+            try:
+                frames = await self.socket.recv_multipart()
+            except zmq.ZMQError as exc:
+                # fail all in flight requests
+                for future in self._pending.values():
+                    if not future.done():
+                        future.set_exception(ClientError(str(exc)))
+                self._pending.clear()
+                return
+            try:
+                req_id, _delimiter, *chunks = frames
+            except ValueError:
+                chunks = []
+            if not chunks:
+                LOG.warning(f'zmq:recv malformed response {frames}')
+                continue
+            future = self._pending.pop(req_id, None)
+            if future is None or future.done():
+                # response to a request which has timed out
+                LOG.debug('zmq:recv discarding response %s', chunks)
+                continue
+            # (chunked responses are split over several frames)
+            future.set_result(b''.join(chunks))
 
     async def async_request(
         self,
@@ -327,16 +380,27 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
         msg: Dict[str, Any] = {'command': command, 'args': args}
         msg.update(self.header)
         # add the request metadata
+        # (copy to avoid modifying the header for subsequent requests)
         if req_meta:
-            msg['meta'].update(req_meta)
+            msg['meta'] = {**msg['meta'], **req_meta}
         LOG.debug('zmq:send %s', msg)
         message = serialize(msg)
-        self.socket.send_string(message)
+        req_id = next(self._request_ids).to_bytes(8, 'big')
+        loop = asyncio.get_running_loop()
+        future = self._pending[req_id] = loop.create_future()
+        # (the empty frame delimits the envelope which the server returns)
+        await self.socket.send_multipart([req_id, b'', message.encode()])
+        if (
+            self._receiver is None
+            or self._receiver.done()
+            or self._receiver.get_loop() is not loop
+        ):
+            self._receiver = loop.create_task(self._receive())
 
         # receive response
-        if self.poller.poll(timeout):
-            res: bytes = await self.socket.recv()
-        else:
+        try:
+            res: bytes = await asyncio.wait_for(future, timeout / 1000)
+        except asyncio.TimeoutError:
             self.timeout_handler()
             raise ClientTimeout(
                 'Timeout waiting for server response.'
@@ -344,13 +408,20 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
                 '\n* You might want to increase the timeout using the'
                 ' --comms-timeout option;'
                 '\n* or check the workflow log.'
-            )
+            ) from None
+        finally:
+            # (the request may also have been cancelled by the caller)
+            self._pending.pop(req_id, None)
+            if not self._pending and self._receiver:
+                # don't leave a receive hanging on the socket
+                self._receiver.cancel()
+                self._receiver = None
         LOG.debug('zmq:recv %s', res)
 
-        if command in PB_METHOD_MAP:
+        if command in PB_METHODS:
             return res
 
-        response: ResponseDict = deserialize(res.decode())
+        response: ResponseDict = decode_response(res)
 
         try:
             return response['data']
@@ -398,6 +469,8 @@ class WorkflowRuntimeClient(  # type: ignore[misc]
                     os.getenv(
                         "CLIENT_COMMS_METH",
                         default=CommsMeth.ZMQ.value
-                    )
+                    ),
+                # response encodings this client can decode
+                'encodings': get_response_encodings(),
             }
         }
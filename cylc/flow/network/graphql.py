@@ -19,18 +19,27 @@ GraphQL Middleware defined here also.
 
 """
 
+from functools import lru_cache
 from inspect import isclass
 import logging
 from typing import (
-    Any, Awaitable, Callable, TypeVar, Tuple, Dict, Union, cast
+    Any, Awaitable, Callable, TypeVar, Tuple, Dict, List, Optional, Union,
+    cast
 )
 
 from graphene.utils.str_converters import to_snake_case
 from graphql import (
+    DocumentNode,
     ExecutionContext,
+    GraphQLError,
+    GraphQLSchema,
+    OperationType,
     TypeInfo,
     TypeInfoVisitor,
     Visitor,
+    get_operation_ast,
+    parse,
+    validate,
     visit,
     get_named_type,
     is_introspection_type,
@@ -50,6 +59,9 @@ STRIP_OPS = {'query', 'subscription'}
 
 U = TypeVar("U")
 
+# The number of parsed and validated request documents to cache.
+DOCUMENT_CACHE_SIZE = 256
+
 
 def grow_tree(tree, path, leaves=None):
     """Additively grows tree with leaves at terminal of new branch.
@@ -77,6 +89,48 @@ def grow_tree(tree, path, leaves=None):
         tree_loc[len(path) % 2].update({'leaves': leaves})
 
 
+@lru_cache(maxsize=DOCUMENT_CACHE_SIZE)
+def parse_and_validate(
+    schema: GraphQLSchema, request_string: str
+) -> Tuple[Optional[DocumentNode], List[GraphQLError]]:
+    """Parse and validate a GraphQL request against the schema.
+
+    Clients send the same few requests over and over, so the results are
+    cached (by request string).
+
+    Returns:
+        (document, errors) - the document is None if the request could not
+        be parsed.
+
+    """
+    try:
+        document = parse(request_string)
+    except GraphQLError as error:
+        return None, [error]
+    return document, validate(schema, document)
+
+
+def is_query(
+    document: DocumentNode, operation_name: Optional[str] = None
+) -> bool:
+    """Return True if the operation is a query.
+
+    Examples:
+        >>> is_query(parse('query { workflows { id } }'))
+        True
+        >>> is_query(parse('{ workflows { id } }'))
+        True
+        >>> is_query(parse('mutation { pause(workflows: []) { result } }'))
+        False
+
+    """
+    operation = get_operation_ast(document, operation_name)
+    return (
+        operation is not None
+        and operation.operation == OperationType.QUERY
+    )
+
+
 def instantiate_middleware(middlewares):
     """Take iterable of middlewares and instantiate.
 
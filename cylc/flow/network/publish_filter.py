@@ -0,0 +1,301 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Server-side filters for published data-store deltas.
+
+Subscribers which only need part of the data-store (e.g. only the workflow
+state totals, or only the tasks of a single cycle point) can register a filter
+with the scheduler. The scheduler then publishes, alongside the regular delta
+topics, an ``AllDeltas`` message per filter containing only the matching
+elements (and fields) under a topic derived from the filter.
+
+Identical filters share the same topic, so many subscribers with the same
+requirements cost no more to serve than one.
+
+Registrations are leases, subscribers must renew them (by registering the
+filter again) within ``FILTER_TTL`` seconds or the filter is dropped.
+
+Note:
+    Filtered deltas do not carry checksums, as these are calculated over the
+    entire data-store.
+
+"""
+
+from contextlib import suppress
+from fnmatch import fnmatchcase
+from hashlib import sha256
+import json
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from cylc.flow.cycling.loader import get_point
+from cylc.flow.data_store_mgr import (
+    ALL_DELTAS,
+    DELTAS_MAP,
+    EDGES,
+    FAMILIES,
+    TASKS,
+    WORKFLOW,
+)
+from cylc.flow.exceptions import (
+    InputError,
+    PointParsingError,
+)
+from cylc.flow.id import Tokens
+
+
+if TYPE_CHECKING:
+    from google.protobuf.message import Message
+
+    from cylc.flow.cycling import PointBase
+
+
+# Prefix of the topics filtered deltas are published under.
+# (Must not be a prefix of any of the regular topics.)
+FILTER_TOPIC_PREFIX = 'filter|'
+
+# Element types which can be filtered.
+ELEMENT_TYPES = frozenset(DELTAS_MAP) - {ALL_DELTAS}
+
+# Fields always retained by the field mask.
+MASK_REQUIRED_FIELDS = frozenset({'id', 'stamp'})
+
+# Cap the cycle point match cache (points are few, but not bounded).
+MAX_POINT_CACHE_SIZE = 1000
+
+# Filters expire unless re-registered within this time (seconds).
+# (So the filters of subscribers which die without deregistering get dropped.)
+FILTER_TTL = 300.0
+
+# The maximum number of (distinct) filters a scheduler will publish.
+MAX_FILTERS = 100
+
+
+def is_filter_topic(topic: str) -> bool:
+    """Return True if the topic is that of a filtered delta.
+
+    Examples:
+        >>> is_filter_topic('filter|0123456789abcdef')
+        True
+        >>> is_filter_topic('family_proxies')
+        False
+
+    """
+    return topic.startswith(FILTER_TOPIC_PREFIX)
+
+
+def element_cycles_and_names(
+    element_type: str, id_: str
+) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Return the cycle point(s) and name(s) a data-store element refers to.
+
+    Definitions (tasks and families) have no cycle point, edges refer to both
+    their source and target nodes.
+
+    Examples:
+        >>> element_cycles_and_names('task_proxies', '~u/w//1/foo')
+        [('1', 'foo')]
+        >>> element_cycles_and_names('jobs', '~u/w//1/foo/01')
+        [('1', 'foo')]
+        >>> element_cycles_and_names('tasks', '~u/w//$namespace|foo')
+        [(None, 'foo')]
+        >>> element_cycles_and_names('edges', '~u/w//$edge|1/foo|2/bar')
+        [('1', 'foo'), ('2', 'bar')]
+        >>> element_cycles_and_names('workflow', '~u/w')
+        []
+
+    """
+    if element_type == WORKFLOW:
+        return []
+    if element_type in {TASKS, FAMILIES, EDGES}:
+        # the relative part of the ID is of the form "$<kind>|<refs>"
+        refs = id_.rsplit('//', 1)[-1].split('|')[1:]
+        if element_type != EDGES:
+            return [(None, ref) for ref in refs]
+        ret: List[Tuple[Optional[str], Optional[str]]] = []
+        for relative_id in refs:
+            tokens = Tokens(relative_id, relative=True)
+            ret.append((tokens['cycle'], tokens['task']))
+        return ret
+    tokens = Tokens(id_)
+    return [(tokens['cycle'], tokens['task'])]
+
+
+class PublishFilter:
+    """A filter on the published data-store deltas.
+
+    Args:
+        element_types:
+            Data-store element types to include (e.g. ``task_proxies``),
+            all types if not specified.
+        min_point:
+            Exclude cycle point elements before this point.
+        max_point:
+            Exclude cycle point elements after this point.
+        names:
+            Only include elements with a name matching any of these globs.
+        fields:
+            Only include these fields of each element (``id`` and ``stamp``
+            are always included).
+
+    Raises:
+        InputError: If the filter is invalid.
+
+    """
+
+    def __init__(
+        self,
+        element_types: Optional[Iterable[str]] = None,
+        min_point: Optional[str] = None,
+        max_point: Optional[str] = None,
+        names: Optional[Iterable[str]] = None,
+        fields: Optional[Iterable[str]] = None,
+    ):
+        self.element_types: FrozenSet[str] = frozenset(
+            element_types or ELEMENT_TYPES
+        )
+        bad_types = self.element_types - ELEMENT_TYPES
+        if bad_types:
+            raise InputError(
+                'Invalid element type(s) for publish filter: '
+                + ', '.join(sorted(bad_types))
+            )
+        self.min_point: 'Optional[PointBase]' = self._parse_point(min_point)
+        self.max_point: 'Optional[PointBase]' = self._parse_point(max_point)
+        self.names: FrozenSet[str] = frozenset(names or ())
+        self.fields: FrozenSet[str] = frozenset(fields or ())
+        if self.fields:
+            self.fields |= MASK_REQUIRED_FIELDS
+        self._point_cache: Dict[str, bool] = {}
+        self.topic: str = FILTER_TOPIC_PREFIX + sha256(
+            json.dumps(self.spec(), sort_keys=True).encode()
+        ).hexdigest()[:16]
+
+    @staticmethod
+    def _parse_point(value: Optional[str]) -> 'Optional[PointBase]':
+        if value is None:
+            return None
+        try:
+            return get_point(value).standardise()
+        except (PointParsingError, ValueError, TypeError) as exc:
+            raise InputError(
+                f'Invalid cycle point for publish filter: {value}'
+            ) from exc
+
+    def spec(self) -> dict:
+        """Return the filter in its normalised (JSON compatible) form."""
+        return {
+            'element_types': sorted(self.element_types),
+            'min_point': self.min_point and str(self.min_point),
+            'max_point': self.max_point and str(self.max_point),
+            'names': sorted(self.names),
+            'fields': sorted(self.fields),
+        }
+
+    def _point_match(self, cycle: str) -> bool:
+        with suppress(KeyError):
+            return self._point_cache[cycle]
+        try:
+            point = get_point(cycle).standardise()
+        except (PointParsingError, ValueError, TypeError):
+            ret = False
+        else:
+            ret = not (
+                (self.min_point is not None and point < self.min_point)
+                or (self.max_point is not None and point > self.max_point)
+            )
+        if len(self._point_cache) >= MAX_POINT_CACHE_SIZE:
+            self._point_cache.clear()
+        self._point_cache[cycle] = ret
+        return ret
+
+    def id_match(self, element_type: str, id_: str) -> bool:
+        """Return True if the element with this ID passes the filter."""
+        if element_type == WORKFLOW:
+            return True
+        check_points = (
+            self.min_point is not None or self.max_point is not None
+        )
+        for cycle, name in element_cycles_and_names(element_type, id_):
+            if (
+                check_points
+                and cycle is not None
+                and not self._point_match(cycle)
+            ):
+                continue
+            if self.names and (
+                name is None
+                or not any(
+                    fnmatchcase(name, pattern) for pattern in self.names
+                )
+            ):
+                continue
+            return True
+        return False
+
+    def _mask(self, element: 'Message') -> 'Message':
+        """Strip the element of fields not in the mask (in place)."""
+        if self.fields:
+            for field, _ in element.ListFields():
+                if field.name not in self.fields:
+                    element.ClearField(field.name)
+        return element
+
+    def apply(self, all_deltas: 'Message') -> 'Optional[Message]':
+        """Return the filtered copy of an AllDeltas message.
+
+        Returns None if nothing passes the filter.
+
+        """
+        result = DELTAS_MAP[ALL_DELTAS]()
+        for field, delta in all_deltas.ListFields():
+            element_type = field.name
+            if element_type not in self.element_types:
+                continue
+            filtered = DELTAS_MAP[element_type]()
+            if element_type == WORKFLOW:
+                filtered.CopyFrom(delta)
+                for key in ('added', 'updated'):
+                    if filtered.HasField(key):
+                        self._mask(getattr(filtered, key))
+                getattr(result, element_type).CopyFrom(filtered)
+                continue
+            for key in ('added', 'updated'):
+                for element in getattr(delta, key):
+                    if self.id_match(element_type, element.id):
+                        new_element = getattr(filtered, key).add()
+                        new_element.MergeFrom(element)
+                        self._mask(new_element)
+            filtered.pruned.extend(
+                id_
+                for id_ in delta.pruned
+                if self.id_match(element_type, id_)
+            )
+            if delta.reloaded:
+                # subscribers must still reset their store on reload
+                filtered.reloaded = True
+            if filtered.ListFields():
+                filtered.time = delta.time
+                getattr(result, element_type).CopyFrom(filtered)
+        if not result.ListFields():
+            return None
+        return result
@@ -19,6 +19,7 @@ from queue import Queue
 from typing import (
     TYPE_CHECKING,
     Optional,
+    cast,
 )
 
 import zmq
@@ -30,7 +31,10 @@ from cylc.flow import (
 from cylc.flow.network import (
     ZMQSocketBase,
     deserialize,
+    encode_response,
+    select_response_encoding,
     serialize,
+    serialize_chunks,
 )
 
 
@@ -59,6 +63,13 @@ class WorkflowReplier(ZMQSocketBase):
         * Expects requests of the format: {"command": CMD, "args": {...}}
         * Sends responses of the format: {"data": {...}}
         * Sends errors in the format: {"error": {"message": MSG}}
+        * Responses are JSON encoded unless the request "meta" lists
+          "encodings" the client accepts which include a binary encoding
+          supported here (e.g. "msgpack").
+        * If the request "meta" contains "chunked_response": true, the
+          response is sent as a multipart message which the client must
+          join back together (large responses are then encoded and sent
+          incrementally).
 
     """
 
@@ -132,9 +143,26 @@ class WorkflowReplier(ZMQSocketBase):
                 # success case - serve the request
                 res = self.server.receiver(message)
                 data = res.get('data')
+                meta = cast('dict', message).get('meta') or {}
                 # send back the string to bytes response
                 if isinstance(data, bytes):
                     response = data
+                elif meta.get('chunked_response'):
+                    self._send_chunks(res)
+                    continue
                 else:
-                    response = serialize(res).encode()
+                    response = encode_response(
+                        res, select_response_encoding(meta.get('encodings'))
+                    )
             self.socket.send(response)  # type: ignore[union-attr]
+
+    def _send_chunks(self, res: 'ResponseDict') -> None:
+        """Send a response as a multipart message of JSON chunks."""
+        chunks = serialize_chunks(res)
+        chunk = next(chunks)
+        for next_chunk in chunks:
+            self.socket.send(  # type: ignore[union-attr]
+                chunk, zmq.SNDMORE
+            )
+            chunk = next_chunk
+        self.socket.send(chunk)  # type: ignore[union-attr]
@@ -21,6 +21,7 @@ import asyncio
 from contextlib import suppress
 from fnmatch import fnmatchcase
 import logging
+from operator import attrgetter
 import queue
 from time import time
 from typing import (
@@ -41,7 +42,7 @@ from graphene.utils.str_converters import to_snake_case
 from cylc.flow import LOG
 from cylc.flow.commands import COMMANDS
 from cylc.flow.data_store_mgr import (
-    EDGES, FAMILY_PROXIES, TASK_PROXIES, WORKFLOW,
+    EDGES, FAMILY_PROXIES, JOBS, TASK_PROXIES, WORKFLOW,
     DELTA_ADDED, create_delta_store
 )
 import cylc.flow.flags
@@ -60,7 +61,7 @@ if TYPE_CHECKING:
     from enum import Enum
     from uuid import UUID
     from graphql import GraphQLResolveInfo
-    from cylc.flow.data_store_mgr import DataStoreMgr
+    from cylc.flow.data_store_mgr import DataStoreMgr, NodeIndex
     from cylc.flow.scheduler import Scheduler
 
     DeltaQueue = queue.Queue[Tuple[str, str, dict]]
@@ -246,6 +247,10 @@ def node_filter(node, node_type, args, state):
             args.get('is_queued') is None
             or (node.is_queued == args['is_queued'])
         )
+        and (
+            args.get('is_runahead') is None
+            or (node.is_runahead == args['is_runahead'])
+        )
         and (
             args.get('mindepth', -1) < 0
             or node.depth >= args['mindepth']
@@ -270,6 +275,72 @@ def node_filter(node, node_type, args, state):
     )
 
 
+def has_glob(pattern: str) -> bool:
+    """Return True if the string contains glob characters.
+
+    Examples:
+        >>> has_glob('foo')
+        False
+        >>> has_glob('f*')
+        True
+        >>> has_glob('f[oa]o')
+        True
+
+    """
+    return any(char in pattern for char in '*?[')
+
+
+def index_filter(index: 'NodeIndex', args) -> Optional[Dict[str, int]]:
+    """Return candidate nodes for the query arguments from a node index.
+
+    The candidates are a superset of the nodes which match the arguments,
+    they must still be filtered with node_filter.
+
+    Returns:
+        {node ID: sequence number} or None if the arguments cannot be
+        resolved using the index (in which case all nodes are candidates).
+
+    """
+    candidates: List[Dict[str, int]] = []
+    if args.get('states'):
+        candidates.append(index.lookup('state', args['states']))
+    for field in ('is_held', 'is_queued', 'is_runahead'):
+        if args.get(field) is not None:
+            candidates.append(index.lookup(field, [args[field]]))
+    if args.get('ids'):
+        id_matches: Optional[Dict[str, int]] = {}
+        for item in iter_uniq(args['ids']):
+            if item.is_null:
+                continue
+            item_matches: Optional[Dict[str, int]] = None
+            if item['cycle'] and not has_glob(item['cycle']):
+                item_matches = index.lookup('cycle_point', [item['cycle']])
+            if item['task'] and not has_glob(item['task']):
+                name_matches = index.lookup('name', [item['task']])
+                item_matches = (
+                    name_matches if item_matches is None
+                    else {
+                        n_id: seq
+                        for n_id, seq in item_matches.items()
+                        if n_id in name_matches
+                    }
+                )
+            if item_matches is None:
+                # this item cannot be resolved via the index
+                id_matches = None
+                break
+            id_matches.update(item_matches)  # type: ignore[union-attr]
+        if id_matches is not None:
+            candidates.append(id_matches)
+    if not candidates:
+        return None
+    candidates.sort(key=len)
+    ret, *others = candidates
+    for other in others:
+        ret = {n_id: seq for n_id, seq in ret.items() if n_id in other}
+    return ret
+
+
 def get_flow_data_from_ids(data_store, native_ids):
     """Return workflow data by id."""
     w_ids = []
@@ -357,13 +428,17 @@ class BaseResolvers(metaclass=ABCMeta):  # noqa: SIM119
                 ][node_type][node.id].state
             )
 
+    def get_flow_nodes(self, flow, node_type, args):
+        """Return the nodes of a workflow which may match the query args."""
+        return flow[node_type].values()
+
     async def get_nodes_all(self, node_type, args):
         """Return nodes from all workflows, filter by args."""
         return sort_elements(
             [
                 node
                 for flow in await self.get_workflows_data(args)
-                for node in flow[node_type].values()
+                for node in self.get_flow_nodes(flow, node_type, args)
                 if node_filter(
                     node,
                     node_type,
@@ -659,6 +734,59 @@ class Resolvers(BaseResolvers):
         super().__init__(data)
         self.schd = schd
 
+    def get_flow_nodes(self, flow, node_type, args):
+        """Return the nodes of a workflow which may match the query args.
+
+        Uses the data store's node indexes to narrow down the nodes so that
+        filtering by state, cycle point, name or held/queued/runahead status
+        scales with the size of the result rather than the store.
+
+        """
+        index = self.data_store_mgr.node_indexes.get(node_type)
+        if (
+            index is None
+            # the index only covers the data store (not delta stores)
+            or flow is not self.data_store_mgr.data.get(
+                self.data_store_mgr.workflow_id
+            )
+        ):
+            return super().get_flow_nodes(flow, node_type, args)
+        candidates = index_filter(index, args)
+        if candidates is None:
+            return super().get_flow_nodes(flow, node_type, args)
+        nodes = flow[node_type]
+        # return the nodes in store order
+        return [
+            nodes[n_id]
+            for n_id in sorted(candidates, key=candidates.__getitem__)
+        ]
+
+    async def get_nodes_by_ids(self, node_type, args):
+        """Return protobuf node objects for given id.
+
+        Jobs requested via their task include any evicted from the
+        data store (loaded from the workflow database).
+
+        """
+        nodes = await super().get_nodes_by_ids(node_type, args)
+        if (
+            node_type == JOBS
+            and args.get('task_proxy')
+            and not args.get('delta_store')
+        ):
+            evicted = [
+                job
+                for job in self.data_store_mgr.get_evicted_jobs(
+                    args['task_proxy']
+                )
+                if node_filter(job, JOBS, args, job.state)
+            ]
+            if evicted:
+                # evicted jobs are the oldest
+                evicted.sort(key=attrgetter('submit_num'))
+                nodes = sort_elements(evicted + nodes, args)
+        return nodes
+
     # Mutations
     async def mutator(
         self,
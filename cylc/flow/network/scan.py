@@ -31,6 +31,9 @@ There are filters which you can you to omit workflows e.g.
 :py:func:`cylc_version` and transformers which acquire more information
 e.g. :py:func:`contact_info`.
 
+Scans of the cylc-run directory are accelerated by a :py:class:`ScanIndex`
+which records directory listings between scans.
+
 .. note: we must manually list functions so they get built into the docs
 
 .. autofunction:: scan
@@ -46,14 +49,19 @@ e.g. :py:func:`contact_info`.
 """
 
 import asyncio
+from contextlib import suppress
+import json
+import os
 from pathlib import Path
 import re
+from time import time_ns
 from typing import (
     AsyncGenerator,
     Dict,
     Iterable,
     List,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
@@ -64,6 +72,7 @@ from packaging.version import parse as parse_version
 
 from cylc.flow import LOG
 from cylc.flow.async_util import (
+    async_stat,
     pipe,
     scandir,
 )
@@ -73,6 +82,7 @@ from cylc.flow.exceptions import (
     ClientTimeout,
     WorkflowStopped,
 )
+from cylc.flow.hostuserutil import get_user_home
 from cylc.flow.network.client import WorkflowRuntimeClient
 from cylc.flow.pathutil import (
     get_cylc_run_dir,
@@ -102,6 +112,148 @@ REQUIRED_FIELDS = [
     ContactFileFields.NAME
 ]
 
+# the scan index file (in the user config directory, not the cylc-run
+# directory, as writing it would modify the directory it indexes)
+SCAN_INDEX = Path('.cylc', 'flow', 'scan-index.json')
+
+# directories modified more recently than this (nanoseconds) are not indexed
+# (their listing could still change within the resolution of the filesystem
+# timestamps)
+SCAN_INDEX_MIN_AGE = 2 * 10 ** 9
+
+
+class ScanIndex:
+    """Persistent record of the directory listings under the cylc-run dir.
+
+    Scanning requires listing every directory down to the "max depth" and
+    stat-ing the entries of each directory which is not a workflow. With many
+    installed workflows on a network filesystem this can take seconds.
+
+    The modification time of a directory changes whenever an entry is added
+    to or removed from it. So, if it is unchanged since the last scan, the
+    recorded listing can be used in place of a fresh one. This costs one
+    stat, rather than a listing plus a stat per entry.
+
+    Args:
+        path: The index file.
+        run_dir: The cylc-run directory.
+
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path, run_dir: Path):
+        self.path = path
+        self.run_dir = run_dir
+        # {directory: [mtime_ns, {entry_name: is_dir (or None if unknown)}]}
+        self.entries: Dict[str, list] = {}
+        # the directories visited since the last prune
+        self.visited: Set[str] = set()
+        self.changed = False
+        self.load()
+
+    def load(self) -> None:
+        """Load the index file (if present and compatible)."""
+        try:
+            with open(self.path) as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(data, dict)
+            and data.get('version') == self.VERSION
+            and data.get('run_dir') == str(self.run_dir)
+        ):
+            self.entries = data['entries']
+
+    def dump(self) -> None:
+        """Write the index file (if it has changed).
+
+        The index is only a cache, failure to write it is not an error.
+        """
+        if not self.changed:
+            return
+        self.changed = False
+        tmp = self.path.with_name(f'{self.path.name}.{os.getpid()}')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'w') as index_file:
+                json.dump(
+                    {
+                        'version': self.VERSION,
+                        'run_dir': str(self.run_dir),
+                        'entries': self.entries,
+                    },
+                    index_file,
+                )
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            LOG.debug(f'Could not write the scan index: {exc}')
+            with suppress(OSError):
+                tmp.unlink()
+
+    def prune(self) -> None:
+        """Forget directories which have not been visited since last prune.
+
+        Call this after a complete scan to remove workflows which no longer
+        exist from the index.
+        """
+        for key in set(self.entries) - self.visited:
+            del self.entries[key]
+            self.changed = True
+        self.visited.clear()
+
+    async def scandir(self, path: Path) -> List[Path]:
+        """List a directory, using the recorded listing if still valid."""
+        key = str(path)
+        self.visited.add(key)
+        mtime_ns = (await async_stat(path)).st_mtime_ns
+        entry = self.entries.get(key)
+        if entry and entry[0] == mtime_ns:
+            return [path / name for name in entry[1]]
+        contents = await scandir(path)
+        if time_ns() - mtime_ns > SCAN_INDEX_MIN_AGE:
+            self.entries[key] = [
+                mtime_ns,
+                {sub_path.name: None for sub_path in contents}
+            ]
+            self.changed = True
+        elif self.entries.pop(key, None):
+            self.changed = True
+        return contents
+
+    def is_dir(self, path: Path) -> bool:
+        """Return True if path is a directory.
+
+        The path must be an entry of a directory listed with
+        :py:meth:`ScanIndex.scandir`.
+        """
+        entry = self.entries.get(str(path.parent))
+        is_dir = entry[1].get(path.name) if entry else None
+        if is_dir is None:
+            is_dir = path.is_dir()
+            # Only record positive results: "is_dir" follows symlinks so a
+            # dangling link could become a directory without the parent
+            # directory being modified.
+            if entry and is_dir:
+                entry[1][path.name] = is_dir
+                self.changed = True
+        return is_dir
+
+
+# {cylc-run dir: index}
+_SCAN_INDEXES: Dict[Path, ScanIndex] = {}
+
+
+def get_scan_index(run_dir: Path) -> ScanIndex:
+    """Return the scan index for a cylc-run directory."""
+    if run_dir not in _SCAN_INDEXES:
+        _SCAN_INDEXES[run_dir] = ScanIndex(
+            Path(os.getenv('HOME') or get_user_home(), SCAN_INDEX),
+            run_dir,
+        )
+    return _SCAN_INDEXES[run_dir]
+
 
 def dir_is_flow(listing: Iterable[Path]) -> Optional[bool]:
     """Return True if a Path contains a flow at the top level.
@@ -196,7 +348,8 @@ async def scan_multi(
 async def scan(
     run_dir: Optional[Path] = None,
     scan_dir: Optional[Path] = None,
-    max_depth: Optional[int] = None
+    max_depth: Optional[int] = None,
+    use_index: bool = True,
 ) -> AsyncGenerator[Dict[str, Union[str, Path]], None]:
     """List flows installed on the filesystem.
 
@@ -215,6 +368,10 @@ async def scan(
 
             * ``max_depth=1`` will pick up top-level workflows (e.g. ``foo``).
             * ``max_depth=2`` will pick up nested workflows (e.g. ``foo/bar``).
+        use_index:
+            Use the :py:class:`ScanIndex` to avoid re-listing directories
+            which have not changed since the last scan (only applies to scans
+            of the cylc-run directory).
 
     Yields:
         dict - Dictionary containing information about the flow.
@@ -228,16 +385,26 @@ async def scan(
     if max_depth is None:
         max_depth = glbl_cfg().get(['install', 'max depth'])
 
+    index: Optional[ScanIndex] = None
+    if use_index and run_dir == cylc_run_dir:
+        index = get_scan_index(cylc_run_dir)
+
     running: List[asyncio.tasks.Task] = []
 
     # wrapper for scandir to preserve context
     async def _scandir(path: Path, depth: int) -> Tuple[Path, int, List[Path]]:
-        contents = await scandir(path)
+        if index:
+            contents = await index.scandir(path)
+        else:
+            contents = await scandir(path)
         return path, depth, contents
 
     def _scan_subdirs(listing: List[Path], depth: int) -> None:
         for subdir in listing:
-            if subdir.is_dir() and subdir.stem not in EXCLUDE_FILES:
+            if (
+                subdir.stem not in EXCLUDE_FILES
+                and (index.is_dir(subdir) if index else subdir.is_dir())
+            ):
                 running.append(
                     asyncio.create_task(
                         _scandir(subdir, depth + 1)
@@ -246,7 +413,7 @@ async def scan(
 
     # perform the first directory listing
     try:
-        scan_dir_listing = await scandir(scan_dir)
+        _, _, scan_dir_listing = await _scandir(scan_dir, 0)
     except FileNotFoundError:
         return
     if scan_dir != cylc_run_dir and dir_is_flow(scan_dir_listing):
@@ -256,32 +423,40 @@ async def scan(
     _scan_subdirs(scan_dir_listing, depth=0)
 
     # perform all further directory listings
-    while running:
-        # wait here until there's something to do
-        done, _ = await asyncio.wait(
-            running,
-            return_when=asyncio.FIRST_COMPLETED
-        )
-        for task in done:
-            try:
-                path, depth, contents = task.result()
-            except FileNotFoundError:
-                # directory has been removed since the scan was scheduled
+    complete = False
+    try:
+        while running:
+            # wait here until there's something to do
+            done, _ = await asyncio.wait(
+                running,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                try:
+                    path, depth, contents = task.result()
+                except FileNotFoundError:
+                    # directory has been removed since the scan was scheduled
+                    running.remove(task)
+                    continue
                 running.remove(task)
-                continue
-            running.remove(task)
-            is_flow = dir_is_flow(contents)
-            if is_flow:
-                # this is a flow directory
-                yield {
-                    'name': str(path.relative_to(run_dir)),
-                    'path': path,
-                }
-            elif is_flow is False and depth < max_depth:
-                # we may have a nested flow, lets see...
-                _scan_subdirs(contents, depth)
-        # don't allow this to become blocking
-        await asyncio.sleep(0)
+                is_flow = dir_is_flow(contents)
+                if is_flow:
+                    # this is a flow directory
+                    yield {
+                        'name': str(path.relative_to(run_dir)),
+                        'path': path,
+                    }
+                elif is_flow is False and depth < max_depth:
+                    # we may have a nested flow, lets see...
+                    _scan_subdirs(contents, depth)
+            # don't allow this to become blocking
+            await asyncio.sleep(0)
+        complete = True
+    finally:
+        if index:
+            if complete and scan_dir == run_dir:
+                index.prune()
+            index.dump()
 
 
 def join_regexes(*patterns):
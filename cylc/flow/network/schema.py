@@ -89,6 +89,7 @@ if TYPE_CHECKING:
         GraphQLNamedType,
         GraphQLType,
     )
+    from graphql.pyutils import Path
 
     from cylc.flow.network.resolvers import BaseResolvers
 
@@ -115,6 +116,44 @@ def sort_elements(elements, args):
     return elements
 
 
+def paginate(elements, args):
+    """Return the page of elements selected by the "first" & "after" args.
+
+    This provides cursor based pagination where the cursor is the ID of the
+    last element of the previous page. A page with fewer than "first"
+    elements is the last.
+
+    Examples:
+        >>> from types import SimpleNamespace
+        >>> elements = [SimpleNamespace(id=id_) for id_ in 'abcde']
+        >>> ids = lambda elements: [e.id for e in elements]
+        >>> ids(paginate(elements, {}))
+        ['a', 'b', 'c', 'd', 'e']
+        >>> ids(paginate(elements, {'first': 2}))
+        ['a', 'b']
+        >>> ids(paginate(elements, {'first': 2, 'after': 'b'}))
+        ['c', 'd']
+        >>> ids(paginate(elements, {'first': 2, 'after': 'd'}))
+        ['e']
+        >>> paginate(elements, {'after': 'x'})
+        Traceback (most recent call last):
+        ValueError: Cursor not found (after: x)
+
+    """
+    after = args.get('after')
+    if after:
+        for index, element in enumerate(elements):
+            if element.id == after:
+                elements = elements[index + 1:]
+                break
+        else:
+            raise ValueError(f'Cursor not found (after: {after})')
+    first = args.get('first')
+    if first is not None:
+        elements = elements[:max(first, 0)]
+    return elements
+
+
 PROXY_NODES = 'proxy_nodes'
 
 # Mapping of GraphQL types to field names:
@@ -158,6 +197,8 @@ JOB_ARGS = {
     'states': graphene.List(String, default_value=[]),
     'exstates': graphene.List(String, default_value=[]),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 ALL_JOB_ARGS = {
@@ -168,6 +209,8 @@ ALL_JOB_ARGS = {
     'states': graphene.List(String, default_value=[]),
     'exstates': graphene.List(String, default_value=[]),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 DEF_ARGS = {
@@ -176,6 +219,8 @@ DEF_ARGS = {
     'mindepth': Int(default_value=-1),
     'maxdepth': Int(default_value=-1),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 ALL_DEF_ARGS = {
@@ -186,6 +231,8 @@ ALL_DEF_ARGS = {
     'mindepth': Int(default_value=-1),
     'maxdepth': Int(default_value=-1),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 PROXY_ARGS = {
@@ -200,6 +247,8 @@ PROXY_ARGS = {
     'maxdepth': Int(default_value=-1),
     'graph_depth': Int(default_value=-1),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 ALL_PROXY_ARGS = {
@@ -216,6 +265,8 @@ ALL_PROXY_ARGS = {
     'maxdepth': Int(default_value=-1),
     'graph_depth': Int(default_value=-1),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 EDGE_ARGS = {
@@ -224,12 +275,16 @@ EDGE_ARGS = {
     'states': graphene.List(String, default_value=[]),
     'exstates': graphene.List(String, default_value=[]),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 ALL_EDGE_ARGS = {
     'workflows': graphene.List(ID, default_value=[]),
     'exworkflows': graphene.List(ID, default_value=[]),
     'sort': SortArgs(default_value=None),
+    'first': Int(),
+    'after': ID(),
 }
 
 NODES_EDGES_ARGS = {
@@ -386,7 +441,9 @@ async def get_nodes_all(
     for arg in ('workflows', 'exworkflows'):
         args[arg] = [Tokens(w_id) for w_id in args[arg]]
     resolvers = get_resolvers(info)
-    return await resolvers.get_nodes_all(node_field_name, args)
+    return paginate(
+        await resolvers.get_nodes_all(node_field_name, args), args
+    )
 
 
 async def get_nodes_by_ids(
@@ -420,10 +477,15 @@ async def get_nodes_by_ids(
         args['native_ids'] = get_native_ids(field_ids)
 
     node_field_name = field_name_from_type(info.return_type)
+    if node_field_name == JOBS and info.parent_type.name == 'TaskProxy':
+        # the jobs of a task may include those evicted from memory
+        args['task_proxy'] = getattr(root, 'id', None)
 
     args['ids'] = [Tokens(n_id, relative=True) for n_id in args['ids']]
     args['exids'] = [Tokens(n_id, relative=True) for n_id in args['exids']]
-    return await resolvers.get_nodes_by_ids(node_field_name, args)
+    return paginate(
+        await resolvers.get_nodes_by_ids(node_field_name, args), args
+    )
 
 
 async def get_node_by_id(
@@ -477,7 +539,7 @@ async def get_edges_all(root, info: 'GraphQLResolveInfo', **args):
         Tokens(w_id) for w_id in args['exworkflows']
     ]
     resolvers = get_resolvers(info)
-    return await resolvers.get_edges_all(args)
+    return paginate(await resolvers.get_edges_all(args), args)
 
 
 async def get_edges_by_ids(root, info: 'GraphQLResolveInfo', **args):
@@ -491,7 +553,7 @@ async def get_edges_by_ids(root, info: 'GraphQLResolveInfo', **args):
         return []
 
     resolvers = get_resolvers(info)
-    return await resolvers.get_edges_by_ids(args)
+    return paginate(await resolvers.get_edges_by_ids(args), args)
 
 
 async def get_nodes_edges(root, info: 'GraphQLResolveInfo', **args):
@@ -518,6 +580,56 @@ async def get_nodes_edges(root, info: 'GraphQLResolveInfo', **args):
     return await resolvers.get_nodes_edges(root_nodes, args)
 
 
+def is_updated_delta(path: Optional['Path']) -> bool:
+    """Return True if the path is within an updated delta.
+
+    Examples:
+        >>> from graphql.pyutils import Path
+        >>> path = Path(None, 'deltas', 'Subscriptions')
+        >>> is_updated_delta(path.add_key('added', 'Deltas')
+        ...     .add_key('taskProxies', 'Added'))
+        False
+        >>> is_updated_delta(path.add_key('updated', 'Deltas')
+        ...     .add_key('taskProxies', 'Updated'))
+        True
+
+    """
+    while path is not None:
+        if path.typename == 'Updated':
+            return True
+        path = path.prev
+    return False
+
+
+async def resolve_proxy_runtime(
+    root: Any, info: 'GraphQLResolveInfo', **args
+):
+    """Resolve the runtime of a task or family proxy.
+
+    Proxies without a runtime of their own (see the data store
+    ``compact runtime`` setting) share that of their definition.
+
+    Updated deltas only carry the runtime if it has changed, so are
+    returned as is.
+    """
+    if root.HasField('runtime') or is_updated_delta(info.path):
+        return root.runtime
+    resolvers = get_resolvers(info)
+    node_type = field_name_from_type(info.parent_type)
+    # (the root may be a delta, so refer to the node in the store)
+    node = await resolvers.get_node_by_id(node_type, {'id': root.id})
+    if node is None:
+        return None
+    if node.HasField('runtime'):
+        return node.runtime
+    if node_type == TASK_PROXIES:
+        def_type, def_id = TASKS, node.task
+    else:
+        def_type, def_id = FAMILIES, node.family
+    definition = await resolvers.get_node_by_id(def_type, {'id': def_id})
+    return getattr(definition, 'runtime', None)
+
+
 def resolve_state_totals(root, info, **args):
     state_totals = dict.fromkeys(TASK_STATUSES_ORDERED, 0)
     # Update with converted protobuf map container
@@ -987,6 +1099,12 @@ class Task(ObjectType):
     mean_elapsed_time = Float(
         description="The task's average runtime."
     )
+    p50_elapsed_time = Float(
+        description="The task's median runtime."
+    )
+    p95_elapsed_time = Float(
+        description="The task's 95th percentile runtime."
+    )
     depth = Int(
         description='The family inheritance depth.'
     )
@@ -1099,6 +1217,7 @@ class TaskProxy(ObjectType):
     runtime = Field(
         Runtime,
         description="This task's `[runtime]` section.",
+        resolver=resolve_proxy_runtime,
     )
     state = String(
         description='The task state e.g. `running`.',
@@ -1295,7 +1414,7 @@ class FamilyProxy(ObjectType):
         delta_store=DELTA_STORE_DEFAULT,
         delta_type=DELTA_TYPE_DEFAULT,
         resolver=get_node_by_id)
-    runtime = Field(Runtime)
+    runtime = Field(Runtime, resolver=resolve_proxy_runtime)
     state = String()
     states = graphene.List(String)
     state_totals = GenericScalar(resolver=resolve_state_totals)
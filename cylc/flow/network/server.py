@@ -16,9 +16,16 @@
 """Server for workflow runtime API."""
 
 import asyncio
+from collections import Counter
+from contextlib import suppress
+import json
+import os
 from queue import Queue
 from textwrap import dedent
-from time import sleep
+from time import (
+    sleep,
+    time,
+)
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -26,9 +33,13 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Tuple,
     Union,
+    cast,
 )
 
+from graphql import execute
+from graphql.pyutils import is_awaitable
 import zmq
 from zmq.auth.thread import ThreadAuthenticator
 
@@ -39,11 +50,25 @@ from cylc.flow import (
 )
 from cylc.flow.cfgspec.glbl_cfg import glbl_cfg
 from cylc.flow.data_messages_pb2 import PbEntireWorkflow
-from cylc.flow.data_store_mgr import DELTAS_MAP
+from cylc.flow.data_store_mgr import (
+    ALL_DELTAS,
+    DELTAS_MAP,
+    deltas_mergeable,
+    get_publish_articles,
+    merge_deltas,
+)
+from cylc.flow.exceptions import CylcError
 from cylc.flow.network.graphql import (
     CylcExecutionContext,
     IgnoreFieldMiddleware,
     instantiate_middleware,
+    is_query,
+    parse_and_validate,
+)
+from cylc.flow.network.publish_filter import (
+    FILTER_TTL,
+    MAX_FILTERS,
+    PublishFilter,
 )
 from cylc.flow.network.publisher import WorkflowPublisher
 from cylc.flow.network.replier import WorkflowReplier
@@ -52,6 +77,13 @@ from cylc.flow.network.schema import schema
 
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
+    from graphql import (
+        DocumentNode,
+        ExecutionResult,
+    )
+
     from cylc.flow.network import ResponseDict
     from cylc.flow.scheduler import Scheduler
 
@@ -63,6 +95,131 @@ PB_METHOD_MAP: Dict[str, Any] = {
 }
 
 
+class Waker:
+    """Wake a thread waiting on a ZMQ poller from other threads.
+
+    Register with a ``zmq.Poller`` (it has a file descriptor) and call
+    ``wake`` from any thread to interrupt the poll.
+    """
+
+    def __init__(self):
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        os.set_blocking(self._write_fd, False)
+        self.closed = False
+
+    def fileno(self) -> int:
+        return self._read_fd
+
+    def wake(self) -> None:
+        if self.closed:
+            return
+        with suppress(BlockingIOError):
+            # (if the pipe is full a wake-up is already pending)
+            os.write(self._write_fd, b'\0')
+
+    def clear(self) -> None:
+        """Consume pending wake-ups."""
+        if self.closed:
+            return
+        with suppress(BlockingIOError):
+            while os.read(self._read_fd, 4096):
+                pass
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
+
+class PublishQueue(Queue):
+    """Queue of items to publish, wakes the server when items are added."""
+
+    def __init__(self, waker: Waker):
+        super().__init__()
+        self.waker = waker
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        self.waker.wake()
+
+
+def get_article_deltas(articles: Iterable[tuple]) -> Optional[Dict[str, Any]]:
+    """Return the data-store deltas from a batch of items to publish.
+
+    Returns:
+        {element type: delta} or None if the batch contains anything other
+        than data-store deltas.
+
+    """
+    deltas = {}
+    for topic, data, *serializer in articles:
+        key = topic.decode('utf-8')
+        if key not in DELTAS_MAP or serializer != ['SerializeToString']:
+            return None
+        if key != ALL_DELTAS:
+            deltas[key] = data
+    return deltas
+
+
+def coalesce_deltas(batches: List[Iterable[tuple]]) -> List[Iterable[tuple]]:
+    """Merge consecutive batches of data-store deltas queued for publishing.
+
+    When deltas are generated faster than they are published (e.g. during a
+    burst of activity, or while the server is busy with a large request)
+    batches queue up. Merging them sends fewer, larger messages, which
+    subscribers can apply in one go.
+
+    Batches which contain other items, or which cannot be merged (see
+    cylc.flow.data_store_mgr.deltas_mergeable), are published separately.
+
+    Args:
+        batches: Queued items to publish [[(topic, data, serializer)]].
+
+    Returns:
+        The items to publish [[(topic, data, serializer)]].
+
+    """
+    ret: List[Iterable[tuple]] = []
+    pending: Optional[Iterable[tuple]] = None
+    merged: Dict[str, Any] = {}
+    count = 0
+
+    def flush():
+        if pending is not None:
+            ret.append(pending if count == 1 else get_publish_articles(merged))
+
+    for articles in batches:
+        deltas = get_article_deltas(articles)
+        if (
+            pending is not None
+            and deltas is not None
+            and all(
+                deltas_mergeable(key, merged[key], delta)
+                for key, delta in deltas.items()
+                if key in merged
+            )
+        ):
+            # (the deltas are not published separately, modify in place)
+            for key, delta in deltas.items():
+                if key in merged:
+                    merge_deltas(key, merged[key], delta)
+                else:
+                    merged[key] = delta
+            count += 1
+            continue
+        flush()
+        if deltas is None:
+            ret.append(articles)
+            pending = None
+        else:
+            pending, merged, count = articles, deltas, 1
+    flush()
+    return ret
+
+
 def expose(func=None):
     """Expose a method on the sever."""
     func.exposed = True
@@ -141,8 +298,12 @@ class WorkflowRuntimeServer:
     client_pub_key_dir: str
     """Client public key directory, used by the ZMQ authenticator."""
 
-    OPERATE_SLEEP_INTERVAL = 0.2
+    # Maximum time to wait for requests or items to publish before checking
+    # for commands on the replier queue.
+    OPERATE_POLL_TIMEOUT = 200  # milliseconds
     STOP_SLEEP_INTERVAL = 0.2
+    # The number of GraphQL query results to cache between data store updates.
+    GRAPHQL_RESULT_CACHE_SIZE = 32
 
     def __init__(self, schd):
 
@@ -162,8 +323,22 @@ class WorkflowRuntimeServer:
         self.middleware = [
             IgnoreFieldMiddleware,
         ]
-
-        self.publish_queue: 'Queue[Iterable[tuple]]' = Queue()
+        # GraphQL query results {(request, variables): data} for the data
+        # store version they were generated from
+        self.graphql_results: Dict[Tuple[Optional[str], str], Any] = {}
+        self.graphql_results_version: Optional[int] = None
+
+        # wakes the server thread when there is something to publish
+        self.waker = Waker()
+        self.publish_queue: 'Queue[Iterable[tuple]]' = PublishQueue(
+            self.waker
+        )
+        # filtered publish topics, their registration counts and expiry times
+        self.publish_filters: Dict[str, PublishFilter] = {}
+        self.publish_filter_counts: 'Counter[str]' = Counter()
+        self.publish_filter_expiry: Dict[str, float] = {}
+        # {"batches queued" | "batches published" | "max queue length": n}
+        self.publish_stats: 'Counter[str]' = Counter()
         self.waiting_to_stop = False
         self.stopped = True
 
@@ -232,6 +407,7 @@ class WorkflowRuntimeServer:
         and wait for self.thread to terminate.
         """
         self.waiting_to_stop = True
+        self.waker.wake()
         if self.thread and self.thread.is_alive():
             # Wait for self.operate() loop to finish:
             while self.waiting_to_stop:
@@ -255,6 +431,8 @@ class WorkflowRuntimeServer:
             self.loop.stop()
         if self.thread and self.thread.is_alive():
             self.thread.join()  # Wait for processes to return
+        self.waker.close()
+        LOG.debug(f'Publish stats: {dict(self.publish_stats)}')
 
         self.stopped = True
 
@@ -263,6 +441,9 @@ class WorkflowRuntimeServer:
         # Note: this cannot be an async method because the response part
         # of the listener runs the event loop synchronously
         # (in graphql schema.execute_async)
+        poller = zmq.Poller()
+        poller.register(self.replier.socket, zmq.POLLIN)
+        poller.register(self.waker, zmq.POLLIN)
         while True:
             if self.waiting_to_stop:
                 # The self.stop() method is waiting for us to signal that we
@@ -275,14 +456,73 @@ class WorkflowRuntimeServer:
             # Publish all requested/queued.
             self.loop.run_until_complete(self.publish_queued_items())
 
-            # Yield control to other threads
-            sleep(self.OPERATE_SLEEP_INTERVAL)
+            # Wait (releasing the GIL) for a request, something to publish
+            # or a stop request.
+            poller.poll(self.OPERATE_POLL_TIMEOUT)
+            self.waker.clear()
 
     async def publish_queued_items(self) -> None:
-        """Publish all queued items."""
+        """Publish all queued items.
+
+        Queued batches of deltas are merged (see coalesce_deltas).
+        """
+        batches = []
         while self.publish_queue.qsize():
-            articles = self.publish_queue.get()
-            await self.publisher.publish(*articles)
+            batches.append(self.publish_queue.get())
+        if not batches:
+            return
+        self.publish_stats['batches queued'] += len(batches)
+        self.publish_stats['max queue length'] = max(
+            self.publish_stats['max queue length'], len(batches)
+        )
+        if len(batches) > 1:
+            batches = coalesce_deltas(batches)
+        for articles in batches:
+            await self.publisher.publish(
+                *articles, *self.filter_articles(articles)
+            )
+        self.publish_stats['batches published'] += len(batches)
+
+    def filter_articles(self, articles: Iterable[tuple]) -> List[tuple]:
+        """Return the filtered deltas of the registered publish filters.
+
+        Args:
+            articles: Items queued for publishing [(topic, data, serializer)].
+
+        """
+        if not self.publish_filters:
+            return []
+        self.expire_publish_filters()
+        all_topic = ALL_DELTAS.encode('utf-8')
+        for topic, data, *_ in articles:
+            if topic == all_topic:
+                all_deltas = data
+                break
+        else:
+            return []
+        ret = []
+        for pub_filter in list(self.publish_filters.values()):
+            filtered = pub_filter.apply(all_deltas)
+            if filtered is not None:
+                ret.append((
+                    pub_filter.topic.encode('utf-8'),
+                    filtered,
+                    'SerializeToString',
+                ))
+        return ret
+
+    def expire_publish_filters(self) -> None:
+        """Remove publish filters which have not been renewed in time."""
+        now = time()
+        for topic, expiry in list(self.publish_filter_expiry.items()):
+            if expiry < now:
+                LOG.debug(f'Publish filter expired: {topic}')
+                self._remove_publish_filter(topic)
+
+    def _remove_publish_filter(self, topic: str) -> None:
+        del self.publish_filters[topic]
+        del self.publish_filter_counts[topic]
+        del self.publish_filter_expiry[topic]
 
     def receiver(self, message) -> 'ResponseDict':
         """Process incoming messages and coordinate response.
@@ -399,17 +639,29 @@ class WorkflowRuntimeServer:
         Returns:
             object: Execution result, or a list with errors.
         """
-        executed = self.loop.run_until_complete(
-            schema.execute_async(
-                request_string,
-                variable_values=variables,
-                context_value={
-                    'resolvers': self.resolvers,
-                    'meta': meta or {},
-                },
-                middleware=list(instantiate_middleware(self.middleware)),
-                execution_context_class=CylcExecutionContext,
+        document, errors = parse_and_validate(
+            schema.graphql_schema, request_string or ''
+        )
+        if document is None or errors:
+            for error in errors:
+                LOG.warning(f"GraphQL: {error}")
+            raise Exception(*(error.message for error in errors))
+
+        # query results are reused until the data store next changes
+        cache_key: Optional[Tuple[Optional[str], str]] = None
+        data_version = self.schd.data_store_mgr.data_version
+        if is_query(document):
+            if self.graphql_results_version != data_version:
+                self.graphql_results.clear()
+                self.graphql_results_version = data_version
+            cache_key = (
+                request_string, json.dumps(variables, sort_keys=True)
             )
+            with suppress(KeyError):
+                return self.graphql_results[cache_key]
+
+        executed = self.loop.run_until_complete(
+            self._execute_graphql(document, variables, meta)
         )
         if executed.errors:
             for error in executed.errors:
@@ -417,8 +669,117 @@ class WorkflowRuntimeServer:
             # If there are execution errors, it means there was an unexpected
             # error, so fail the command.
             raise Exception(*(error.message for error in executed.errors))
+        if (
+            cache_key is not None
+            # (don't cache results which may span a data store update)
+            and self.schd.data_store_mgr.data_version == data_version
+        ):
+            if len(self.graphql_results) >= self.GRAPHQL_RESULT_CACHE_SIZE:
+                # evict the oldest result
+                del self.graphql_results[next(iter(self.graphql_results))]
+            self.graphql_results[cache_key] = executed.data
         return executed.data
 
+    async def _execute_graphql(
+        self,
+        document: 'DocumentNode',
+        variables: Optional[Dict[str, Any]],
+        meta: Optional[Dict[str, Any]],
+    ) -> 'ExecutionResult':
+        """Execute a parsed and validated GraphQL document."""
+        result = execute(
+            schema.graphql_schema,
+            document,
+            variable_values=variables,
+            context_value={
+                'resolvers': self.resolvers,
+                'meta': meta or {},
+            },
+            middleware=list(instantiate_middleware(self.middleware)),
+            execution_context_class=CylcExecutionContext,
+        )
+        if is_awaitable(result):
+            return await cast('Awaitable[ExecutionResult]', result)
+        return cast('ExecutionResult', result)
+
+    @expose
+    def register_publish_filter(
+        self,
+        element_types: Optional[List[str]] = None,
+        min_point: Optional[str] = None,
+        max_point: Optional[str] = None,
+        names: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        renew: bool = False,
+        **_kwargs
+    ) -> str:
+        """Register a filter on the published data-store deltas.
+
+        The filtered deltas are published as ``AllDeltas`` messages under
+        the returned topic. Identical filters share the same topic.
+
+        Registrations expire unless renewed (by registering the filter again
+        with ``renew``) within ``FILTER_TTL`` seconds.
+
+        Args:
+            element_types:
+                Data-store element types to include, e.g. ``task_proxies``.
+            min_point:
+                Exclude cycle point elements before this point.
+            max_point:
+                Exclude cycle point elements after this point.
+            names:
+                Only include elements with names matching these globs.
+            fields:
+                Only include these fields of each element.
+            renew:
+                Renew an existing registration rather than adding another.
+
+        Returns:
+            The topic to subscribe to.
+
+        """
+        pub_filter = PublishFilter(
+            element_types=element_types,
+            min_point=min_point,
+            max_point=max_point,
+            names=names,
+            fields=fields,
+        )
+        topic = pub_filter.topic
+        self.expire_publish_filters()
+        if topic not in self.publish_filters:
+            if len(self.publish_filters) >= MAX_FILTERS:
+                raise CylcError(
+                    f'Cannot register more than {MAX_FILTERS} publish filters'
+                )
+            self.publish_filters[topic] = pub_filter
+        if not renew or self.publish_filter_counts[topic] < 1:
+            self.publish_filter_counts[topic] += 1
+        self.publish_filter_expiry[topic] = time() + FILTER_TTL
+        return topic
+
+    @expose
+    def deregister_publish_filter(self, topic: str, **_kwargs) -> bool:
+        """Deregister a filter on the published data-store deltas.
+
+        The filtered topic stops being published once all registrations of
+        the filter have been removed.
+
+        Args:
+            topic: The topic returned on registration of the filter.
+
+        Returns:
+            True if the filter was registered.
+
+        """
+        if topic not in self.publish_filters:
+            return False
+        self.publish_filter_counts[topic] -= 1
+        if self.publish_filter_counts[topic] < 1:
+            self._remove_publish_filter(topic)
+        return True
+
     # UIServer Data Commands
     @expose
     def pb_entire_workflow(self, **_kwargs) -> bytes:
@@ -377,7 +377,18 @@ class CylcOptionParser(OptionParser):
             ),
             action='store', default=None, dest='templatevars_file',
             useif='jset'
-        )
+        ),
+        OptionSettings(
+            ['--no-template-cache'],
+            help=(
+                "Don't use the cache of processed workflow configurations,"
+                " i.e. always run the template processor. Use this if the"
+                " workflow configuration depends on something which the"
+                " cache can't detect changes to."
+            ),
+            action='store_false', default=True, dest='template_cache',
+            useif='jset'
+        ),
     ]
 
     def __init__(
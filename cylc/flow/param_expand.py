@@ -15,37 +15,10 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Parameter expansion for runtime namespace names and graph strings.
 
-Uses recursion to achieve nested looping over any number of parameters.  In its
-simplest form (without allowing for parameter offsets and specific values, and
-with input already expressed as a string template) the method looks like this:
-
-#------------------------------------------------------------------------------
-def expand(template, params, results, values=None):
-    '''Recursive parameter expansion.
-
-    template: e.g. "foo_m(m)s=>bar_m%(m)s_n%(n)s".
-    results: output list of expanded strings.
-    params: list of parameter (name, max-value) tuples.
-    '''
-    if values is None:
-        values = {}
-    if not params:
-        results.add(template % values)
-    else:
-        param = params[0]
-        for value in range(param[1]):
-            values[param[0]] = value
-            expand(template, params[1:], results, values)
-#------------------------------------------------------------------------------
-if __name__ == "__main__":
-    results = []
-    expand(
-        "foo_m%(m)s=>bar_m%(m)s_n%(n)s",
-        results,
-        [('m', 2), ('n', 3)]
-    )
-    for result in results:
-        print result
+Names and graph lines are expanded lazily, i.e. they are generated one at a
+time from the cartesian product of the values of the parameters used, so that
+the (potentially very large number of) expanded strings need not all be held
+in memory at once. E.g. "foo<m>=>bar<m,n>" with m=0..1 and n=0..2:
 
 foo_m0=>bar_m0_n0
 foo_m0=>bar_m0_n1
@@ -53,12 +26,12 @@ foo_m0=>bar_m0_n2
 foo_m1=>bar_m1_n0
 foo_m1=>bar_m1_n1
 foo_m1=>bar_m1_n2
-#------------------------------------------------------------------------------
 """
 
 from contextlib import suppress
+from itertools import product
 import re
-from typing import List, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from cylc.flow.exceptions import ParamExpandError
 from cylc.flow.task_id import TaskID
@@ -110,15 +83,18 @@ class NameExpander:
         Unlike GraphExpander this does not support offsets like "foo<m-1,n>",
         but it does support specific parameter values like "foo<m=0,n>".
 
-        Returns a list of tuples, each with an expanded name and its parameter
-        values (to be passed to the corresponding tasks), e.g.:
-            [('foo_i0_j0', {i:'0', j:'0'}),
-             ('foo_i0_j1', {i:'0', j:'1'}),
-             ('foo_i1_j0', {i:'1', j:'0'}),
-             ('foo_i1_j1', {i:'1', j:'1'})]
+        Returns an iterator over tuples, each with an expanded name and its
+        parameter values (to be passed to the corresponding tasks), e.g.:
+            ('foo_i0_j0', {i:'0', j:'0'}),
+            ('foo_i0_j1', {i:'0', j:'1'}),
+            ('foo_i1_j0', {i:'1', j:'0'}),
+            ('foo_i1_j1', {i:'1', j:'1'})
+
+        The heading is checked when this is called, the names are expanded
+        as the iterator is consumed.
         """
         # Create a string template and values to pass to the expansion method.
-        results = []
+        names: List[Tuple[str, List[Tuple[str, Any]], Dict[str, Any]]] = []
         for name in REC_NAMES.findall(runtime_heading):
             tmpl = ''
             spec_vals = {}
@@ -165,42 +141,59 @@ class NameExpander:
                     name = ''
             if tmpl:
                 tmpl += name
-                self._expand_name(results, tmpl, used_params, spec_vals)
+                # Check the template with the first values.
+                self._fill_template(tmpl, {
+                    **spec_vals,
+                    **{pname: values[0] for pname, values in used_params},
+                })
+                names.append((tmpl, used_params, spec_vals))
             else:
-                results.append((name.strip(), {}))
-        return results
+                names.append((name.strip(), [], {}))
+        return self._expand_names(names)
 
-    def _expand_name(self, results, tmpl, params, spec_vals=None):
-        """Recursively expand tmpl for any number of parameters.
+    @classmethod
+    def _expand_names(
+        cls,
+        names: List[Tuple[str, List[Tuple[str, Any]], Dict[str, Any]]],
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Expand name templates for any number of parameters.
 
+        names is a list of tuples (tmpl, params, spec_vals) where:
         tmpl is a string template, e.g. 'foo_m%(m)s_n%(n)s' for two
-            parameters m and n.
-        params is a list of tuples (name, max-val) for each parameter
+            parameters m and n (or a plain name if there are no parameters).
+        params is a list of tuples (name, values) for each parameter
             to be looped over.
         spec_vals is a map of values for parameters that are not to be looped
             over because they've been assigned a specific value.
 
         E.g. for "foo<m=0,n>" tmpl is "foo_m%(m)s_n%(n)s", params is
-        [('n', 2)], and spec_values {'m': 0}.
+        [('n', [0, 1])], and spec_values {'m': 0}.
 
-        results contains the expanded names and corresponding parameter values,
-        as described above in the calling method.
+        Yields the expanded names and corresponding parameter values, as
+        described above in the calling method.
         """
-        if spec_vals is None:
-            spec_vals = {}
-        if not params:
-            # Inner loop.
-            current_values = dict(spec_vals)
-            try:
-                results.append((tmpl % current_values, current_values))
-            except KeyError as exc:
-                raise ParamExpandError(
-                    'parameter %s is not defined.' % str(exc.args[0])
-                ) from None
-        else:
-            for param_val in params[0][1]:
-                spec_vals[params[0][0]] = param_val
-                self._expand_name(results, tmpl, params[1:], spec_vals)
+        for tmpl, params, spec_vals in names:
+            if not params and not spec_vals:
+                yield (tmpl, {})
+                continue
+            pnames = [pname for pname, _ in params]
+            for values in product(*(pvalues for _, pvalues in params)):
+                current_values = dict(spec_vals)
+                current_values.update(zip(pnames, values))
+                yield (
+                    cls._fill_template(tmpl, current_values),
+                    current_values,
+                )
+
+    @staticmethod
+    def _fill_template(tmpl: str, values: Dict[str, Any]) -> str:
+        """Return tmpl % values, or raise ParamExpandError."""
+        try:
+            return tmpl % values
+        except KeyError as exc:
+            raise ParamExpandError(
+                'parameter %s is not defined.' % str(exc.args[0])
+            ) from None
 
     @staticmethod
     def _parse_task_name_string(task_str: str) -> Tuple[List[str], str]:
@@ -331,6 +324,13 @@ class GraphExpander:
             self.param_cfg, self.param_tmpl_cfg = parameters
         except (TypeError, ValueError):
             self.param_cfg, self.param_tmpl_cfg = ({}, {})
+        # Parameter groups (e.g. "m-1,n" from "<m-1,n>") compiled for
+        # expansion, cached as they are often used in many graph lines:
+        # {p_group: (pnames, expand_group, {pname indices: expanded group})}
+        self._groups: Dict[
+            str,
+            Tuple[List[str], Callable[[Tuple[int, ...]], str], Dict],
+        ] = {}
 
     def expand(self, line):
         """Expand a graph line for subset of workflow parameters.
@@ -338,17 +338,17 @@ class GraphExpander:
         Input line is a string that may contain multiple parameterized node
         names, e.g. "pre=>init<m>=>sim<m,n>=>post<m,n>=>done".
 
-        Unlike NameExpander this supports offsets like "foo<m-1,n>", which
-        means (because the parameter substitutions have to be computed on the
-        fly) we have shift creation of the expansion string template into the
-        inner loop of the recursive expansion function.
+        Unlike NameExpander this supports offsets like "foo<m-1,n>".
+
+        Returns an iterator over the line expanded for all used parameters,
+        e.g. for "foo=>bar<m,n>" with m=2 and n=2 the result would be:
+            foo=>bar_m0_n0
+            foo=>bar_m0_n1
+            foo=>bar_m1_n0
+            foo=>bar_m1_n1
 
-        Returns a set containing lines expanded for all used parameters, e.g.
-        for "foo=>bar<m,n>" with m=2 and n=2 the result would be:
-            set([foo=>bar_m0_n0,
-                 foo=>bar_m0_n1,
-                 foo=>bar_m1_n0,
-                 foo=>bar_m1_n1])
+        The line is checked when this is called, the expanded lines are
+        generated as the iterator is consumed.
 
         Specific parameter values can be singled out like this:
             "sim<m=0,n>=>sim<m,n>"
@@ -357,84 +357,116 @@ class GraphExpander:
         (Here the offset node must be the first in a line, and if m-1 evaluates
         to less than 0 the node will be removed to leave just "sim<m,n>").
         """
-        line_set = set()
-        used_pnames = []
-        for p_group in set(REC_P_GROUP.findall(line)):
-            for item in p_group.split(','):
-                pname, offs = REC_P_OFFS.match(item).groups()
-                if not self.param_cfg.get(pname, None):
-                    raise ParamExpandError(
-                        "parameter %s is not defined in <%s>: %s" % (
-                            pname, p_group, line))
-                if offs and offs.startswith('='):
-                    # Check that specific parameter values exist.
-                    val = offs[1:]
-                    try:
-                        nval = int(val)
-                    except ValueError:
-                        nval = val
-                    if not item_in_iterable(nval, self.param_cfg[pname]):
-                        raise ParamExpandError(
-                            "parameter %s out of range: %s" % (
-                                pname, p_group))
-                if pname not in used_pnames:
-                    used_pnames.append(pname)
-        used_params = [(p, self.param_cfg[p]) for p in used_pnames]
-        self._expand_graph(line, dict(used_params), used_params, line_set)
-        return line_set
-
-    def _expand_graph(self, line, all_params,
-                      param_list, line_set, values=None):
-        """Expand line into line_set for any number of parameters.
-
-        line is a graph string line as described above in the calling method.
-        param_list is a list of tuples (name, max-val) for each parameter.
-        results is a set to hold each expanded line.
+        # Alternating text and parameter groups,
+        # e.g. ['foo', 'm-1', '=>foo', 'm', ''] for "foo<m-1>=>foo<m>".
+        parts = REC_P_GROUP.split(line)
+        # The parameters to loop over (i.e. those without specific values).
+        loop_pnames: List[str] = []
+        for p_group in parts[1::2]:
+            for pname in self._compile_group(p_group, line)[0]:
+                if pname not in loop_pnames:
+                    loop_pnames.append(pname)
+        return self._expand_graph(parts, loop_pnames)
+
+    def _compile_group(self, p_group, line):
+        """Compile a parameter group for expansion (and check it).
+
+        Returns (pnames, expand_group, cache) where:
+        pnames are the parameters to loop over.
+        expand_group returns the expanded group for a tuple of indices into
+            the values of these parameters.
+        cache is for expanded groups, by indices.
         """
-        if values is None:
-            values = {}
-        if not param_list:
-            # Inner loop.
-            for p_group in set(REC_P_GROUP.findall(line)):
-                # Parameters must be expanded in the order found.
-                param_values = {}
-                for item in p_group.split(','):
-                    pname, offs = REC_P_OFFS.match(item).groups()
-                    if offs is None:
-                        param_values[pname] = values[pname]
-                    elif offs[0] == '=':
-                        # Specific value.
-                        try:
-                            # Template may require an integer
-                            param_values[pname] = int(offs[1:])
-                        except ValueError:
-                            param_values[pname] = offs[1:]
-                    else:
-                        # Index offset.
-                        plist = all_params[pname]
-                        cur_idx = plist.index(values[pname])
-                        off_idx = cur_idx + int(offs)
-                        if 0 <= off_idx < len(plist):
-                            offval = plist[off_idx]
-                        else:
-                            offval = self._REMOVE
-                        param_values[pname] = offval
-                tmpl = ''.join(
-                    self.param_tmpl_cfg[pname]
-                    for pname in param_values
-                )
+        with suppress(KeyError):
+            return self._groups[p_group]
+        # Parameters must be expanded in the order found:
+        # {pname: (index offset, specific value)}
+        items: Dict[str, Tuple[Optional[int], Any]] = {}
+        for item in p_group.split(','):
+            pname, offs = REC_P_OFFS.match(item).groups()
+            if not self.param_cfg.get(pname, None):
+                raise ParamExpandError(
+                    "parameter %s is not defined in <%s>: %s" % (
+                        pname, p_group, line))
+            if offs is None:
+                items[pname] = (0, None)
+            elif offs[0] == '=':
+                # Check that specific parameter values exist.
+                val = offs[1:]
                 try:
-                    repl = tmpl % param_values
-                except KeyError as exc:
+                    nval = int(val)
+                except ValueError:
+                    nval = val
+                if not item_in_iterable(nval, self.param_cfg[pname]):
                     raise ParamExpandError(
-                        'parameter %s is not defined.' % str(exc.args[0])
-                    ) from None
-                line = line.replace('<' + p_group + '>', repl)
+                        "parameter %s out of range: %s" % (
+                            pname, p_group))
+                # (template may require an integer)
+                items[pname] = (None, nval)
+            else:
+                # Index offset.
+                items[pname] = (int(offs), None)
+        pnames = [
+            pname for pname, (offset, _) in items.items()
+            if offset is not None
+        ]
+        tmpl = ''.join(self.param_tmpl_cfg[pname] for pname in items)
+
+        def expand_group(indices):
+            param_values = {}
+            indices_iter = iter(indices)
+            for pname, (offset, value) in items.items():
+                if offset is None:
+                    # Specific value.
+                    param_values[pname] = value
+                    continue
+                plist = self.param_cfg[pname]
+                off_idx = next(indices_iter) + offset
+                if 0 <= off_idx < len(plist):
+                    param_values[pname] = plist[off_idx]
+                else:
+                    param_values[pname] = self._REMOVE
+            try:
+                return tmpl % param_values
+            except KeyError as exc:
+                raise ParamExpandError(
+                    'parameter %s is not defined.' % str(exc.args[0])
+                ) from None
+
+        # Check the template with the first values.
+        expand_group((0,) * len(pnames))
+        self._groups[p_group] = (pnames, expand_group, {})
+        return self._groups[p_group]
+
+    def _expand_graph(self, parts, loop_pnames):
+        """Expand a graph line for any number of parameters.
+
+        parts are the text and parameter groups of the line (alternating).
+        loop_pnames are the parameters to loop over.
+
+        Yields each expanded line.
+        """
+        # For each parameter group: its position in parts, the positions of
+        # its parameters in loop_pnames, how to expand it, and its cache.
+        groups = []
+        for ind in range(1, len(parts), 2):
+            pnames, expand_group, cache = self._groups[parts[ind]]
+            groups.append((
+                ind,
+                [loop_pnames.index(pname) for pname in pnames],
+                expand_group,
+                cache,
+            ))
+        parts = list(parts)
+        for indices in product(*(
+            range(len(self.param_cfg[pname])) for pname in loop_pnames
+        )):
+            for ind, positions, expand_group, cache in groups:
+                key = tuple([indices[pos] for pos in positions])
+                try:
+                    parts[ind] = cache[key]
+                except KeyError:
+                    parts[ind] = cache[key] = expand_group(key)
+            line = ''.join(parts)
             if line:
-                line_set.add(line)
-        else:
-            # Recurse through index ranges.
-            for param_val in param_list[0][1]:
-                values[param_list[0][0]] = param_val
-                self._expand_graph(line, all_params,
-                                   param_list[1:], line_set, values)
+                yield line
@@ -495,9 +495,19 @@ def read_and_proc(
                     'Jinja2 Python package must be installed '
                     'to process file: ' + fpath
                 ) from None
-            flines = jinja2process(
-                fpath, flines, fdir, template_vars
-            )
+            if getattr(opts, 'template_cache', True):
+                from cylc.flow.parsec.template_cache import (
+                    cached_jinja2process
+                )
+                flines = cached_jinja2process(
+                    fpath, flines, fdir, template_vars, do_contin
+                )
+                # (continuation lines are concatenated before caching)
+                do_contin = False
+            else:
+                flines = jinja2process(
+                    fpath, flines, fdir, template_vars
+                )
 
     # concatenate continuation lines
     if do_contin:
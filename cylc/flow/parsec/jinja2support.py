@@ -18,6 +18,7 @@
 Importing code should catch ImportError in case Jinja2 is not installed.
 """
 
+from collections.abc import MutableMapping
 from contextlib import suppress
 from glob import glob
 import importlib
@@ -35,7 +36,9 @@ from jinja2 import (
     FileSystemLoader,
     StrictUndefined,
     TemplateNotFound,
-    TemplateSyntaxError)
+    TemplateSyntaxError,
+    meta,
+)
 
 from cylc.flow import LOG
 from cylc.flow.exceptions import InputError
@@ -49,6 +52,87 @@ TRACEBACK_LINENO = re.compile(
 CONTEXT_LINES = 3
 
 
+class Jinja2Dependencies:
+    """Record the inputs of a render other than the template and variables.
+
+    This is used to determine whether a cached render is still valid, see
+    cylc.flow.parsec.template_cache.
+    """
+
+    def __init__(self):
+        # {template name: source (or None if not found)}
+        # for files loaded by Jinja2 include / import statements
+        self.templates: t.Dict[str, t.Optional[str]] = {}
+        # {name: value (or None if not set)}
+        # for environment variables read via the "environ" global
+        self.environ: t.Dict[str, t.Optional[str]] = {}
+        # names referenced, but not defined, by the templates
+        self.names: t.Set[str] = set()
+        # False if the render depends on something we can't track
+        self.cacheable = True
+
+    def find_names(self, env: Environment, *sources: str) -> None:
+        """Record the undeclared names referenced by templates."""
+        # (names defined as environment globals are considered "declared")
+        parser = env.overlay()
+        parser.globals = {}
+        for source in (*sources, *filter(None, self.templates.values())):
+            self.names.update(
+                meta.find_undeclared_variables(parser.parse(source))
+            )
+
+
+class RecordingEnviron(MutableMapping):
+    """Proxy for os.environ which records the variables read."""
+
+    def __init__(self, deps: Jinja2Dependencies):
+        self._deps = deps
+
+    def __getitem__(self, key):
+        value = os.environ.get(key)
+        self._deps.environ[key] = value
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        # a render with side effects must not be skipped
+        self._deps.cacheable = False
+        os.environ[key] = value
+
+    def __delitem__(self, key):
+        self._deps.cacheable = False
+        del os.environ[key]
+
+    def __iter__(self):
+        self._deps.cacheable = False
+        return iter(os.environ)
+
+    def __len__(self):
+        self._deps.cacheable = False
+        return len(os.environ)
+
+
+class RecordingFileSystemLoader(FileSystemLoader):
+    """FileSystemLoader which records the templates it loads."""
+
+    def __init__(self, searchpath, deps: Jinja2Dependencies):
+        super().__init__(searchpath)
+        self._deps = deps
+
+    def get_source(self, environment, template):
+        try:
+            source, filename, uptodate = super().get_source(
+                environment, template
+            )
+        except TemplateNotFound:
+            # (the file might be created later)
+            self._deps.templates[template] = None
+            raise
+        self._deps.templates[template] = source
+        return source, filename, uptodate
+
+
 class PyModuleLoader(BaseLoader):
     """Load python module as Jinja2 template.
 
@@ -58,10 +142,15 @@ class PyModuleLoader(BaseLoader):
     # no source access for this loader
     has_source_access = False
 
-    def __init__(self, prefix='__python__'):
-        self._templates = {}
+    def __init__(
+        self,
+        prefix='__python__',
+        deps: t.Optional[Jinja2Dependencies] = None,
+    ):
+        self._templates: t.Dict[str, t.Any] = {}
         # prefix that can be used to avoid name collisions with template files
         self._python_namespace_prefix = prefix + '.'
+        self._deps = deps
 
     def load(
         self,
@@ -78,6 +167,9 @@ class PyModuleLoader(BaseLoader):
             mdict = __import__(name, fromlist=['*']).__dict__
         except ImportError:
             raise TemplateNotFound(name) from None
+        if self._deps is not None:
+            # we can't tell what the module might do
+            self._deps.cacheable = False
 
         # inject module dict into the context of an empty template
         def root_render_func(context, *args, **kwargs):
@@ -149,15 +241,31 @@ def _load_jinja2_extensions():
     return jinja2_extensions
 
 
-def jinja2environment(dir_=None):
-    """Set up and return Jinja2 environment."""
+def jinja2environment(
+    dir_=None,
+    deps: t.Optional[Jinja2Dependencies] = None,
+):
+    """Set up and return Jinja2 environment.
+
+    Args:
+        dir_:
+            The directory to load templates from (defaults to the cwd).
+        deps:
+            If provided, the inputs read by templates are recorded here.
+
+    """
     if dir_ is None:
         dir_ = os.getcwd()
 
+    if deps is None:
+        file_loader = FileSystemLoader(dir_)
+    else:
+        file_loader = RecordingFileSystemLoader(dir_, deps)
+
     # Ignore bandit false positive: B701:jinja2_autoescape_false
     # This env is not used to render content that is vulnerable to XSS.
     env = Environment(  # nosec
-        loader=ChoiceLoader([FileSystemLoader(dir_), PyModuleLoader()]),
+        loader=ChoiceLoader([file_loader, PyModuleLoader(deps=deps)]),
         undefined=StrictUndefined,
         extensions=['jinja2.ext.do'])
 
@@ -193,7 +301,9 @@ def jinja2environment(dir_=None):
 
     # Import WORKFLOW HOST USER ENVIRONMENT into template:
     # (Usage e.g.: {{environ['HOME']}}).
-    env.globals['environ'] = os.environ
+    env.globals['environ'] = (
+        os.environ if deps is None else RecordingEnviron(deps)
+    )
     env.globals['raise'] = raise_helper
     env.globals['assert'] = assert_helper
 
@@ -249,6 +359,7 @@ def jinja2process(
     flines: t.List[str],
     dir_: str,
     template_vars: t.Optional[t.Dict[str, t.Any]] = None,
+    deps: t.Optional[Jinja2Dependencies] = None,
 ) -> t.List[str]:
     """Pass configure file through Jinja2 processor.
 
@@ -261,6 +372,8 @@ def jinja2process(
             The path to the configuration directory.
         template_vars:
             Dictionary of template variables.
+        deps:
+            If provided, the inputs read by the render are recorded here.
 
     """
     # Load file lines into a template, excluding '#!jinja2' so that
@@ -280,9 +393,12 @@ def jinja2process(
     # AND TYPEERROR (e.g. for not using "|int" filter on number inputs.
     # Convert unicode to plain str, ToDo - still needed for parsec?)
     try:
-        env = jinja2environment(dir_)
-        template = env.from_string('\n'.join(flines[1:]))
+        env = jinja2environment(dir_, deps)
+        source = '\n'.join(flines[1:])
+        template = env.from_string(source)
         lines = str(template.render(template_vars)).splitlines()
+        if deps is not None:
+            deps.find_names(env, source)
     except TemplateSyntaxError as exc:
         filename = None
         # extract source lines
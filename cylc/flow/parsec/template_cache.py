@@ -0,0 +1,362 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Cache the output of the Jinja2 template processor.
+
+Rendering a templated workflow configuration can account for much of the
+time taken to load it and the same configuration is often rendered many
+times with the same inputs (e.g. "cylc vip" validates a workflow, then
+plays it).
+
+Rendered lines are stored on disk, keyed by a hash of:
+
+* The template (i.e. the file with any Cylc include-files inlined).
+* The template variables.
+* Whether continuation lines are concatenated (this is done before caching
+  as, for large configurations, it costs more than loading the cache).
+* The Cylc version.
+* The Python modules the template can call (custom Jinja2 filters, tests and
+  globals and the workflow's "lib/python" directory).
+
+Each entry also records the other inputs the render read, i.e. files loaded
+by Jinja2 include/import statements, environment variables read via
+"environ" and "CYLC_" variables. An entry is only used if these are
+unchanged.
+
+Renders which import Python modules via "__python__" or which iterate over
+or change the environment are not cached.
+
+Use "--no-template-cache" to bypass the cache.
+
+The inputs of renders can also be recorded (see "record_renders") so that
+the output of a larger process, which includes the render, can be cached
+(e.g. the global configuration).
+"""
+
+from contextlib import contextmanager, suppress
+from hashlib import sha256
+import json
+import os
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
+)
+
+from cylc.flow import LOG, __version__
+from cylc.flow.hostuserutil import get_user_home
+from cylc.flow.parsec.fileparse import _concatenate, get_cylc_env_vars
+
+if TYPE_CHECKING:
+    from cylc.flow.parsec.jinja2support import Jinja2Dependencies
+
+
+# the cache directory (relative to $HOME)
+TEMPLATE_CACHE = Path('.cylc', 'flow', 'template-cache')
+
+# the number of renders to keep
+TEMPLATE_CACHE_MAX_ENTRIES = 64
+
+# change this to invalidate existing entries
+TEMPLATE_CACHE_VERSION = 1
+
+# directories of Python modules which templates can use
+MODULE_DIRS = (
+    Path('lib', 'python'),
+    Path('Jinja2Filters'),
+    Path('Jinja2Tests'),
+    Path('Jinja2Globals'),
+)
+
+# lists to add the inputs of renders to (see record_renders)
+_RENDER_RECORDS: List[List[Optional[Dict[str, Any]]]] = []
+
+
+def get_cache_dir() -> Path:
+    """Return the template cache directory."""
+    return Path(os.getenv('HOME') or get_user_home(), TEMPLATE_CACHE)
+
+
+def _digest(text: Optional[str]) -> Optional[str]:
+    if text is None:
+        return None
+    return sha256(text.encode()).hexdigest()
+
+
+def _read(path: Union[Path, str]) -> Optional[str]:
+    try:
+        return Path(path).read_text()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def get_module_dirs(fdir: Union[Path, str]) -> List[Path]:
+    """Return the directories of Python modules a template can use."""
+    dirs = [Path(fdir, path) for path in MODULE_DIRS]
+    home = os.getenv('HOME')
+    if home:
+        dirs.extend(
+            Path(home, '.cylc', path) for path in MODULE_DIRS[1:]
+        )
+    return dirs
+
+
+def get_modules_digest(fdir: Union[Path, str]) -> str:
+    """Return a hash of the Python modules a template can use."""
+    hasher = sha256()
+    for module_dir in get_module_dirs(fdir):
+        for path in sorted(module_dir.rglob('*.py')):
+            hasher.update(str(path.relative_to(module_dir)).encode())
+            hasher.update(b'\0')
+            hasher.update((_read(path) or '').encode())
+            hasher.update(b'\0')
+    return hasher.hexdigest()
+
+
+def get_key(
+    flines: List[str],
+    fdir: Union[Path, str],
+    template_vars: Dict[str, Any],
+    concatenate: bool,
+) -> str:
+    """Return the cache key for a render.
+
+    Args:
+        flines:
+            The template lines (including the "#!jinja2" line).
+        fdir:
+            The directory the template is rendered in.
+        template_vars:
+            The template variables.
+        concatenate:
+            Whether continuation lines are concatenated.
+
+    """
+    hasher = sha256()
+
+    def update(text: str) -> None:
+        hasher.update(text.encode())
+        hasher.update(b'\0')
+
+    update(str(TEMPLATE_CACHE_VERSION))
+    update(__version__)
+    update(str(concatenate))
+    update(repr(sorted(
+        (key, value)
+        for key, value in template_vars.items()
+        # (derived from the other template vars)
+        if key != 'CYLC_TEMPLATE_VARS'
+    )))
+    update(get_modules_digest(fdir))
+    update('\n'.join(flines))
+    return hasher.hexdigest()
+
+
+def _is_current(entry: Dict[str, Any], fdir: Union[Path, str]) -> bool:
+    """Return True if the inputs a render read are unchanged.
+
+    Args:
+        entry:
+            A cache entry or render record.
+        fdir:
+            The directory the template was rendered in.
+
+    """
+    try:
+        for name, digest in entry['templates'].items():
+            if _digest(_read(Path(fdir, name))) != digest:
+                return False
+        for key, value in entry['environ'].items():
+            if os.environ.get(key) != value:
+                return False
+        cylc_env_vars = get_cylc_env_vars()
+        for key, value in entry['globals'].items():
+            if cylc_env_vars.get(key) != value:
+                return False
+    except (KeyError, AttributeError):
+        return False
+    return True
+
+
+def load(path: Path, fdir: Union[Path, str]) -> Optional[List[str]]:
+    """Return the rendered lines from a cache entry.
+
+    Returns None if there is no entry or it is out of date.
+    """
+    entry = _load_entry(path, fdir)
+    if entry is None:
+        return None
+    return entry['lines']
+
+
+def _load_entry(
+    path: Path, fdir: Union[Path, str]
+) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path) as entry_file:
+            entry = json.load(entry_file)
+    except (OSError, ValueError):
+        return None
+    if not _is_current(entry, fdir) or 'lines' not in entry:
+        return None
+    with suppress(OSError):
+        # keep recently used entries
+        os.utime(path)
+    return entry
+
+
+def get_dependencies(deps: 'Jinja2Dependencies') -> Dict[str, Any]:
+    """Return the inputs a render read in the format of a cache entry."""
+    cylc_env_vars = get_cylc_env_vars()
+    return {
+        'templates': {
+            name: _digest(source)
+            for name, source in deps.templates.items()
+        },
+        'environ': deps.environ,
+        'globals': {
+            name: cylc_env_vars.get(name)
+            for name in sorted(deps.names)
+            if name.startswith('CYLC_')
+        },
+    }
+
+
+def dump(
+    path: Path, lines: List[str], deps: 'Jinja2Dependencies'
+) -> None:
+    """Write a cache entry.
+
+    This is only a cache, failure to write it is not an error.
+    """
+    tmp = path.with_name(f'{path.name}.{os.getpid()}')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, 'w') as entry_file:
+            json.dump(
+                {**get_dependencies(deps), 'lines': lines},
+                entry_file,
+            )
+        os.replace(tmp, path)
+    except OSError as exc:
+        LOG.debug(f'Could not write to the template cache: {exc}')
+        with suppress(OSError):
+            tmp.unlink()
+        return
+    prune(path.parent)
+
+
+def prune(cache_dir: Path) -> None:
+    """Remove the least recently used entries from the cache."""
+    entries = []
+    for path in cache_dir.glob('*.json'):
+        with suppress(OSError):
+            entries.append((path.stat().st_mtime_ns, path))
+    entries.sort()
+    for _, path in entries[:-TEMPLATE_CACHE_MAX_ENTRIES]:
+        with suppress(OSError):
+            path.unlink()
+
+
+def jinja2process(*args, **kwargs) -> List[str]:
+    """Render a template, see jinja2support.jinja2process.
+
+    (Jinja2 is only imported if a template is rendered, this module is
+    also used to check whether recorded renders are current.)
+    """
+    from cylc.flow.parsec.jinja2support import jinja2process
+    return jinja2process(*args, **kwargs)
+
+
+def cached_jinja2process(
+    fpath: str,
+    flines: List[str],
+    dir_: str,
+    template_vars: Dict[str, Any],
+    concatenate: bool = False,
+) -> List[str]:
+    """Pass configure file through Jinja2 processor, using the cache.
+
+    Args and return value as for jinja2support.jinja2process, plus:
+
+    Args:
+        concatenate:
+            If True, concatenate continuation lines in the output.
+
+    """
+    key = get_key(flines, dir_, template_vars, concatenate)
+    path = get_cache_dir() / f'{key}.json'
+    entry = _load_entry(path, dir_)
+    if entry is not None:
+        LOG.debug(f'Loaded Jinja2 output from the template cache: {path}')
+        _record_render(dir_, entry)
+        return entry['lines']
+    from cylc.flow.parsec.jinja2support import Jinja2Dependencies
+    deps = Jinja2Dependencies()
+    lines = jinja2process(fpath, flines, dir_, template_vars, deps)
+    if concatenate:
+        lines = _concatenate(lines)
+    if deps.cacheable:
+        dump(path, lines, deps)
+        _record_render(dir_, get_dependencies(deps))
+    else:
+        _record_render(dir_, None)
+    return lines
+
+
+@contextmanager
+def record_renders() -> Iterator[List[Optional[Dict[str, Any]]]]:
+    """Record the inputs of the renders performed within this context.
+
+    Yields a list which is populated with a record of the inputs of each
+    render (use "is_current_render" to check whether these are unchanged).
+    Renders which depend on something that can't be tracked are recorded as
+    None.
+    """
+    records: List[Optional[Dict[str, Any]]] = []
+    _RENDER_RECORDS.append(records)
+    try:
+        yield records
+    finally:
+        _RENDER_RECORDS.remove(records)
+
+
+def _record_render(
+    fdir: Union[Path, str], entry: Optional[Dict[str, Any]]
+) -> None:
+    if not _RENDER_RECORDS:
+        return
+    record = None
+    if entry is not None:
+        record = {
+            'fdir': str(fdir),
+            'modules': get_modules_digest(fdir),
+            'templates': entry['templates'],
+            'environ': entry['environ'],
+            'globals': entry['globals'],
+        }
+    for records in _RENDER_RECORDS:
+        records.append(record)
+
+
+def is_current_render(record: Dict[str, Any]) -> bool:
+    """Return True if the inputs of a recorded render are unchanged.
+
+    Note the template itself and its variables are not recorded, the caller
+    is responsible for these.
+    """
+    return (
+        get_modules_digest(record['fdir']) == record['modules']
+        and _is_current(record, record['fdir'])
+    )
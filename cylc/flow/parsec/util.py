@@ -217,6 +217,59 @@ def replicate(target, source):
             target[key] = val
 
 
+def replicate_shared(base, sources):
+    """Return base with each of sources replicated into it.
+
+    Equivalent to replicating base then each source into an empty pdict,
+    except that the sections (and lists) of base which none of the sources
+    override are shared with base, rather than copied. Shared items must not
+    be modified in-place.
+
+    Examples:
+        >>> base = {'a': 1, 'b': {'x': 1}, 'c': {'y': 1}}
+        >>> result = replicate_shared(base, [{'a': 2, 'c': {'z': 2}}])
+        >>> result['a'], dict(result['b']), dict(result['c'])
+        (2, {'x': 1}, {'y': 1, 'z': 2})
+        >>> result['b'] is base['b']
+        True
+        >>> base['c']
+        {'y': 1}
+
+    """
+    target = OrderedDictWithDefaults()
+    if base:
+        if hasattr(base, 'defaults_'):
+            target.defaults_ = base.defaults_
+        for key, val in base.items():
+            target[key] = val
+    # sections copied from base (which can be modified in-place)
+    copied = set()
+    for source in sources:
+        if not source:
+            continue
+        if hasattr(source, "defaults_"):
+            target.defaults_ = pdeepcopy(source.defaults_)
+        for key, val in source.items():
+            if isinstance(val, dict):
+                if not val and key in target:
+                    # (nothing to override)
+                    continue
+                if key not in copied:
+                    section = OrderedDictWithDefaults()
+                    if key in target:
+                        replicate(section, target[key])
+                    target[key] = section
+                    copied.add(key)
+                if hasattr(val, 'defaults_'):
+                    target[key].defaults_ = pdeepcopy(val.defaults_)
+                replicate(target[key], val)
+            elif isinstance(val, list):
+                target[key] = val[:]
+            else:
+                target[key] = val
+    return target
+
+
 def pdeepcopy(source):
     """Make a deep copy of a pdict source"""
     target = OrderedDictWithDefaults()
@@ -257,11 +310,17 @@ def m_override(target, sparse):
 
     Target keys must already exist unless there is a "__MANY__" placeholder in
     the right position.
+
+    Sections which are shared in the sparse pdict (i.e. the same object
+    appears in more than one place) are also shared in the target, where the
+    target does not already contain them.
     """
     if not sparse:
         return
     stack = deque([(sparse, target, [], OrderedDictWithDefaults())])
     defaults_list = []
+    # {(id(sparse section), id(its many defaults)): target section}
+    added = {}
     while stack:
         source, dest, keylist, many_defaults = stack.popleft()
         if many_defaults:
@@ -285,7 +344,12 @@ def m_override(target, sparse):
                             "parsec dict override: no __MANY__ placeholder" +
                             "%s" % (keylist + [key])
                         )
-                    dest[key] = OrderedDictWithDefaults()
+                    added_key = (id(val), id(child_many_defaults))
+                    if added_key in added:
+                        # shared section, this has already been added
+                        dest[key] = added[added_key]
+                        continue
+                    dest[key] = added[added_key] = OrderedDictWithDefaults()
 
                 stack.append(
                     (val, dest[key], keylist + [key], child_many_defaults))
@@ -315,10 +379,16 @@ def m_override(target, sparse):
         dest_dict.defaults_ = defaults
 
 
-def un_many(cfig):
-    """Remove any '__MANY__' items from a nested dict, in-place."""
+def un_many(cfig, _seen=None):
+    """Remove any '__MANY__' items from a nested dict, in-place.
+
+    Dicts which appear more than once in the tree (e.g. sections shared
+    between namespaces) are only processed once.
+    """
     if not cfig:
         return
+    if _seen is None:
+        _seen = set()
     for key, val in list(cfig.items()):
         if key == '__MANY__':
             try:
@@ -331,8 +401,9 @@ def un_many(cfig):
                     raise
                 del cfig.defaults_[key]
 
-        elif isinstance(val, dict):
-            un_many(cfig[key])
+        elif isinstance(val, dict) and id(val) not in _seen:
+            _seen.add(id(val))
+            un_many(val, _seen)
 
 
 def itemstr(parents=None, item=None, value=None):
@@ -25,8 +25,9 @@ Also provides default values from the spec as a nested dict.
 import re
 import shlex
 from collections import deque
+from copy import copy
 from textwrap import dedent
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 from metomi.isodatetime.data import Duration, TimePoint
 from metomi.isodatetime.dumpers import TimePointDumper
@@ -147,6 +148,9 @@ class ParsecValidator:
         )
     }
 
+    # Value types whose coercion must not be memoised
+    UNMEMOISED: Set[str] = set()
+
     def __init__(self):
         self.coercers = {
             self.V_BOOLEAN: self.coerce_boolean,
@@ -160,6 +164,10 @@ class ParsecValidator:
             self.V_SPACELESS_STRING_LIST: self.coerce_spaceless_str_list,
             self.V_ABSOLUTE_HOST_LIST: self.coerce_absolute_host_list
         }
+        # {id(spec section): (spec section, dispatch table)}
+        self._compiled: Dict[int, Tuple[Any, Dict[str, tuple]]] = {}
+        # {(value type, raw value): coerced value}
+        self._coerced: Dict[Tuple[str, str], Any] = {}
 
     def validate(self, cfg_root, spec_root):
         """Validate and coerce a nested dict against a parsec spec.
@@ -178,15 +186,18 @@ class ParsecValidator:
         while queue:
             # Walk items, breadth first
             cfg, spec, keys = queue.popleft()
+            table = self._compile_section(spec)
+            many = table.get('__MANY__')
             for key, value in cfg.items():
-                if key not in spec:
-                    if '__MANY__' not in spec:
+                item = table.get(key)
+                if item is None:
+                    if many is None:
                         raise IllegalItemError(keys, key)
                     else:
                         # only accept the item if its value is of the same type
                         # as that of the __MANY__  item, i.e. dict or not-dict.
                         val_is_dict = isinstance(value, dict)
-                        spc_is_dict = not spec['__MANY__'].is_leaf()
+                        spc_is_dict = many[1]
                         if (
                             keys != ['scheduling', 'graph'] and
                             not val_is_dict and
@@ -201,14 +212,10 @@ class ParsecValidator:
                             or (not val_is_dict and not spc_is_dict)
                         ):
                             raise IllegalItemError(keys, key)
-                        speckey = '__MANY__'
-
-                else:
-                    speckey = key
-                specval = spec[speckey]
+                        item = many
+                specval, spec_is_section, coercer, voptions = item
 
                 cfg_is_section = isinstance(value, dict)
-                spec_is_section = not specval.is_leaf()
                 if cfg_is_section and not spec_is_section:
                     # config is a [section] but it should be a setting=
                     raise IllegalItemError(
@@ -229,9 +236,10 @@ class ParsecValidator:
                     queue.append([value, specval, keys + [key]])
                 elif value is not None and not spec_is_section:
                     # Item is value, coerce according to value type
-                    cfg[key] = self.coercers[specval.vdr](value, keys + [key])
-                    if specval.options:
-                        voptions = {*specval.options, *specval.depr_options}
+                    cfg[key] = self._coerce(
+                        specval.vdr, coercer, value, keys + [key]
+                    )
+                    if voptions:
                         if isinstance(cfg[key], list):
                             bad = [
                                 str(i) for i in cfg[key] if i not in voptions
@@ -255,6 +263,54 @@ class ParsecValidator:
                                 'option', [*keys, key], cfg[key]
                             )
 
+    def _compile_section(self, spec):
+        """Return the dispatch table for the items of a spec section.
+
+        The table maps each item name (including ``__MANY__``) to a tuple of:
+        (spec node, is section, coercer, allowed options). It is built once
+        per spec section, so repeated sections of the configuration (e.g.
+        runtime namespaces) do not repeat the spec lookups.
+        """
+        if id(spec) in self._compiled:
+            return self._compiled[id(spec)][1]
+        table = {}
+        for specval in spec:
+            if specval.is_leaf():
+                table[specval.name] = (
+                    specval,
+                    False,
+                    self.coercers[specval.vdr],
+                    (
+                        {*specval.options, *specval.depr_options}
+                        if specval.options
+                        else None
+                    ),
+                )
+            else:
+                table[specval.name] = (specval, True, None, None)
+        # (hold a reference to the spec so that its id cannot be reused)
+        self._compiled[id(spec)] = (spec, table)
+        return table
+
+    def _coerce(self, vdr, coercer, value, keys):
+        """Coerce a value, reusing the result for identical raw values.
+
+        Configurations often repeat the same raw values many times over
+        (e.g. in generated runtime namespaces), so successful coercions of
+        string values are memoised by value type. Coercers which depend on
+        the item name are never memoised. Lists are copied so that each
+        item gets its own.
+        """
+        if vdr in self.UNMEMOISED or type(value) is not str:
+            return coercer(value, keys)
+        try:
+            result = self._coerced[(vdr, value)]
+        except KeyError:
+            result = self._coerced[(vdr, value)] = coercer(value, keys)
+        if isinstance(result, list):
+            return copy(result)
+        return result
+
     __call__ = validate
 
     @classmethod
@@ -689,6 +745,9 @@ class CylcConfigValidator(ParsecValidator):
     V_PARAMETER_LIST = 'V_PARAMETER_LIST'
     V_XTRIGGER = 'V_XTRIGGER'
 
+    # (xtrigger contexts are mutable and labelled with the item name)
+    UNMEMOISED = {V_XTRIGGER}
+
     V_TYPE_HELP: dict = {
         # V_TYPE: (quick_name, help_string, examples_list, see_also)
         V_CYCLE_POINT: (
@@ -18,6 +18,7 @@
 Dummy mode shares settings with simulation mode.
 """
 
+from copy import copy
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -106,6 +107,8 @@ def configure_dummy_mode(rtc: Dict[str, Any], fallback: str) -> None:
     disable_platforms(rtc)
     # Disable environment, in case it depends on env-script.
     rtc['environment'] = {}
+    # (the simulation section may be shared with other tasks)
+    rtc['simulation'] = copy(rtc['simulation'])
     rtc["simulation"][
         "fail cycle points"
     ] = parse_fail_cycle_points(
@@ -16,6 +16,7 @@
 """Utilities supporting simulation mode
 """
 
+from copy import copy
 from dataclasses import dataclass
 from logging import INFO
 from time import time
@@ -228,6 +229,8 @@ def configure_sim_mode(rtc, fallback, warnonly: bool = True):
     # Disable environment, in case it depends on env-script.
     rtc['environment'] = {}
 
+    # (the simulation section may be shared with other tasks)
+    rtc['simulation'] = copy(rtc['simulation'])
     rtc["simulation"][
         "fail cycle points"
     ] = parse_fail_cycle_points(
@@ -269,6 +272,8 @@ def disable_platforms(
     """
     for section, keys in FORBIDDEN_WITH_PLATFORM.items():
         if section in rtc:
+            # (the section may be shared with other tasks)
+            rtc[section] = copy(rtc[section])
             for key in keys:
                 if key in rtc[section]:
                     rtc[section][key] = None
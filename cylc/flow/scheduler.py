@@ -1181,6 +1181,11 @@ class Scheduler:
             log_dir=self.workflow_log_dir,
             work_dir=self.workflow_work_dir,
             share_dir=self.workflow_share_dir,
+            snapshot=os.path.join(
+                self.workflow_run_dir,
+                workflow_files.WorkflowFiles.Service.DIRNAME,
+                workflow_files.WorkflowFiles.Service.CONFIG_SNAPSHOT,
+            ),
         )
 
     def apply_new_config(self, config, is_reload=False):
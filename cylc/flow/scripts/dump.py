@@ -249,7 +249,12 @@ async def dump(workflow_id, options, write=print):
         'variables': {'wFlows': [workflow_id], 'sortBy': sort_args}
     }
 
-    workflows = await pclient.async_request('graphql', query_kwargs)
+    workflows = await pclient.async_request(
+        'graphql',
+        query_kwargs,
+        # the response may be large, don't hold up the scheduler encoding it
+        req_meta={'chunked_response': True},
+    )
 
     try:
         for summary in workflows['workflows']:
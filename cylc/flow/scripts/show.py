@@ -297,7 +297,9 @@ async def prereqs_and_outputs_query(
             'taskIds': ids_list,
         }
     }
-    results = await pclient.async_request('graphql', tp_kwargs)
+    results = await pclient.async_request(
+        'graphql', tp_kwargs, req_meta={'chunked_response': True}
+    )
     task_proxies = sorted(results['taskProxies'],
                           key=lambda proxy: proxy['id'])
     multi = len(task_proxies) > 1
@@ -465,7 +467,9 @@ async def task_meta_query(
         },
     }
     # Print workflow info.
-    results = await pclient.async_request('graphql', tasks_kwargs)
+    results = await pclient.async_request(
+        'graphql', tasks_kwargs, req_meta={'chunked_response': True}
+    )
     multi = len(results['tasks']) > 1
     for task in results['tasks']:
         flat_data = flatten_data(task['meta'])
@@ -21,20 +21,41 @@
 (This command is for internal use.)
 
 Invoke workflow subscriber to receive published workflow output.
+
+Use the filter options to have the scheduler publish only the matching
+data-store elements (and fields) under a dedicated topic, e.g:
+
+  # the state totals of the workflow only
+  $ cylc subscribe --filter-types=workflow --filter-fields=state_totals WID
+
+  # the task states of cycle point 2000 only
+  $ cylc subscribe --filter-types=task_proxies --filter-fields=state \\
+      --filter-min-point=2000 --filter-max-point=2000 WID
+
+The filter options cannot be combined with --topics.
 """
 
+import asyncio
+from contextlib import suppress
 import json
 import sys
 import time
 
 from google.protobuf.json_format import MessageToDict
 
-from cylc.flow.exceptions import ClientError
+from cylc.flow.exceptions import (
+    ClientError,
+    ClientTimeout,
+    CylcError,
+    InputError,
+)
 from cylc.flow.option_parsers import (
     WORKFLOW_ID_ARG_DOC,
     CylcOptionParser as COP,
 )
 from cylc.flow.network import get_location
+from cylc.flow.network.client_factory import get_client
+from cylc.flow.network.publish_filter import FILTER_TTL
 from cylc.flow.network.subscriber import WorkflowSubscriber, process_delta_msg
 from cylc.flow.terminal import cli_function
 from cylc.flow.data_store_mgr import DELTAS_MAP
@@ -69,21 +90,103 @@ def get_option_parser() -> COP:
                  "' and '" + delta_keys[-1] + "'.")
     parser.add_option(
         "-T", "--topics",
-        help="Specify a comma delimited list of subscription topics. "
-        + pb_topics,
-        action="store", dest="topics", default='workflow')
+        help="Specify a comma delimited list of subscription topics"
+        " (default 'workflow'). " + pb_topics,
+        action="store", dest="topics", default=None)
 
     parser.add_option(
         "-o", "--once",
         help="Show a single publish then exit.",
         action="store_true", default=False, dest="once")
 
+    parser.add_option(
+        "--filter-types",
+        help="Subscribe to filtered deltas of these (comma delimited)"
+        " data-store element types only.",
+        action="store", dest="filter_types", default=None)
+
+    parser.add_option(
+        "--filter-min-point",
+        help="Subscribe to filtered deltas excluding cycle points before"
+        " this point.",
+        action="store", dest="filter_min_point", default=None)
+
+    parser.add_option(
+        "--filter-max-point",
+        help="Subscribe to filtered deltas excluding cycle points after"
+        " this point.",
+        action="store", dest="filter_max_point", default=None)
+
+    parser.add_option(
+        "--filter-names",
+        help="Subscribe to filtered deltas of elements with names matching"
+        " these (comma delimited) globs only.",
+        action="store", dest="filter_names", default=None)
+
+    parser.add_option(
+        "--filter-fields",
+        help="Subscribe to filtered deltas including only these (comma"
+        " delimited) fields of each element.",
+        action="store", dest="filter_fields", default=None)
+
     return parser
 
 
+def get_filter_args(options) -> dict:
+    """Return the publish filter arguments from the command line options.
+
+    Examples:
+        >>> from types import SimpleNamespace
+        >>> get_filter_args(SimpleNamespace(
+        ...     filter_types='task_proxies,jobs',
+        ...     filter_min_point=None,
+        ...     filter_max_point='2',
+        ...     filter_names=None,
+        ...     filter_fields=None,
+        ... ))
+        {'element_types': ['task_proxies', 'jobs'], 'max_point': '2'}
+        >>> get_filter_args(SimpleNamespace(
+        ...     filter_types=None,
+        ...     filter_min_point=None,
+        ...     filter_max_point=None,
+        ...     filter_names=None,
+        ...     filter_fields=None,
+        ... ))
+        {}
+
+    """
+    args = {}
+    for key, value, is_list in (
+        ('element_types', options.filter_types, True),
+        ('min_point', options.filter_min_point, False),
+        ('max_point', options.filter_max_point, False),
+        ('names', options.filter_names, True),
+        ('fields', options.filter_fields, True),
+    ):
+        if value is not None:
+            args[key] = value.split(',') if is_list else value
+    return args
+
+
+async def renew_publish_filter(pclient, filter_args: dict) -> None:
+    """Renew the publish filter registration before it expires."""
+    while True:
+        await asyncio.sleep(FILTER_TTL / 4)
+        try:
+            await pclient.async_request(
+                'register_publish_filter', {**filter_args, 'renew': True}
+            )
+        except (ClientError, ClientTimeout, CylcError) as exc:
+            # the workflow may be shutting down, try again later
+            print(f'Failed to renew the publish filter: {exc}')
+
+
 @cli_function(get_option_parser)
 def main(_, options, *args):
     workflow_id = args[0]
+    filter_args = get_filter_args(options)
+    if filter_args and options.topics:
+        raise InputError('The filter options cannot be used with --topics')
 
     try:
         while True:
@@ -100,8 +203,14 @@ def main(_, options, *args):
     print(f'Connecting to tcp://{host}:{port}')
     topic_set = set()
     topic_set.add(b'shutdown')
-    for topic in options.topics.split(','):
-        topic_set.add(topic.encode('utf-8'))
+    filter_topic = None
+    if filter_args:
+        pclient = get_client(workflow_id, timeout=options.comms_timeout)
+        filter_topic = pclient('register_publish_filter', filter_args)
+        topic_set.add(filter_topic.encode('utf-8'))
+    else:
+        for topic in (options.topics or 'workflow').split(','):
+            topic_set.add(topic.encode('utf-8'))
 
     subscriber = WorkflowSubscriber(
         workflow_id,
@@ -118,6 +227,10 @@ def main(_, options, *args):
             once=options.once
         )
     )
+    if filter_topic:
+        subscriber.loop.create_task(
+            renew_publish_filter(pclient, filter_args)
+        )
 
     # run Python run
     try:
@@ -126,3 +239,8 @@ def main(_, options, *args):
         print('\nDisconnecting')
         subscriber.stop()
         sys.exit()
+    finally:
+        if filter_topic:
+            # the workflow may have shut down
+            with suppress(ClientError, ClientTimeout, CylcError):
+                pclient('deregister_publish_filter', {'topic': filter_topic})
@@ -75,10 +75,8 @@ VALIDATE_OPTIONS = [
     OptionSettings(
         ["--check-circular"],
         help=(
-            "Check for circular dependencies in graphs when the number of"
-            " tasks is greater than 100 (smaller graphs are always"
-            " checked). This can be slow when the number of"
-            " tasks is high."),
+            "Deprecated, graphs are now always checked for circular"
+            " dependencies. This option has no effect."),
         action="store_true",
         default=False,
         dest="check_circular",
@@ -19,7 +19,6 @@
 import re
 from typing import Optional, TYPE_CHECKING
 
-from cylc.flow.cycling.loader import get_point, standardise_point_string
 from cylc.flow.exceptions import PointParsingError
 from cylc.flow.id import Tokens
 
@@ -87,6 +86,8 @@ class TaskID:
 
         Used to process incoming command arguments.
         """
+        # import only when needed to avoid slowing CLI unnecessarily
+        from cylc.flow.cycling.loader import standardise_point_string
         try:
             point_string = standardise_point_string(point_string)
         except PointParsingError as exc:
@@ -102,6 +103,7 @@ class TaskID:
         point_string: str,
     ) -> 'Optional[PointBase]':
         """Return a standardised point."""
+        from cylc.flow.cycling.loader import get_point
         return get_point(cls.get_standardised_point_string(point_string))
 
     @classmethod
@@ -21,6 +21,9 @@ Send messages to:
 - The scheduler, if communication is possible.
 """
 
+from contextlib import suppress
+import fcntl
+import json
 from logging import (
     CRITICAL,
     ERROR,
@@ -28,8 +31,18 @@ from logging import (
     getLevelName,
 )
 import os
+from pathlib import Path
 import sys
-from typing import List
+from time import (
+    time,
+    time_ns,
+)
+from typing import (
+    TYPE_CHECKING,
+    List,
+    Optional,
+    Tuple,
+)
 
 from cylc.flow.exceptions import WorkflowStopped
 import cylc.flow.flags
@@ -47,11 +60,24 @@ from cylc.flow.task_outputs import (
 from cylc.flow.wallclock import get_current_time_string
 
 
+if TYPE_CHECKING:
+    from cylc.flow.network.client import WorkflowRuntimeClientBase
+
+
 CYLC_JOB_PID = "CYLC_JOB_PID"
 CYLC_JOB_INIT_TIME = "CYLC_JOB_INIT_TIME"
 CYLC_JOB_EXIT = "CYLC_JOB_EXIT"
 CYLC_JOB_EXIT_TIME = "CYLC_JOB_EXIT_TIME"
 CYLC_MESSAGE = "CYLC_MESSAGE"
+# Directory for spooling messages to be sent in batches (see spool_messages)
+CYLC_TASK_MESSAGE_SPOOL = "CYLC_TASK_MESSAGE_SPOOL"
+
+# Maximum number of spooled message sets to send in one request
+SPOOL_BATCH_SIZE = 100
+# Wait this long after failing to send spooled messages before retrying (s)
+SPOOL_RETRY_DELAY = 60
+SPOOL_LOCK = '.lock'
+SPOOL_RETRY = '.retry'
 
 ABORT_MESSAGE_PREFIX = "aborted"
 FAIL_MESSAGE_PREFIX = TASK_OUTPUT_FAILED
@@ -129,31 +155,190 @@ def send_messages(
     workflow: str, job_id: str, messages: List[list], event_time: str
 ) -> None:
     workflow = os.path.normpath(workflow)
+    spool_dir = os.getenv(CYLC_TASK_MESSAGE_SPOOL)
+    if spool_dir:
+        spool_messages(
+            workflow, Path(spool_dir), job_id, messages, event_time
+        )
+        return
+    pclient = _get_client(workflow)
+    if pclient is None:
+        return
+    mutation_kwargs = {
+        'request_string': MUTATION,
+        'variables': {
+            'wFlows': [workflow],
+            'taskJob': job_id,
+            'eventTime': event_time,
+            'messages': messages,
+        }
+    }
+    pclient('graphql', mutation_kwargs)
+
+
+def _get_client(workflow: str) -> 'Optional[WorkflowRuntimeClientBase]':
+    """Return a client for the workflow or None if messaging isn't possible.
+    """
     try:
-        pclient = get_client(workflow)
+        return get_client(workflow)
     except WorkflowStopped:
         # on a remote host this means the contact file is not present
         # either the workflow is stopped or the contact file is not present
         # on the job host (i.e. comms method is polling)
         # eitherway don't try messaging
-        return
+        return None
     except Exception as exc:
         print(f"{type(exc).__name__}: {exc}", file=sys.stderr)
         if cylc.flow.flags.verbosity > 1:
             import traceback
             traceback.print_exc()
         # cylc message shouldn't fail if the client can't initialize.
-        return
-    mutation_kwargs = {
-        'request_string': MUTATION,
-        'variables': {
-            'wFlows': [workflow],
-            'taskJob': job_id,
-            'eventTime': event_time,
-            'messages': messages,
+        return None
+
+
+def spool_messages(
+    workflow: str,
+    spool_dir: Path,
+    job_id: str,
+    messages: List[list],
+    event_time: str,
+) -> None:
+    """Spool messages, then send all spooled messages for the workflow.
+
+    Many jobs running at once on the same node each send their messages in
+    a separate process. To reduce the number of connections and requests
+    the scheduler has to handle, each process writes its messages to the
+    spool then waits its turn to send. The first process to get a turn
+    sends everything in the spool in a single request (see
+    get_batch_mutation_kwargs), later processes find their messages already
+    sent and return straight away.
+
+    If the messages cannot be sent they remain in the spool to be sent by
+    a later process (after SPOOL_RETRY_DELAY, so that waiting processes
+    don't each time out in turn).
+
+    Args:
+        workflow: Workflow ID.
+        spool_dir: The spool directory (should be local to the node).
+        job_id: Job identifier "CYCLE/TASK_NAME/SUBMIT_NUM".
+        messages: List of messages "[[severity, message], ...]".
+        event_time: The time the messages were recorded.
+
+    """
+    spool = spool_dir / workflow
+    spool.mkdir(parents=True, exist_ok=True)
+    name = f'{time_ns()}-{os.getpid()}'
+    tmp_file = spool / f'{name}.tmp'
+    spool_file = spool / f'{name}.json'
+    tmp_file.write_text(json.dumps([job_id, event_time, messages]))
+    # (rename is atomic, other processes never see a partial file)
+    tmp_file.rename(spool_file)
+
+    with open(spool / SPOOL_LOCK, 'a') as lock:
+        # wait for any other process sending messages from this spool
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if not spool_file.exists():
+            # sent by another process
+            return
+        retry_file = spool / SPOOL_RETRY
+        with suppress(FileNotFoundError):
+            if time() - retry_file.stat().st_mtime < SPOOL_RETRY_DELAY:
+                print(
+                    'Could not send messages recently, spooled for retry:'
+                    f' {spool_file}',
+                    file=sys.stderr,
+                )
+                return
+        try:
+            pclient = get_client(workflow)
+        except WorkflowStopped:
+            # the messages cannot be delivered, don't keep them
+            for path in spool.glob('*.json'):
+                path.unlink()
+            return
+        except Exception as exc:
+            retry_file.touch()
+            print(f"{type(exc).__name__}: {exc}", file=sys.stderr)
+            # cylc message shouldn't fail if the client can't initialize.
+            return
+        try:
+            flush_spool(pclient, workflow, spool)
+        except Exception:
+            retry_file.touch()
+            raise
+        with suppress(FileNotFoundError):
+            retry_file.unlink()
+
+
+def flush_spool(
+    pclient: 'WorkflowRuntimeClientBase', workflow: str, spool: Path
+) -> None:
+    """Send all spooled messages, in batches, in the order spooled.
+
+    Messages are removed from the spool once sent.
+    """
+    while True:
+        spool_files = sorted(spool.glob('*.json'))[:SPOOL_BATCH_SIZE]
+        if not spool_files:
+            return
+        batch = [
+            json.loads(spool_file.read_text()) for spool_file in spool_files
+        ]
+        pclient('graphql', get_batch_mutation_kwargs(workflow, batch))
+        for spool_file in spool_files:
+            spool_file.unlink()
+
+
+def get_batch_mutation_kwargs(
+    workflow: str, batch: List[Tuple[str, str, List[list]]]
+) -> dict:
+    """Return a request to send the messages of several jobs at once.
+
+    Args:
+        workflow: Workflow ID.
+        batch: List of (job_id, event_time, messages).
+
+    Examples:
+        >>> kwargs = get_batch_mutation_kwargs(
+        ...     'w', [('1/a/01', 'T1', [['INFO', 'x']]), ('1/b/01', 'T2', [])]
+        ... )
+        >>> print(kwargs['request_string'])  # doctest: +NORMALIZE_WHITESPACE
+        mutation ($wFlows: [WorkflowID]!,
+          $taskJob0: String!, $eventTime0: String, $messages0: [[String]],
+          $taskJob1: String!, $eventTime1: String, $messages1: [[String]]) {
+        m0: message(workflows: $wFlows, taskJob: $taskJob0,
+          eventTime: $eventTime0, messages: $messages0) { result }
+        m1: message(workflows: $wFlows, taskJob: $taskJob1,
+          eventTime: $eventTime1, messages: $messages1) { result }
         }
+        >>> kwargs['variables']['taskJob1']
+        '1/b/01'
+
+    """
+    args = ['$wFlows: [WorkflowID]!']
+    fields = []
+    variables: dict = {'wFlows': [workflow]}
+    for ind, (job_id, event_time, messages) in enumerate(batch):
+        args.append(
+            f'\n  $taskJob{ind}: String!, $eventTime{ind}: String,'
+            f' $messages{ind}: [[String]]'
+        )
+        fields.append(
+            f'm{ind}: message(workflows: $wFlows, taskJob: $taskJob{ind},'
+            f'\n  eventTime: $eventTime{ind}, messages: $messages{ind})'
+            ' { result }'
+        )
+        variables[f'taskJob{ind}'] = job_id
+        variables[f'eventTime{ind}'] = event_time
+        variables[f'messages{ind}'] = messages
+    return {
+        'request_string': (
+            f'mutation ({", ".join(args)}) {{\n'
+            + '\n'.join(fields)
+            + '\n}'
+        ),
+        'variables': variables,
     }
-    pclient('graphql', mutation_kwargs)
 
 
 def _append_job_status_file(workflow, job_id, event_time, messages):
@@ -95,7 +95,7 @@ from cylc.flow.workflow_status import StopMode
 from cylc.flow.scripts.set import XTRIGGER_PREREQ_PREFIX
 
 if TYPE_CHECKING:
-    from cylc.flow.config import WorkflowConfig
+    from cylc.flow.config import ConfigChanges, WorkflowConfig
     from cylc.flow.cycling import (
         IntervalBase,
         PointBase,
@@ -1097,11 +1097,30 @@ class TaskPool:
         if max_offset != orig and self.compute_runahead(force=True):
             self.release_runahead_tasks()
 
-    def reload(self, config: 'WorkflowConfig') -> None:
+    def reload(
+        self,
+        config: 'WorkflowConfig',
+        changes: Optional['ConfigChanges'] = None,
+    ) -> None:
+        """Reload the task pool with a new workflow config.
+
+        Args:
+            config:
+                The new workflow config.
+            changes:
+                The changes from the current config. If only the [runtime]
+                settings of namespaces have changed, only the tasks of these
+                namespaces are reloaded (see WorkflowConfig.get_changes).
+
+        """
+        old_config = self.config
         self.config = config   # store the updated config
         self.xtrigger_mgr.add_xtriggers(
             self.config.xtrigger_collator, reload=True)
-        self._reload_taskdefs()
+        if changes is not None and changes.runtime_only:
+            self._reload_changed_taskdefs(old_config, changes.namespaces)
+        else:
+            self._reload_taskdefs()
 
     def _reload_taskdefs(self) -> None:
         """Reload the definitions of task proxies in the pool.
@@ -1135,10 +1154,8 @@ class TaskPool:
         for name in orphans:
             if name not in (itask.tdef.name for itask in tasks):
                 LOG.info("Removed task: '%s'", name)
-        # Store lists of tasks which were active before reload.
-        warn_tasks: List[str] = []
-        _warn_tasks: List[str] = []
 
+        reload_tasks: List[TaskProxy] = []
         for itask in tasks:
             if itask.tdef.name in orphans:
                 if (
@@ -1156,35 +1173,8 @@ class TaskPool:
                         "- task definition removed"
                     )
             else:
-                new_task = TaskProxy(
-                    self.tokens,
-                    self.config.get_taskdef(itask.tdef.name),
-                    itask.point,
-                    itask.flow_nums,
-                    itask.state.status,
-                    sequential_xtrigger_labels=(
-                        self.xtrigger_mgr.xtriggers.sequential_xtrigger_labels
-                    ),
-                )
-                itask.copy_to_reload_successor(
-                    new_task,
-                    self.check_task_output,
-                )
-                self._swap_out(new_task)
-                self.data_store_mgr.delta_task_prerequisite(new_task)
-                LOG.info(f"[{itask}] reloaded task definition")
-
-                if itask.state(*TASK_STATUSES_ACTIVE):
-                    warn_tasks.append(str(itask))
-                elif itask.state(TASK_STATUS_PREPARING):
-                    # Job file might have been written at this point?
-                    _warn_tasks.append(str(itask))
-
-        for may, tasks in (('', warn_tasks), ('may be', _warn_tasks)):
-            if tasks:
-                _tasks = "\n * ".join(tasks)
-                LOG.info(
-                    f"Tasks {may} active with pre-reload settings:\n{_tasks}")
+                reload_tasks.append(itask)
+        self._reload_tasks(reload_tasks)
 
         # Reassign live tasks to the internal queue
         del self.task_queue_mgr
@@ -1207,6 +1197,82 @@ class TaskPool:
             if itask.is_ready_to_run() and not itask.state.is_runahead:
                 self.queue_task(itask)
 
+    def _reload_changed_taskdefs(
+        self, old_config: 'WorkflowConfig', namespaces: Set[str]
+    ) -> None:
+        """Reload the task proxies of namespaces whose runtime has changed.
+
+        The other task proxies are kept, with their definitions replaced by
+        the (equivalent) new ones. The graph and namespace hierarchy must be
+        unchanged (see ConfigChanges.runtime_only).
+
+        self.config should already be updated for the reload.
+        """
+        LOG.info("Reloading changed task definitions.")
+        for name, tdef in self.config.taskdefs.items():
+            # keep the elapsed times of previous jobs
+            tdef.elapsed_times = old_config.taskdefs[name].elapsed_times
+
+        reload_tasks: List[TaskProxy] = []
+        for itask in self.get_tasks():
+            if itask.tdef.name in namespaces:
+                if itask.state.is_queued:
+                    self.task_queue_mgr.remove_task(itask)
+                reload_tasks.append(itask)
+            else:
+                itask.tdef = self.config.get_taskdef(itask.tdef.name)
+
+        for itask in self._reload_tasks(reload_tasks):
+            self.data_store_mgr.delta_task_state(itask)
+            if itask.is_ready_to_run() and not itask.state.is_runahead:
+                self.queue_task(itask)
+
+    def _reload_tasks(self, itasks: Iterable[TaskProxy]) -> List[TaskProxy]:
+        """Replace task proxies with ones using their new definitions.
+
+        Existing outputs etc. are copied over to the new task proxies.
+
+        Returns the new task proxies.
+        """
+        new_tasks: List[TaskProxy] = []
+        # Store lists of tasks which were active before reload.
+        warn_tasks: List[str] = []
+        _warn_tasks: List[str] = []
+
+        for itask in itasks:
+            new_task = TaskProxy(
+                self.tokens,
+                self.config.get_taskdef(itask.tdef.name),
+                itask.point,
+                itask.flow_nums,
+                itask.state.status,
+                sequential_xtrigger_labels=(
+                    self.xtrigger_mgr.xtriggers.sequential_xtrigger_labels
+                ),
+            )
+            itask.copy_to_reload_successor(
+                new_task,
+                self.check_task_output,
+            )
+            self._swap_out(new_task)
+            self.data_store_mgr.delta_task_prerequisite(new_task)
+            LOG.info(f"[{itask}] reloaded task definition")
+            new_tasks.append(new_task)
+
+            if itask.state(*TASK_STATUSES_ACTIVE):
+                warn_tasks.append(str(itask))
+            elif itask.state(TASK_STATUS_PREPARING):
+                # Job file might have been written at this point?
+                _warn_tasks.append(str(itask))
+
+        for may, tasks in (('', warn_tasks), ('may be', _warn_tasks)):
+            if tasks:
+                _tasks = "\n * ".join(tasks)
+                LOG.info(
+                    f"Tasks {may} active with pre-reload settings:\n{_tasks}")
+
+        return new_tasks
+
     def set_stop_point(self, stop_point: 'PointBase') -> bool:
         """Set the workflow stop cycle point.
 
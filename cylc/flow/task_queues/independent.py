@@ -113,7 +113,13 @@ class IndepQueueManager(TaskQueueManagerBase):
         self.queues: Dict[str, LimitedTaskQueue] = {}
 
         # Add all task names to default queue membership list.
-        qconfig[self.Q_DEFAULT]['members'] = set(all_task_names)
+        # (Without modifying the workflow config, see
+        # WorkflowConfig.get_changes.)
+        qconfig = dict(qconfig)
+        qconfig[self.Q_DEFAULT] = {
+            'members': set(all_task_names),
+            'limit': qconfig[self.Q_DEFAULT]['limit'],
+        }
 
         # Expand family names in membership lists.
         queues: Dict[str, Any] = self._expand_families(
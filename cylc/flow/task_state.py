@@ -23,7 +23,6 @@ from typing import (
     Optional,
 )
 
-from cylc.flow.prerequisite import Prerequisite
 from cylc.flow.task_outputs import (
     TASK_OUTPUT_EXPIRED,
     TASK_OUTPUT_FAILED,
@@ -38,7 +37,10 @@ from cylc.flow.wallclock import get_current_time_string
 
 if TYPE_CHECKING:
     from cylc.flow.cycling import PointBase
-    from cylc.flow.prerequisite import PrereqTuple
+    from cylc.flow.prerequisite import (
+        Prerequisite,
+        PrereqTuple,
+    )
     from cylc.flow.taskdef import TaskDef
 
 
@@ -242,8 +244,8 @@ class TaskState:
         self.time_updated = None
 
         # Prerequisites.
-        self.prerequisites: List[Prerequisite] = []
-        self.suicide_prerequisites: List[Prerequisite] = []
+        self.prerequisites: List['Prerequisite'] = []
+        self.suicide_prerequisites: List['Prerequisite'] = []
         self._add_prerequisites(point, tdef)
 
         # External Triggers.
@@ -451,8 +453,8 @@ class TaskState:
 
         # Use dicts to avoid generating duplicate prerequisites from sequences
         # with coincident cycle points.
-        prerequisites: Dict[int, Prerequisite] = {}
-        suicide_prerequisites: Dict[int, Prerequisite] = {}
+        prerequisites: Dict[int, 'Prerequisite'] = {}
+        suicide_prerequisites: Dict[int, 'Prerequisite'] = {}
 
         for sequence, dependencies in tdef.dependencies.items():
             if not sequence.is_valid(point):
@@ -474,6 +476,8 @@ class TaskState:
                     adjusted.append(prv)
             if adjusted:
                 p_prev = max(adjusted)
+                # import only when needed to avoid slowing CLI unnecessarily
+                from cylc.flow.prerequisite import Prerequisite
                 cpre = Prerequisite(point)
                 cpre[(p_prev, tdef.name, TASK_STATUS_SUCCEEDED)] = (
                     p_prev < tdef.start_point
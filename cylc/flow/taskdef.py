@@ -16,12 +16,20 @@
 
 """Task definition."""
 
+from bisect import (
+    bisect_left,
+    insort,
+)
 from collections import deque
 from typing import (
     TYPE_CHECKING,
+    Deque,
     Dict,
+    Iterable,
+    Iterator,
     List,
     NamedTuple,
+    Optional,
     Set,
     Tuple,
 )
@@ -146,6 +154,81 @@ def generate_graph_parents(
     return graph_parents
 
 
+class ElapsedTimes:
+    """The elapsed times of the most recent jobs of a task.
+
+    Holds a rolling window of elapsed times along with a running total and a
+    sorted copy of the window, so the mean and quantiles are available
+    without re-scanning the window every time a job finishes.
+
+    Examples:
+        >>> times = ElapsedTimes(maxlen=3)
+        >>> times.mean() is None
+        True
+        >>> times.extend([10, 30, 20, 40])
+        >>> list(times)
+        [30, 20, 40]
+        >>> times.mean()
+        30.0
+        >>> times.quantile(0.5)
+        30.0
+        >>> times.quantile(0.95)
+        39.0
+
+    """
+
+    __slots__ = ('_times', '_sorted', '_total')
+
+    def __init__(self, maxlen: int):
+        self._times: Deque[float] = deque(maxlen=maxlen)
+        self._sorted: List[float] = []
+        self._total: float = 0
+
+    def append(self, elapsed_time: float) -> None:
+        """Add the elapsed time of a job, dropping the oldest if full."""
+        if len(self._times) == self._times.maxlen:
+            oldest = self._times.popleft()
+            self._total -= oldest
+            del self._sorted[bisect_left(self._sorted, oldest)]
+        self._times.append(elapsed_time)
+        self._total += elapsed_time
+        insort(self._sorted, elapsed_time)
+
+    def extend(self, elapsed_times: Iterable[float]) -> None:
+        for elapsed_time in elapsed_times:
+            self.append(elapsed_time)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._times)
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self._times)})'
+
+    def mean(self) -> Optional[float]:
+        """Return the mean elapsed time (None if there are none)."""
+        if not self._times:
+            return None
+        return self._total / len(self._times)
+
+    def quantile(self, quantile: float) -> Optional[float]:
+        """Return a quantile of the elapsed times (None if there are none).
+
+        Interpolates linearly between the closest ranks.
+        """
+        if not self._sorted:
+            return None
+        pos = quantile * (len(self._sorted) - 1)
+        lower = int(pos)
+        upper = min(lower + 1, len(self._sorted) - 1)
+        return (
+            self._sorted[lower]
+            + (self._sorted[upper] - self._sorted[lower]) * (pos - lower)
+        )
+
+
 class TaskDef:
     """Task definition."""
 
@@ -192,7 +275,7 @@ class TaskDef:
         self.external_triggers = []
         self.xtrig_labels = {}  # {sequence: [labels]}
 
-        self.elapsed_times = deque(maxlen=self.MAX_LEN_ELAPSED_TIMES)
+        self.elapsed_times = ElapsedTimes(self.MAX_LEN_ELAPSED_TIMES)
         self._add_std_outputs()
         self.has_abs_triggers = False
 
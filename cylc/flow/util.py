@@ -29,7 +29,10 @@ from typing import (
     Callable,
     Dict,
     Generator,
+    Iterable,
+    Iterator,
     List,
+    Mapping,
     Optional,
     Sequence,
     Set,
@@ -512,3 +515,80 @@ def get_connected_groups(
     for key in visited:
         if not visited[key]:
             yield visit(key, set())
+
+
+def get_strongly_connected_groups(
+    graph: Mapping[Key, Iterable[Key]],
+) -> Generator[Set[Key], None, None]:
+    """Extract strongly connected components in a directed graph.
+
+    This is Tarjan's algorithm, it runs in linear time in the size of the
+    graph. It is iterative rather than recursive so that long chains of
+    nodes don't hit the recursion limit.
+
+    Args:
+        graph:
+            The graph in the form of an adjacency dictionary where each node
+            is listed against its downstream nodes. Nodes with no downstream
+            nodes need not be listed.
+            e.g, {node: {downstream_node1, downstream_node2}, ...}
+
+    Yields:
+        Each strongly connected group within the graph (in reverse
+        topological order).
+
+    Example:
+        # a => b => c => a
+        # c => d => e
+        # e => e
+        >>> graph = {
+        ...     'a': {'b'},
+        ...     'b': {'c'},
+        ...     'c': {'a', 'd'},
+        ...     'd': {'e'},
+        ...     'e': {'e'},
+        ... }
+
+        >>> [sorted(group) for group in get_strongly_connected_groups(graph)]
+        [['e'], ['d'], ['a', 'b', 'c']]
+
+    """
+    index: Dict[Key, int] = {}
+    lowlink: Dict[Key, int] = {}
+    stack: List[Key] = []
+    on_stack: Set[Key] = set()
+
+    def push(key: Key) -> Tuple[Key, Iterator[Key]]:
+        index[key] = lowlink[key] = len(index)
+        stack.append(key)
+        on_stack.add(key)
+        return key, iter(graph.get(key, ()))
+
+    for root in graph:
+        if root in index:
+            continue
+        work = [push(root)]
+        while work:
+            key, downstream = work[-1]
+            for child in downstream:
+                if child not in index:
+                    # visit the child before carrying on with this node
+                    work.append(push(child))
+                    break
+                if child in on_stack:
+                    lowlink[key] = min(lowlink[key], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[key])
+                if lowlink[key] == index[key]:
+                    # this node is the root of a strongly connected group
+                    group = set()
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        group.add(member)
+                        if member == key:
+                            break
+                    yield group
@@ -242,6 +242,12 @@ class WorkflowFiles:
         Contains information about the execution and status of a workflow.
         """
 
+        CONFIG_SNAPSHOT = 'config-snapshot'
+        """The workflow configuration as last built by the scheduler.
+
+        See ``cylc.flow.config_snapshot``.
+        """
+
         PUBLIC_FILE_EXTENSION = '.key'
         PRIVATE_FILE_EXTENSION = '.key_secret'
         """Keyword identifiers used to form the certificate names.
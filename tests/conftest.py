@@ -24,7 +24,7 @@ import pytest
 
 from cylc.flow import LOG, flags
 from cylc.flow.cfgspec.glbl_cfg import glbl_cfg
-from cylc.flow.cfgspec.globalcfg import SPEC
+from cylc.flow.cfgspec.globalcfg import SPEC, GlobalConfig
 from cylc.flow.graphnode import GraphNodeParser
 from cylc.flow.parsec.config import ParsecConfig
 from cylc.flow.parsec.validate import cylc_config_validate
@@ -38,6 +38,9 @@ def before_each():
     LOG.setLevel(logging.NOTSET)
     # Reset graph node parser singleton:
     GraphNodeParser.get_inst().clear()
+    # Don't use the global config cache (tests often patch how the global
+    # config is loaded):
+    GlobalConfig.CACHE = False
 
 
 @pytest.fixture(scope='module')
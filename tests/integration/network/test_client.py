@@ -15,11 +15,16 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """Test cylc.flow.client.WorkflowRuntimeClient."""
+import asyncio
 import json
+from time import sleep
 from unittest.mock import Mock
 import pytest
 
-from cylc.flow.exceptions import ClientError
+from cylc.flow.exceptions import (
+    ClientError,
+    ClientTimeout,
+)
 from cylc.flow.network.client import WorkflowRuntimeClient
 from cylc.flow.network.server import PB_METHOD_MAP
 
@@ -46,6 +51,22 @@ async def test_graphql(harness):
     assert schd.workflow in workflow['id']
 
 
+async def test_graphql_chunked(harness, monkeypatch):
+    """It should join chunked responses back together."""
+    schd, client = harness
+    monkeypatch.setattr('cylc.flow.network.RESPONSE_CHUNK_SIZE', 10)
+    send_chunks = Mock(wraps=schd.server.replier._send_chunks)
+    monkeypatch.setattr(schd.server.replier, '_send_chunks', send_chunks)
+    request = {'request_string': 'query { workflows { id name } }'}
+    ret = await client.async_request(
+        'graphql', request, req_meta={'chunked_response': True}
+    )
+    assert send_chunks.called
+    assert ret == await client.async_request('graphql', request)
+    # the chunked response metadata should not leak into other requests
+    assert 'chunked_response' not in client.header['meta']
+
+
 async def test_protobuf(harness):
     """It should return True if running."""
     schd, client = harness
@@ -113,14 +134,86 @@ async def test_command_validation_failure(harness):
 async def test_async_request_err(
     one, start, monkeypatch: pytest.MonkeyPatch, sock_response, expected
 ):
-    async def mock_recv():
-        return json.dumps(sock_response).encode()
+    sent = asyncio.Queue()
+
+    async def mock_send_multipart(frames):
+        await sent.put(frames)
+
+    async def mock_recv_multipart():
+        req_id, *_ = await sent.get()
+        return [req_id, b'', json.dumps(sock_response).encode()]
 
     async with start(one):
         client = WorkflowRuntimeClient(one.workflow)
         with monkeypatch.context() as mp:
-            mp.setattr(client, 'socket', Mock(recv=mock_recv))
-            mp.setattr(client, 'poller', Mock())
+            mp.setattr(client, 'socket', Mock(
+                send_multipart=mock_send_multipart,
+                recv_multipart=mock_recv_multipart,
+            ))
 
             with pytest.raises(ClientError, match=expected):
                 await client.async_request('graphql')
+
+
+async def test_concurrent_requests(harness):
+    """It should allow several requests in flight on one connection."""
+    schd, client = harness
+    responses = await asyncio.gather(*(
+        client.async_request(
+            'graphql',
+            {'request_string': f'query {{ workflows {{ id{i}: id }} }}'}
+        )
+        for i in range(10)
+    ))
+    assert [
+        response['workflows'][0][f'id{i}']
+        for i, response in enumerate(responses)
+    ] == [schd.id] * 10
+
+
+async def test_late_response(one, start, monkeypatch: pytest.MonkeyPatch):
+    """It should discard responses to requests which have timed out."""
+    async with start(one):
+        client = WorkflowRuntimeClient(one.workflow)
+        receiver = one.server.receiver
+
+        def slow_receiver(message):
+            sleep(0.5)
+            return receiver(message)
+
+        with monkeypatch.context() as mp:
+            mp.setattr(one.server, 'receiver', slow_receiver)
+            with pytest.raises(ClientTimeout):
+                await client.async_request('api', timeout=0.1)
+        # the late response to the first request must not be mistaken for
+        # the response to the next
+        assert await client.async_request(
+            'api', {'endpoint': 'api'}
+        ) == one.server.api('api')
+
+
+async def test_cancelled_request(one, start, monkeypatch: pytest.MonkeyPatch):
+    """It should forget requests which are cancelled by the caller."""
+    async with start(one):
+        client = WorkflowRuntimeClient(one.workflow)
+        receiver = one.server.receiver
+
+        def slow_receiver(message):
+            sleep(0.5)
+            return receiver(message)
+
+        with monkeypatch.context() as mp:
+            mp.setattr(one.server, 'receiver', slow_receiver)
+            task = asyncio.create_task(client.async_request('api'))
+            await asyncio.sleep(0.1)
+            assert client._pending
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        # nothing should be left in flight or waiting on the socket
+        assert not client._pending
+        assert client._receiver is None
+        assert await client.async_request(
+            'api', {'endpoint': 'api'}
+        ) == one.server.api('api')
+        client.stop(stop_loop=False)
@@ -270,6 +270,39 @@ async def test_task_proxies(harness):
     assert ret == {'workflows': [{'taskProxies': [{'id': ids[0].id}]}]}
 
 
+async def test_task_proxies_pagination(harness):
+    """It should return pages of results using the first/after args."""
+    schd, client, w_tokens = harness
+    query = '''
+        query ($first: Int, $after: ID) {
+            taskProxies (
+                sort: {keys: ["id"]}, first: $first, after: $after
+            ) { id }
+        }
+    '''
+    ids = [
+        w_tokens.duplicate(cycle='1', task=namespace).id
+        for namespace in ('a', 'b', 'c')
+    ]
+
+    pages = []
+    after = None
+    while True:
+        ret = await client.async_request(
+            'graphql',
+            {
+                'request_string': query,
+                'variables': {'first': 2, 'after': after},
+            }
+        )
+        page = [proxy['id'] for proxy in ret['taskProxies']]
+        pages.append(page)
+        if len(page) < 2:
+            break
+        after = page[-1]
+    assert pages == [ids[:2], ids[2:]]
+
+
 async def test_family_proxies(harness):
     schd, client, w_tokens = harness
 
@@ -490,3 +523,62 @@ async def test_subscription_deltas(one, start):
         }
         with suppress(GeneratorExit):
             await subscription.aclose()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_subscription_proxy_runtime(one, start):
+    """Updated deltas should only carry the runtime if it has changed."""
+    async with start(one):
+        await one.update_data_structure()
+        document, kwargs = gather_subscription_args(
+            one,
+            '''
+                subscription {
+                    deltas {
+                        added {
+                            taskProxies {
+                                runtime { completion }
+                            }
+                        }
+                        updated {
+                            taskProxies {
+                                isHeld
+                                runtime { completion }
+                            }
+                        }
+                    }
+                }
+            ''',
+        )
+        subscription = await subscribe(
+            schema.graphql_schema,
+            document,
+            **kwargs
+        )
+        aitem = await subscription.__anext__()
+        print("YYY", aitem)
+        assert aitem.data['deltas']['added']['taskProxies'] == [
+            {'runtime': {'completion': 'succeeded'}}
+        ]
+        one.data_store_mgr.delta_task_held(
+            'one', one.pool.get_tasks()[0].point, True
+        )
+        await one.update_data_structure()
+        btopic, delta, _ = one.data_store_mgr.publish_deltas[-1]
+        _, sub_queue = next(
+            iter(one.data_store_mgr.delta_queues[one.id].items())
+        )
+        sub_queue.put(
+            (
+                one.id,
+                btopic.decode('utf-8'),
+                create_delta_store(delta, one.id)
+            )
+        )
+        aitem = await subscription.__anext__()
+        assert aitem.data['deltas']['updated']['taskProxies'] == [
+            # (the runtime has not changed)
+            {'isHeld': True, 'runtime': {'completion': ''}}
+        ]
+        with suppress(GeneratorExit):
+            await subscription.aclose()
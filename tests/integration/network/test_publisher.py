@@ -15,6 +15,12 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
+from contextlib import suppress
+
+import pytest
+
+from cylc.flow.exceptions import CylcError
+from cylc.flow.network import server as server_module
 
 from cylc.flow.network.subscriber import (
     WorkflowSubscriber,
@@ -46,3 +52,82 @@ async def test_publisher(flow, scheduler, run, one_conf, port_range):
                 break
         else:
             raise Exception("Delta wasn't added or updated")
+
+
+async def test_publisher_filter(flow, scheduler, run, one_conf, port_range):
+    """It should publish filtered deltas to registered filter topics."""
+    id_ = flow(one_conf)
+    schd = scheduler(id_, paused_start=True)
+    async with run(schd):
+        topic = schd.server.register_publish_filter(
+            element_types=['workflow'],
+            fields=['status'],
+        )
+        subscriber = WorkflowSubscriber(
+            schd.workflow,
+            host=schd.host,
+            port=schd.server.pub_port,
+            topics=[topic.encode('utf-8')]
+        )
+
+        async with asyncio.timeout(5):
+            while True:
+                # cause something to be published (repeatedly, as the
+                # subscription takes a moment to connect)
+                schd.data_store_mgr.delta_log_record('INFO', 'hello')
+                with suppress(asyncio.TimeoutError):
+                    btopic, msg = await asyncio.wait_for(
+                        subscriber.socket.recv_multipart(), 0.5
+                    )
+                    break
+
+        topic_, delta = process_delta_msg(btopic, msg, None)
+        assert topic_ == topic
+        assert not delta.HasField('task_proxies')
+        assert {
+            field.name
+            for field, _ in delta.workflow.updated.ListFields()
+        } <= {'id', 'stamp', 'status'}
+
+        # identical filters should share the topic
+        assert schd.server.register_publish_filter(
+            element_types=['workflow'], fields=['status']
+        ) == topic
+        assert schd.server.deregister_publish_filter(topic)
+        assert topic in schd.server.publish_filters
+        assert schd.server.deregister_publish_filter(topic)
+        assert topic not in schd.server.publish_filters
+        assert not schd.server.deregister_publish_filter(topic)
+        subscriber.stop(stop_loop=False)
+
+
+async def test_publisher_filter_lease(
+    one, start, monkeypatch: pytest.MonkeyPatch
+):
+    """Filters should expire unless renewed, and be limited in number."""
+    async with start(one):
+        server = one.server
+        topic = server.register_publish_filter(element_types=['workflow'])
+        expiry = server.publish_filter_expiry[topic]
+
+        # renewing a registration extends it (without adding another)
+        monkeypatch.setattr(server_module, 'time', lambda: expiry - 1)
+        assert server.register_publish_filter(
+            element_types=['workflow'], renew=True
+        ) == topic
+        assert server.publish_filter_counts[topic] == 1
+        expiry = server.publish_filter_expiry[topic]
+
+        # a filter which is not renewed in time is dropped
+        monkeypatch.setattr(server_module, 'time', lambda: expiry + 1)
+        assert server.filter_articles([]) == []
+        assert topic not in server.publish_filters
+        assert topic not in server.publish_filter_expiry
+
+        # there is a limit on the number of filters
+        monkeypatch.setattr(server_module, 'MAX_FILTERS', 2)
+        server.register_publish_filter(names=['a'])
+        server.register_publish_filter(names=['b'])
+        server.register_publish_filter(names=['b'])
+        with pytest.raises(CylcError, match='more than 2'):
+            server.register_publish_filter(names=['c'])
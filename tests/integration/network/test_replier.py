@@ -30,10 +30,9 @@ async def test_listener(one: Scheduler, start):
         # Test listener handles an invalid message from client
         # (without directly calling listener):
         client = WorkflowRuntimeClient(one.workflow)
-        client.socket.send_string(r'Not JSON')
-        res = deserialize(
-            (await client.socket.recv()).decode()
-        )
+        client.socket.send_multipart([b'', b'Not JSON'])
+        _, res = await client.socket.recv_multipart()
+        res = deserialize(res.decode())
         assert res['error']
         assert 'data' not in res
         # Check other fields are present:
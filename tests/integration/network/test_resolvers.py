@@ -23,7 +23,7 @@ import pytest
 from cylc.flow.data_store_mgr import EDGES, TASK_PROXIES
 from cylc.flow.id import Tokens
 from cylc.flow import CYLC_LOG
-from cylc.flow.network.resolvers import Resolvers
+from cylc.flow.network.resolvers import Resolvers, node_filter
 from cylc.flow.scheduler import Scheduler
 from cylc.flow.workflow_status import StopMode
 
@@ -127,6 +127,71 @@ async def test_get_nodes_all(mock_flow, node_args):
     assert len(nodes) == 1
 
 
+@pytest.mark.parametrize(
+    'args',
+    [
+        pytest.param({'states': ['waiting']}, id='states'),
+        pytest.param({'states': ['waiting', 'failed']}, id='multi-states'),
+        pytest.param({'exstates': ['waiting']}, id='exstates'),
+        pytest.param({'is_held': False}, id='is_held'),
+        pytest.param({'is_runahead': False}, id='is_runahead'),
+        pytest.param({'ids': ['20000101T0000Z/*']}, id='cycle'),
+        pytest.param({'ids': ['*/foo']}, id='name'),
+        pytest.param({'ids': ['2000*/foo']}, id='name-cycle-glob'),
+        pytest.param({'ids': ['*/f*']}, id='globs'),
+        pytest.param(
+            {'ids': ['20000101T0000Z/foo', '*/bar']}, id='multi-ids'
+        ),
+        pytest.param(
+            {'ids': ['*/prep'], 'states': ['waiting'], 'is_held': False},
+            id='combined'
+        ),
+    ]
+)
+async def test_get_nodes_all_indexed(mock_flow, node_args, args):
+    """Indexed lookups should return the same nodes as a scan of the store.
+    """
+    for key, value in args.items():
+        if key == 'ids':
+            value = [Tokens(n_id, relative=True) for n_id in value]
+        node_args[key] = value
+    expected = [
+        node.id
+        for node in mock_flow.data[TASK_PROXIES].values()
+        if node_filter(node, TASK_PROXIES, node_args, node.state)
+    ]
+    assert expected
+    nodes = await mock_flow.resolvers.get_nodes_all(TASK_PROXIES, node_args)
+    assert [node.id for node in nodes] == expected
+
+
+async def test_node_indexes(mock_flow):
+    """The node indexes should track changes to the data store."""
+    data_store_mgr = mock_flow.schd.data_store_mgr
+    index = data_store_mgr.node_indexes[TASK_PROXIES]
+    itask = mock_flow.schd.pool.get_tasks()[0]
+    tp_id = data_store_mgr.id_.duplicate(itask.tokens).id
+    assert tp_id in index.lookup('is_held', [False])
+
+    def apply_deltas():
+        data_store_mgr.batch_deltas()
+        data_store_mgr.apply_delta_batch()
+        data_store_mgr.clear_delta_batch()
+        data_store_mgr.clear_delta_store()
+
+    data_store_mgr.delta_task_held(itask.tdef.name, itask.point, True)
+    apply_deltas()
+    assert tp_id in index.lookup('is_held', [True])
+    assert tp_id not in index.lookup('is_held', [False])
+
+    data_store_mgr.delta_task_held(itask.tdef.name, itask.point, False)
+    apply_deltas()
+    assert tp_id not in index.lookup('is_held', [True])
+
+    # the index should cover the whole store (and nothing else)
+    assert set(index.entries) == set(mock_flow.data[TASK_PROXIES])
+
+
 async def test_get_nodes_by_ids(mock_flow, node_args):
     """Test method returning workflow(s) node messages
     who's ID is a match to any given."""
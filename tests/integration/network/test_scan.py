@@ -16,6 +16,7 @@
 """Test file-system interaction aspects of scan functionality."""
 
 from contextlib import suppress
+import os
 from pathlib import Path
 import re
 from shutil import rmtree
@@ -25,6 +26,7 @@ from typing import List
 import pytest
 
 from cylc.flow.network.scan import (
+    ScanIndex,
     filter_name,
     graphql_query,
     is_active,
@@ -32,6 +34,7 @@ from cylc.flow.network.scan import (
     scan_multi,
     workflow_params,
 )
+from cylc.flow.async_util import scandir
 from cylc.flow.workflow_db_mgr import WorkflowDatabaseManager
 from cylc.flow.workflow_files import WorkflowFiles
 
@@ -482,3 +485,89 @@ async def test_scan_cylc7(cylc7_run_dir):
     ) == [
         'cylc78', 'cylc8', 'cylc8a', 'either'
     ]
+
+
+def backdate(*paths: Path) -> None:
+    """Set back the modification times of paths by a minute."""
+    for path in paths:
+        mtime = os.stat(path).st_mtime - 60
+        os.utime(path, (mtime, mtime))
+
+
+async def test_scan_index(tmp_path, monkeypatch):
+    """It should only re-list directories which have changed."""
+    run_dir = tmp_path / 'cylc-run'
+    run_dir.mkdir()
+    monkeypatch.setattr('cylc.flow.pathutil._CYLC_RUN_DIR', run_dir)
+    index = ScanIndex(tmp_path / 'scan-index.json', run_dir)
+    monkeypatch.setattr(
+        'cylc.flow.network.scan._SCAN_INDEXES', {run_dir: index}
+    )
+    init_flows(
+        run_dir,
+        running=('foo', 'bar/run1'),
+        registered=('bar/run2', 'baz/qux/run1'),
+    )
+    backdate(*(Path(path) for path, _, _ in os.walk(run_dir)))
+
+    # count directory listings
+    listed = []
+
+    async def _scandir(path):
+        listed.append(path.relative_to(run_dir))
+        return await scandir(path)
+
+    monkeypatch.setattr('cylc.flow.network.scan.scandir', _scandir)
+
+    # the first scan must list everything
+    flows = ['bar/run1', 'bar/run2', 'baz/qux/run1', 'foo']
+    assert await listify(scan()) == flows
+    assert len(listed) == 10
+    # the index should have been written out
+    assert ScanIndex(index.path, run_dir).entries == index.entries
+
+    # subsequent scans shouldn't need to list anything
+    listed.clear()
+    assert await listify(scan()) == flows
+    assert listed == []
+
+    # a new workflow run should be picked up
+    init_flows(run_dir, registered=('bar/run3',))
+    backdate(run_dir / 'bar', run_dir / 'bar/run3')
+    listed.clear()
+    flows = ['bar/run1', 'bar/run2', 'bar/run3', 'baz/qux/run1', 'foo']
+    assert await listify(scan()) == flows
+    assert sorted(map(str, listed)) == ['bar', 'bar/run3']
+
+    # removed workflows should be removed from the index too
+    rmtree(run_dir / 'baz')
+    backdate(run_dir)
+    listed.clear()
+    flows = ['bar/run1', 'bar/run2', 'bar/run3', 'foo']
+    assert await listify(scan()) == flows
+    assert listed == [Path('.')]
+    assert not any('baz' in key for key in index.entries)
+
+    # it should be possible to bypass the index
+    listed.clear()
+    assert await listify(scan(use_index=False)) == flows
+    assert len(listed) == 7
+
+
+async def test_scan_index_recent(tmp_path, monkeypatch):
+    """It should not index directories which have been modified recently.
+
+    Their listing could change without changing the modification time (if the
+    filesystem timestamp resolution is coarse).
+    """
+    run_dir = tmp_path / 'cylc-run'
+    run_dir.mkdir()
+    monkeypatch.setattr('cylc.flow.pathutil._CYLC_RUN_DIR', run_dir)
+    index = ScanIndex(tmp_path / 'scan-index.json', run_dir)
+    monkeypatch.setattr(
+        'cylc.flow.network.scan._SCAN_INDEXES', {run_dir: index}
+    )
+    init_flows(run_dir, running=('foo',))
+    assert await listify(scan()) == ['foo']
+    assert index.entries == {}
+    assert not index.path.exists()
@@ -21,7 +21,20 @@ from typing import Callable
 import pytest
 
 from cylc.flow import __version__ as CYLC_VERSION
-from cylc.flow.network.server import PB_METHOD_MAP
+from cylc.flow.network import PB_METHODS
+from cylc.flow.network.client import WorkflowRuntimeClient
+from cylc.flow.data_messages_pb2 import PbTaskProxy
+from cylc.flow.data_store_mgr import (
+    ALL_DELTAS,
+    DELTAS_MAP,
+    TASK_PROXIES,
+    get_publish_articles,
+)
+from cylc.flow.network.server import (
+    PB_METHOD_MAP,
+    WorkflowRuntimeServer,
+    coalesce_deltas,
+)
 from cylc.flow.scheduler import Scheduler
 
 
@@ -82,6 +95,86 @@ def test_pb_entire_workflow(myflow):
     assert data.workflow.id == myflow.id
 
 
+def test_pb_methods():
+    """The client's list of protobuf methods must match the server's."""
+    assert set(PB_METHOD_MAP) == PB_METHODS
+
+
+def task_proxy_articles(added=(), updated=(), pruned=()):
+    delta = DELTAS_MAP[TASK_PROXIES]()
+    delta.added.extend(PbTaskProxy(id=id_) for id_ in added)
+    delta.updated.extend(
+        PbTaskProxy(id=id_, state='running') for id_ in updated
+    )
+    delta.pruned.extend(pruned)
+    return get_publish_articles({TASK_PROXIES: delta})
+
+
+def test_coalesce_deltas():
+    """It should merge consecutive batches of deltas."""
+    first = task_proxy_articles(added=['1/a'])
+    # a lone batch is left alone
+    assert coalesce_deltas([first]) == [first]
+
+    shutdown = [(b'shutdown', b'x')]
+    batches = coalesce_deltas([
+        first,
+        task_proxy_articles(updated=['1/a'], added=['1/b']),
+        task_proxy_articles(pruned=['1/a']),
+        # other items are published in order
+        shutdown,
+        task_proxy_articles(added=['1/c']),
+        # re-adding a pruned element can't be merged
+        task_proxy_articles(pruned=['1/c']),
+        task_proxy_articles(added=['1/c']),
+    ])
+    assert [
+        [topic for topic, *_ in articles]
+        for articles in batches
+    ] == [
+        [TASK_PROXIES.encode(), ALL_DELTAS.encode()],
+        [b'shutdown'],
+        [TASK_PROXIES.encode(), ALL_DELTAS.encode()],
+        [TASK_PROXIES.encode(), ALL_DELTAS.encode()],
+    ]
+    delta = batches[0][0][1]
+    assert [tp.id for tp in delta.added] == ['1/a', '1/b']
+    assert [tp.id for tp in delta.updated] == ['1/a']
+    assert list(delta.pruned) == ['1/a']
+    # the "all" topic carries the merged deltas too
+    assert batches[0][1][1].task_proxies == delta
+    assert batches[1] == shutdown
+    assert list(batches[2][0][1].pruned) == ['1/c']
+
+
+async def test_publish_queued_items(one: Scheduler, start):
+    """It should coalesce deltas which have queued up."""
+    async with start(one):
+        # (use a separate server, the workflow's would publish items as soon
+        # as they are queued)
+        server = WorkflowRuntimeServer(one)
+        published = []
+
+        class Publisher:
+            async def publish(self, *articles):
+                published.append(articles)
+
+        server.publisher = Publisher()
+        for id_ in ('1/a', '1/b', '1/c'):
+            server.publish_queue.put(task_proxy_articles(added=[id_]))
+        await server.publish_queued_items()
+        server.waker.close()
+    assert len(published) == 1
+    assert [
+        tp.id for tp in published[0][0][1].added
+    ] == ['1/a', '1/b', '1/c']
+    assert server.publish_stats == {
+        'batches queued': 3,
+        'batches published': 1,
+        'max queue length': 3,
+    }
+
+
 async def test_stop(one: Scheduler, start):
     """Test stop."""
     async with start(one):
@@ -151,3 +244,61 @@ async def test_publish_before_shutdown(
         one.server.publish_queue.put([(b'fake', b'blah')])
         await one.server.stop('i said stop!')
         assert not one.server.publish_queue.qsize()
+
+
+async def test_operate_wakes(one: Scheduler, start, monkeypatch):
+    """The server should respond to requests and publish without delay.
+
+    (i.e. not wait for the poll timeout)
+    """
+    monkeypatch.setattr(WorkflowRuntimeServer, 'OPERATE_POLL_TIMEOUT', 60000)
+    async with start(one):
+        # wait for the server thread to settle into the poll
+        await asyncio.sleep(0.5)
+        client = WorkflowRuntimeClient(one.workflow)
+        async with asyncio.timeout(5):
+            assert 'api' in await client.async_request('api')
+        client.stop(stop_loop=False)
+
+        one.server.publish_queue.put([(b'fake', b'blah')])
+        async with asyncio.timeout(5):
+            while one.server.publish_queue.qsize():
+                await asyncio.sleep(0.01)
+
+
+async def test_graphql_cache(one: Scheduler, start):
+    """It should reuse query results until the data store changes."""
+    async with start(one):
+        await one.update_data_structure()
+        client = WorkflowRuntimeClient(one.workflow)
+        query = 'query { taskProxies { id isHeld } }'
+
+        async def request(request_string):
+            return await client.async_request(
+                'graphql', {'request_string': request_string}
+            )
+
+        result = await request(query)
+        assert result == {
+            'taskProxies': [{'id': f'{one.id}//1/one', 'isHeld': False}]
+        }
+        assert list(one.server.graphql_results) == [(query, 'null')]
+        cached = one.server.graphql_results[(query, 'null')]
+        assert await request(query) == result
+        assert one.server.graphql_results[(query, 'null')] is cached
+
+        # mutations are not cached
+        await request(
+            'mutation { hold(workflows: ["*"], tasks: ["*"]) { result } }'
+        )
+        assert list(one.server.graphql_results) == [(query, 'null')]
+
+        # the cache is invalidated when the data store changes
+        one.data_store_mgr.delta_task_held(
+            'one', one.pool.get_tasks()[0].point, True
+        )
+        await one.update_data_structure()
+        assert await request(query) == {
+            'taskProxies': [{'id': f'{one.id}//1/one', 'isHeld': True}]
+        }
+        client.stop(stop_loop=False)
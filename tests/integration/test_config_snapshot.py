@@ -0,0 +1,170 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from pathlib import Path
+
+import pytest
+
+from cylc.flow.config import WorkflowConfig
+from cylc.flow.workflow_files import WorkflowFiles
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    """Count the number of times the graph is loaded."""
+    calls = []
+    load_graph = WorkflowConfig.load_graph
+
+    def _load_graph(self):
+        calls.append(self.workflow)
+        return load_graph(self)
+
+    monkeypatch.setattr(WorkflowConfig, 'load_graph', _load_graph)
+    return calls
+
+
+def get_snapshot(schd):
+    return Path(
+        schd.workflow_run_dir,
+        WorkflowFiles.Service.DIRNAME,
+        WorkflowFiles.Service.CONFIG_SNAPSHOT,
+    )
+
+
+def get_conf(icp='2000'):
+    return {
+        'scheduler': {'allow implicit tasks': True},
+        'scheduling': {
+            'initial cycle point': icp,
+            'final cycle point': '+P2D',
+            'xtriggers': {'w': 'wall_clock()'},
+            'graph': {
+                'P1D': '''
+                    @w => FAM:succeed-all => b<x> => c
+                    c[-P1D] => c
+                ''',
+            },
+        },
+        'task parameters': {'x': '1..3'},
+        'runtime': {
+            'FAM': {'environment': {'X': '1'}},
+            'a1, a2': {'inherit': 'FAM'},
+        },
+    }
+
+
+def summarise(config):
+    """Return a comparable summary of a config."""
+    return {
+        'taskdefs': {
+            name: (
+                sorted(map(str, taskdef.sequences)),
+                dict(taskdef.rtconfig['environment']),
+                sorted(map(str, taskdef.get_parent_points(
+                    config.initial_point
+                ))),
+            )
+            for name, taskdef in config.taskdefs.items()
+        },
+        'edges': {
+            str(sequence): sorted(edges)
+            for sequence, edges in config.edges.items()
+        },
+        'runtime': config.runtime,
+        'points': [
+            str(point)
+            for point in (
+                config.initial_point,
+                config.start_point,
+                config.final_point,
+            )
+        ],
+        'xtriggers': sorted(config.xtrigger_collator.functx_map),
+        'graph': config.get_graph_raw(
+            str(config.initial_point), str(config.final_point)
+        ),
+    }
+
+
+async def test_snapshot(flow, scheduler, start, builds):
+    """The scheduler should load an unchanged config from its snapshot."""
+    id_ = flow(get_conf())
+    schd = scheduler(id_)
+    async with start(schd):
+        assert len(builds) == 1
+        snapshot = get_snapshot(schd)
+        assert snapshot.exists()
+        expected = summarise(schd.config)
+
+        # reload an unchanged config
+        config = schd.load_flow_file(is_reload=True)
+        assert len(builds) == 1
+        assert summarise(config) == expected
+        assert config.options is schd.options
+
+    # restart
+    schd = scheduler(id_)
+    async with start(schd):
+        assert len(builds) == 1
+        assert summarise(schd.config) == expected
+        # the cycling globals should have been set up
+        assert str(schd.pool.get_tasks()[0].point) == '20000101T0000Z'
+
+    # change the config
+    conf = get_conf()
+    conf['runtime']['FAM']['environment']['X'] = '2'
+    flow(conf, workflow_id=id_)
+    schd = scheduler(id_)
+    async with start(schd):
+        assert len(builds) == 2
+        assert schd.config.taskdefs['a1'].rtconfig['environment'] == {
+            'X': '2'
+        }
+
+
+async def test_snapshot_options(flow, scheduler, start, builds):
+    """Snapshots should be specific to the options they were built with."""
+    id_ = flow(get_conf())
+    schd = scheduler(id_, fcp='20000102T00Z')
+    async with start(schd):
+        assert str(schd.config.final_point) == '20000102T0000Z'
+    schd = scheduler(id_, fcp='20000103T00Z')
+    async with start(schd):
+        assert str(schd.config.final_point) == '20000103T0000Z'
+    assert len(builds) == 2
+
+
+async def test_snapshot_time_dependent(flow, scheduler, start, builds):
+    """Configs which depend on the current time should not be snapshot."""
+    id_ = flow(get_conf(icp='previous(T00)'))
+    schd = scheduler(id_)
+    async with start(schd):
+        assert not get_snapshot(schd).exists()
+    assert len(builds) == 1
+
+
+async def test_snapshot_corrupt(flow, scheduler, start, builds):
+    """It should fall back to building the config."""
+    id_ = flow(get_conf())
+    schd = scheduler(id_)
+    async with start(schd):
+        snapshot = get_snapshot(schd)
+        key = snapshot.read_bytes().splitlines()[0]
+    snapshot.write_bytes(key + b'\nnonsense')
+    schd = scheduler(id_)
+    async with start(schd):
+        assert len(builds) == 2
+        assert schd.config.taskdefs
@@ -30,6 +30,7 @@ from cylc.flow.commands import (
     force_trigger_tasks,
     run_cmd,
 )
+from cylc.flow.cycling.integer import IntegerPoint
 from cylc.flow.data_messages_pb2 import (
     PbJob,
     PbPrerequisite,
@@ -47,7 +48,9 @@ from cylc.flow.id import (
     TaskTokens,
     Tokens,
 )
+from cylc.flow.network.client import WorkflowRuntimeClient
 from cylc.flow.network.log_stream_handler import ProtobufStreamHandler
+from cylc.flow.network.schema import schema
 from cylc.flow.scheduler import Scheduler
 from cylc.flow.task_events_mgr import TaskEventsManager
 from cylc.flow.task_outputs import (
@@ -908,3 +911,204 @@ async def test_job_estimated_finish_time(one_conf, flow, scheduler, start):
             get_pb_job(schd, itask).estimated_finish_time
             == f'{date}06:01:40Z'
         )
+
+
+async def test_max_jobs_per_task(flow, scheduler, start):
+    """It should evict old jobs from memory, but still serve them.
+
+    Jobs beyond [scheduler][data store]max jobs per task are removed from
+    the data store and loaded from the DB when the task's jobs are requested.
+    """
+    id_ = flow('foo')
+    schd: Scheduler = scheduler(id_)
+    async with start(schd):
+        dsm = schd.data_store_mgr
+        dsm.max_jobs_per_task = 2
+        itask = schd.pool.get_tasks()[0]
+        schd.workflow_db_mgr.put_insert_task_states(itask)
+        for submit_num in range(1, 5):
+            itask.submit_num = submit_num
+            schd.workflow_db_mgr.put_insert_task_jobs(itask, {
+                'is_manual_submit': False,
+                'try_num': 1,
+                'time_submit': get_current_time_string(),
+                'submit_status': 0,
+                'flow_nums': '[1]',
+                'job_runner_name': 'background',
+                'platform_name': 'localhost',
+            })
+            dsm.insert_job(itask, TASK_STATUS_RUNNING, {
+                'submit_num': submit_num,
+                'platform': {'name': 'localhost'},
+            })
+            await schd.update_data_structure()
+        schd.workflow_db_mgr.process_queued_ops()
+
+        tp_id = itask.tokens.id
+        data = dsm.data[dsm.workflow_id]
+        job_ids = [
+            itask.tokens.duplicate(job=f'0{n}').id for n in range(1, 5)
+        ]
+        assert list(data[TASK_PROXIES][tp_id].jobs) == job_ids[2:]
+        assert set(data[JOBS]) == set(job_ids[2:])
+
+        # evicted jobs are loaded from the DB
+        assert [job.id for job in dsm.get_evicted_jobs(tp_id)] == job_ids[:2]
+
+        # and served alongside the in-memory ones
+        resolvers = schd.server.resolvers
+        result = await schema.execute_async(
+            f'''
+            query {{
+              taskProxy(id: "{tp_id}") {{
+                jobs (sort: {{keys: ["submitNum"]}}) {{
+                  id
+                }}
+              }}
+            }}
+            ''',
+            context_value={'resolvers': resolvers, 'meta': {}},
+        )
+        assert not result.errors
+        assert [
+            job['id'] for job in result.data['taskProxy']['jobs']
+        ] == job_ids
+
+        # requests are served by the server thread, which must not use the
+        # scheduler's DB connection
+        client = WorkflowRuntimeClient(schd.workflow)
+        result = await client.async_request(
+            'graphql',
+            {'request_string': f'''
+                query {{
+                  taskProxy(id: "{tp_id}") {{
+                    jobs {{
+                      id
+                    }}
+                  }}
+                }}
+            '''}
+        )
+        client.stop(stop_loop=False)
+        assert {job['id'] for job in result['taskProxy']['jobs']} == set(
+            job_ids
+        )
+        # the scheduler can still write to the DB
+        schd.workflow_db_mgr.put_insert_task_states(itask)
+        schd.workflow_db_mgr.process_queued_ops()
+
+
+async def test_max_messages_per_job(flow, scheduler, start):
+    """It should only retain the latest job messages."""
+    id_ = flow('foo')
+    schd: Scheduler = scheduler(id_)
+    async with start(schd):
+        dsm = schd.data_store_mgr
+        dsm.max_messages_per_job = 2
+        itask = schd.pool.get_tasks()[0]
+        itask.submit_num = 1
+        dsm.insert_job(itask, TASK_STATUS_RUNNING, {
+            'submit_num': 1,
+            'platform': {'name': 'localhost'},
+        })
+        await schd.update_data_structure()
+        job_tokens = itask.tokens.duplicate(job='01')
+        for msg in ('a', 'b', 'c'):
+            dsm.delta_job_msg(job_tokens, msg)
+            await schd.update_data_structure()
+        assert list(
+            dsm.data[dsm.workflow_id][JOBS][job_tokens.id].messages
+        ) == ['b', 'c']
+
+
+async def test_latest_state_tasks(flow, scheduler, start):
+    """It should list the latest tasks to enter each state, newest first."""
+    id_ = flow('a & b & c & d & e & f')
+    schd: Scheduler = scheduler(id_)
+    async with start(schd):
+        await schd.update_data_structure()
+        dsm = schd.data_store_mgr
+        workflow = dsm.data[dsm.workflow_id][WORKFLOW]
+        waiting = list(workflow.latest_state_tasks['waiting'].task_proxies)
+        assert len(waiting) == 5
+        assert len(set(waiting)) == 5
+
+        # move the oldest waiting task to the front
+        itask = schd.pool.get_task(IntegerPoint('1'), waiting[-1][2:])
+        for state in (TASK_STATUS_RUNNING, TASK_STATUS_WAITING):
+            itask.state_reset(state)
+            dsm.delta_task_state(itask)
+            await schd.update_data_structure()
+        workflow = dsm.data[dsm.workflow_id][WORKFLOW]
+        assert list(
+            workflow.latest_state_tasks['waiting'].task_proxies
+        ) == [waiting[-1], *waiting[:-1]]
+        assert list(
+            workflow.latest_state_tasks['running'].task_proxies
+        ) == [waiting[-1]]
+
+
+async def test_compact_runtime(flow, scheduler, start, mock_glbl_cfg):
+    """Proxies should share their definition's runtime unless broadcast to.
+
+    See [scheduler][data store]compact runtime.
+    """
+    mock_glbl_cfg(
+        'cylc.flow.data_store_mgr.glbl_cfg',
+        '''
+            [scheduler]
+                [[data store]]
+                    compact runtime = True
+        '''
+    )
+    id_ = flow({
+        'scheduling': {'graph': {'R1': 'foo & bar'}},
+        'runtime': {'FAM': {'script': 'fam'}, 'foo': {'inherit': 'FAM'}},
+    })
+    schd: Scheduler = scheduler(id_)
+
+    async def query_runtimes():
+        result = await schema.execute_async(
+            '''
+            query {
+              taskProxies { id runtime { script } }
+              familyProxies (ids: ["1/FAM"]) { id runtime { script } }
+            }
+            ''',
+            context_value={'resolvers': schd.server.resolvers, 'meta': {}},
+        )
+        assert not result.errors
+        return {
+            Tokens(node['id'])['task']: node['runtime']['script']
+            for key in ('taskProxies', 'familyProxies')
+            for node in result.data[key]
+        }
+
+    async with start(schd):
+        await schd.update_data_structure()
+        dsm = schd.data_store_mgr
+        data = dsm.data[dsm.workflow_id]
+        assert not any(
+            node.HasField('runtime')
+            for node_type in (TASK_PROXIES, FAMILY_PROXIES)
+            for node in data[node_type].values()
+        )
+        assert await query_runtimes() == {
+            'foo': 'fam', 'bar': '', 'FAM': 'fam'
+        }
+
+        # broadcast to foo, only it should get its own runtime
+        schd.broadcast_mgr.put_broadcast(['1'], ['foo'], [{'script': 'x'}])
+        await schd.update_data_structure()
+        foo_id = schd.tokens.duplicate(cycle='1', task='foo').id
+        foo = data[TASK_PROXIES][foo_id]
+        assert foo.runtime.script == 'x'
+        assert [
+            node.name
+            for node_type in (TASK_PROXIES, FAMILY_PROXIES)
+            for node in data[node_type].values()
+            if node.HasField('runtime')
+        ] == ['foo']
+        assert await query_runtimes() == {
+            'foo': 'x', 'bar': '', 'FAM': 'fam'
+        }
@@ -16,6 +16,7 @@
 
 from contextlib import suppress
 
+from cylc.flow import data_store_mgr
 from cylc.flow.cycling.integer import IntegerPoint
 from cylc.flow.data_store_mgr import (
     TASK_PROXIES,
@@ -407,3 +408,56 @@ async def test_cache_pruning(flow, scheduler, start):
         await complete_task(schd, 'f')
         increment_graph_window(schd, 'f')
         assert get_graph_walk_cache(schd) == []
+
+
+async def test_graph_relations_cache(flow, scheduler, start, monkeypatch):
+    """It should resolve node relations once and drop them on pruning."""
+    id_ = flow({
+        'scheduler': {
+            'allow implicit tasks': 'True',
+        },
+        'scheduling': {
+            'graph': {
+                'R1': 'a => b => c => d => e',
+            }
+        },
+    })
+    schd = scheduler(id_)
+    async with start(schd):
+        # start with an empty pool
+        schd.pool.remove(schd.pool.get_tasks()[0])
+        schd.data_store_mgr.set_graph_window_extent(2)
+        await get_n_window(schd)
+
+        # count the graph walk relation lookups
+        calls = []
+        _generate_graph_children = data_store_mgr.generate_graph_children
+
+        def generate_graph_children(tdef, *args, **kwargs):
+            calls.append(tdef.name)
+            return _generate_graph_children(tdef, *args, **kwargs)
+
+        monkeypatch.setattr(
+            data_store_mgr, 'generate_graph_children', generate_graph_children
+        )
+
+        add_task(schd, 'b')
+        increment_graph_window(schd, 'b')
+        await complete_task(schd, 'b')
+        add_task(schd, 'c')
+        increment_graph_window(schd, 'c')
+
+        # each node should only have been resolved once
+        assert sorted(calls) == ['a', 'b', 'c', 'd', 'e']
+        assert set(await get_n_window(schd)) == {'a', 'b', 'c', 'd', 'e'}
+
+        # cached relations should be removed with the nodes they belong to
+        await complete_task(schd, 'c')
+        add_task(schd, 'e')
+        increment_graph_window(schd, 'e')
+        window = await get_n_window(schd)
+        assert set(window) == {'c', 'd', 'e'}
+        assert {
+            Tokens(tp_id)['task']
+            for tp_id in schd.data_store_mgr.n_window_relations
+        } <= set(window)
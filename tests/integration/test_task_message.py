@@ -0,0 +1,56 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import json
+import os
+import sys
+
+from cylc.flow.task_message import CYLC_TASK_MESSAGE_SPOOL
+
+
+async def test_spooled_messages(one_conf, flow, scheduler, start, tmp_path):
+    """Spooled messages from several jobs should reach the scheduler."""
+    id_ = flow(one_conf)
+    schd = scheduler(id_)
+    async with start(schd):
+        spool = tmp_path / id_
+        spool.mkdir(parents=True)
+        # messages left in the spool by another job
+        (spool / '1-1.json').write_text(
+            json.dumps(['1/a/01', 'T1', [['INFO', 'started']]])
+        )
+        # send messages from a job process
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            '-c',
+            'from cylc.flow.task_message import send_messages; '
+            f'send_messages("{id_}", "1/b/01", '
+            '[["INFO", "started"], ["INFO", "succeeded"]], "T2")',
+            env={**os.environ, CYLC_TASK_MESSAGE_SPOOL: str(tmp_path)},
+        )
+        assert await asyncio.wait_for(proc.wait(), 60) == 0
+
+        received = []
+        while not schd.message_queue.empty():
+            msg = schd.message_queue.get()
+            received.append((msg.job_id.relative_id, msg.message))
+        assert received == [
+            ('1/a/01', 'started'),
+            ('1/b/01', 'started'),
+            ('1/b/01', 'succeeded'),
+        ]
+        assert not list(spool.glob('*.json'))
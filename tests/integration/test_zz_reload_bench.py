@@ -0,0 +1,39 @@
+import cProfile, pstats, time
+from cylc.flow import commands
+
+
+async def test_bench(flow, scheduler, start, monkeypatch):
+    monkeypatch.setattr('cylc.flow.scheduler.sleep', lambda *_: None)
+    conf = {
+        'scheduler': {'allow implicit tasks': True},
+        'task parameters': {'m': '0..49', 'n': '0..39'},
+        'scheduling': {
+            'cycling mode': 'integer',
+            'initial cycle point': 1,
+            'graph': {'P1': 'foo<m> => bar<m,n> => baz<m>'},
+        },
+        'runtime': {
+            'root': {'script': 'true'},
+            'FAM<m>': {},
+            'bar<m,n>': {'inherit': 'FAM<m>'},
+            'bar<m=0,n=0>': {'script': 'echo 1'},
+        },
+    }
+    id_ = flow(conf)
+    schd = scheduler(id_)
+    async with start(schd):
+        print('pool', len(schd.pool.get_tasks()), 'taskdefs', len(schd.config.taskdefs))
+        conf['runtime']['bar<m=0,n=0>']['script'] = 'echo 2'
+        flow(conf, workflow_id=id_)
+        c = schd.load_flow_file(is_reload=False).get_changes(schd.config)
+        print('CHANGES', c.graph, c.structure, c.namespaces)
+        new = schd.load_flow_file(is_reload=False)
+        print('OLD', schd.config.cfg['runtime']['FAM_m00']['outputs'], schd.config.cfg['runtime']['FAM_m00']['completion'], schd.config.cfg['runtime']['bar_m00_n01']['completion'])
+        print('NEW', new.cfg['runtime']['FAM_m00']['outputs'], new.cfg['runtime']['FAM_m00']['completion'])
+        prof = cProfile.Profile()
+        s = time.perf_counter()
+        prof.enable()
+        await commands.run_cmd(commands.reload_workflow(schd))
+        prof.disable()
+        print('reload', time.perf_counter() - s)
+        pstats.Stats(prof).sort_stats('cumtime').print_stats(60)
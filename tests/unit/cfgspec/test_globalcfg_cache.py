@@ -0,0 +1,141 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import os
+
+import pytest
+
+from cylc.flow.cfgspec import globalcfg_cache
+from cylc.flow.cfgspec.globalcfg import GlobalConfig
+from cylc.flow.cfgspec.globalcfg_cache import get_cache_dir, prune
+
+
+@pytest.fixture
+def conf_dir(tmp_path, monkeypatch):
+    """Load the global config from a temporary directory, using the cache.
+
+    Returns the directory to write the global.cylc file to.
+    """
+    monkeypatch.setattr(GlobalConfig, 'CACHE', True)
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    conf_dir = tmp_path / 'conf'
+    conf_dir.mkdir()
+    monkeypatch.setenv('CYLC_CONF_PATH', str(conf_dir))
+    return conf_dir
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Count the number of times the global config files are loaded."""
+    calls = []
+    _load_files = GlobalConfig._load_files
+
+    def _inner(self, *args, **kwargs):
+        calls.append(args)
+        return _load_files(self, *args, **kwargs)
+
+    monkeypatch.setattr(GlobalConfig, '_load_files', _inner)
+    return calls
+
+
+def get_platforms():
+    return list(GlobalConfig.get_inst(cached=False).get(['platforms']))
+
+
+def test_cache_hit(conf_dir, loads):
+    """It should only load the same files once."""
+    (conf_dir / 'global.cylc').write_text('[platforms]\n    [[foo]]\n')
+    for _ in range(3):
+        assert get_platforms() == ['localhost', 'foo']
+    assert len(loads) == 1
+    assert len(list(get_cache_dir().glob('*.pickle'))) == 1
+
+    # change the file
+    (conf_dir / 'global.cylc').write_text('[platforms]\n    [[bar]]\n')
+    assert get_platforms() == ['localhost', 'bar']
+    assert len(loads) == 2
+
+    # remove the file
+    (conf_dir / 'global.cylc').unlink()
+    assert get_platforms() == ['localhost']
+    assert len(loads) == 3
+
+
+def test_jinja2(conf_dir, loads, monkeypatch):
+    """It should only use a cached config if the Jinja2 inputs are unchanged.
+    """
+    (conf_dir / 'global.cylc').write_text(
+        '#!jinja2\n[platforms]\n    [[{{ environ["PLATFORM"] }}]]\n'
+    )
+    monkeypatch.setenv('PLATFORM', 'foo')
+    for _ in range(2):
+        assert get_platforms() == ['localhost', 'foo']
+    assert len(loads) == 1
+
+    monkeypatch.setenv('PLATFORM', 'bar')
+    assert get_platforms() == ['localhost', 'bar']
+    assert len(loads) == 2
+
+
+def test_not_cacheable(conf_dir, loads):
+    """It should not cache configs which depend on things it can't track."""
+    (conf_dir / 'inc.cylc').write_text('[platforms]\n    [[foo]]\n')
+    (conf_dir / 'global.cylc').write_text('%include inc.cylc\n')
+    for _ in range(2):
+        assert get_platforms() == ['localhost', 'foo']
+    assert len(loads) == 2
+
+    (conf_dir / 'global.cylc').write_text(
+        '#!jinja2\n'
+        '{% for key in environ %}{% endfor %}\n'
+        '[platforms]\n    [[foo]]\n'
+    )
+    for _ in range(2):
+        assert get_platforms() == ['localhost', 'foo']
+    assert len(loads) == 4
+    assert not list(get_cache_dir().glob('*.pickle'))
+
+
+def test_warnings(conf_dir, loads, caplog):
+    """It should log the warnings from loading the config on a cache hit."""
+    (conf_dir / 'global.cylc').write_text(
+        '[scheduler]\n    [[events]]\n        mail events = stall, foo\n'
+    )
+    caplog.set_level(logging.WARNING)
+    for _ in range(2):
+        caplog.clear()
+        GlobalConfig.get_inst(cached=False)
+        assert caplog.messages == [
+            '(type=option) [scheduler][events]mail events = foo'
+            '\nInvalid items have been removed'
+        ]
+    assert len(loads) == 1
+
+
+def test_prune(tmp_path, monkeypatch):
+    """It should remove the least recently used entries."""
+    monkeypatch.setattr(
+        globalcfg_cache, 'GLOBAL_CONFIG_CACHE_MAX_ENTRIES', 2
+    )
+    for mtime, name in enumerate('abc'):
+        path = tmp_path / f'{name}.pickle'
+        path.touch()
+        os.utime(path, (mtime, mtime))
+    prune(tmp_path)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        'b.pickle', 'c.pickle'
+    ]
@@ -15,6 +15,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from datetime import datetime
+import pickle
 
 import pytest
 from pytest import param
@@ -502,6 +503,20 @@ def test_advanced_exclusions_sequences_implied_start_point(set_cycling_type):
     ]
 
 
+def test_pickle(set_cycling_type):
+    """Sequences (with exclusions) can be pickled (for config snapshots)."""
+    set_cycling_type(ISO8601_CYCLING_TYPE, "Z")
+    sequence = ISO8601Sequence("PT1H!20000101T02Z", "20000101T00Z")
+    sequence.is_on_sequence(ISO8601Point("20000101T01Z"))  # populate cache
+    copy = pickle.loads(pickle.dumps(sequence))
+    assert copy == sequence
+    assert copy.is_on_sequence(ISO8601Point("20000101T01Z"))
+    assert not copy.is_on_sequence(ISO8601Point("20000101T02Z"))
+    assert str(copy.get_next_point(ISO8601Point("20000101T01Z"))) == (
+        "20000101T0300Z"
+    )
+
+
 def test_point_init():
     """It should error if inited with anything other than a string."""
     ISO8601Point('1000')
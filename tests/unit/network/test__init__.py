@@ -15,11 +15,21 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Test __init__.py for network interfaces to Cylc scheduler objects."""
 
+import sys
+
 import pytest
 
 import cylc.flow
 from cylc.flow.exceptions import CylcVersionError
-from cylc.flow.network import get_location
+from cylc.flow.network import (
+    ENCODING_JSON,
+    ENCODING_MSGPACK,
+    decode_response,
+    encode_response,
+    get_location,
+    get_response_encodings,
+    select_response_encoding,
+)
 from cylc.flow.workflow_files import ContactFileFields
 
 
@@ -60,3 +70,43 @@ def test_get_location_old_contact_file(monkeypatch, mpatch_get_fqdn_by_host):
     )
     with pytest.raises(CylcVersionError, match=r'.*5.1.2.*'):
         get_location('_')
+
+
+@pytest.fixture
+def no_msgpack(monkeypatch):
+    """Make the msgpack library unavailable."""
+    get_response_encodings.cache_clear()
+    monkeypatch.setitem(sys.modules, 'msgpack', None)
+    yield
+    get_response_encodings.cache_clear()
+
+
+@pytest.mark.parametrize('encoding', [ENCODING_JSON, ENCODING_MSGPACK])
+def test_response_encoding(encoding):
+    """Responses should be decoded whatever encoding they are sent in."""
+    if encoding == ENCODING_MSGPACK:
+        pytest.importorskip('msgpack')
+    res = {
+        'data': {'workflows': [{'id': '~u/w', 'isHeld': False, 'x': None}]},
+        'cylc_version': '8',
+    }
+    assert decode_response(encode_response(res, encoding)) == res
+
+
+def test_select_response_encoding():
+    """The preferred encoding supported by both ends should be selected."""
+    pytest.importorskip('msgpack')
+    assert get_response_encodings() == [ENCODING_MSGPACK, ENCODING_JSON]
+    assert select_response_encoding(
+        [ENCODING_JSON, ENCODING_MSGPACK]
+    ) == ENCODING_MSGPACK
+    # old clients don't send encodings
+    assert select_response_encoding(None) == ENCODING_JSON
+
+
+def test_select_response_encoding_no_msgpack(no_msgpack):
+    """JSON should be used if the server doesn't have msgpack."""
+    assert get_response_encodings() == [ENCODING_JSON]
+    assert select_response_encoding(
+        [ENCODING_MSGPACK, ENCODING_JSON]
+    ) == ENCODING_JSON
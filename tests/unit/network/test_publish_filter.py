@@ -0,0 +1,159 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from cylc.flow.cycling.loader import INTEGER_CYCLING_TYPE
+from cylc.flow.data_messages_pb2 import (
+    AllDeltas,
+    PbEdge,
+    PbTaskProxy,
+    PbWorkflow,
+)
+from cylc.flow.exceptions import InputError
+from cylc.flow.network.publish_filter import (
+    PublishFilter,
+    is_filter_topic,
+)
+
+
+@pytest.fixture
+def all_deltas(set_cycling_type):
+    set_cycling_type(INTEGER_CYCLING_TYPE)
+    deltas = AllDeltas()
+    deltas.workflow.time = 1.0
+    deltas.workflow.updated.CopyFrom(PbWorkflow(
+        id='~u/w',
+        stamp='~u/w@1',
+        status='running',
+        state_totals={'running': 1},
+    ))
+    deltas.task_proxies.time = 1.0
+    deltas.task_proxies.checksum = 123
+    deltas.task_proxies.added.extend([
+        PbTaskProxy(id='~u/w//1/foo', stamp='a', name='foo', state='running'),
+        PbTaskProxy(id='~u/w//2/foo', stamp='b', name='foo', state='waiting'),
+        PbTaskProxy(id='~u/w//2/bar', stamp='c', name='bar', state='waiting'),
+    ])
+    deltas.task_proxies.pruned.extend(['~u/w//1/bar', '~u/w//3/bar'])
+    deltas.edges.added.extend([
+        PbEdge(id='~u/w//$edge|1/foo|2/foo'),
+        PbEdge(id='~u/w//$edge|2/foo|3/foo'),
+    ])
+    return deltas
+
+
+def ids(delta):
+    return [element.id for element in delta.added]
+
+
+def test_no_filter(all_deltas):
+    """It should pass everything (bar checksums) with an empty filter."""
+    result = PublishFilter().apply(all_deltas)
+    assert ids(result.task_proxies) == ids(all_deltas.task_proxies)
+    assert ids(result.edges) == ids(all_deltas.edges)
+    assert result.workflow.updated == all_deltas.workflow.updated
+    assert result.task_proxies.time == 1.0
+    assert not result.task_proxies.HasField('checksum')
+
+
+def test_element_types(all_deltas):
+    """It should filter by element type."""
+    result = PublishFilter(element_types=['workflow']).apply(all_deltas)
+    assert result.workflow.updated.status == 'running'
+    assert not result.HasField('task_proxies')
+    assert not result.HasField('edges')
+
+
+def test_point_range(all_deltas):
+    """It should filter by cycle point range."""
+    result = PublishFilter(min_point='2', max_point='2').apply(all_deltas)
+    assert ids(result.task_proxies) == ['~u/w//2/foo', '~u/w//2/bar']
+    assert list(result.task_proxies.pruned) == []
+    # edges match if either end is in range
+    assert ids(result.edges) == ids(all_deltas.edges)
+
+    result = PublishFilter(min_point='3').apply(all_deltas)
+    assert not result.task_proxies.added
+    assert list(result.task_proxies.pruned) == ['~u/w//3/bar']
+    assert ids(result.edges) == ['~u/w//$edge|2/foo|3/foo']
+
+
+def test_names(all_deltas):
+    """It should filter by name glob."""
+    result = PublishFilter(names=['b*']).apply(all_deltas)
+    assert ids(result.task_proxies) == ['~u/w//2/bar']
+    assert list(result.task_proxies.pruned) == ['~u/w//1/bar', '~u/w//3/bar']
+    assert not result.HasField('edges')
+    # the workflow is not subject to point or name filters
+    assert result.workflow.updated.id == '~u/w'
+
+
+def test_fields(all_deltas):
+    """It should strip out fields not in the mask."""
+    result = PublishFilter(
+        element_types=['workflow', 'task_proxies'],
+        fields=['state', 'state_totals'],
+    ).apply(all_deltas)
+    assert result.workflow.updated == PbWorkflow(
+        id='~u/w',
+        stamp='~u/w@1',
+        state_totals={'running': 1},
+    )
+    assert result.task_proxies.added[0] == PbTaskProxy(
+        id='~u/w//1/foo', stamp='a', state='running'
+    )
+    # the original message should not be modified
+    assert all_deltas.task_proxies.added[0].name == 'foo'
+
+
+def test_nothing_matched(all_deltas):
+    """It should return None if nothing passes the filter."""
+    assert PublishFilter(
+        element_types=['task_proxies'],
+        names=['baz'],
+    ).apply(all_deltas) is None
+
+
+def test_topic(set_cycling_type):
+    """Equivalent filters should share a topic."""
+    set_cycling_type(INTEGER_CYCLING_TYPE)
+    topic = PublishFilter(
+        element_types=['jobs', 'task_proxies'],
+        min_point='1',
+        fields=['state'],
+    ).topic
+    assert is_filter_topic(topic)
+    assert topic == PublishFilter(
+        element_types=['task_proxies', 'jobs'],
+        min_point='01',
+        fields=['state', 'id'],
+    ).topic
+    assert topic != PublishFilter(element_types=['jobs']).topic
+
+
+@pytest.mark.parametrize(
+    'kwargs, err',
+    [
+        ({'element_types': ['foo']}, 'Invalid element type'),
+        ({'element_types': ['all']}, 'Invalid element type'),
+        ({'min_point': 'x'}, 'Invalid cycle point'),
+    ]
+)
+def test_invalid(set_cycling_type, kwargs, err):
+    set_cycling_type(INTEGER_CYCLING_TYPE)
+    with pytest.raises(InputError, match=err):
+        PublishFilter(**kwargs)
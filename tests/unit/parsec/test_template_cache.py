@@ -0,0 +1,217 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from types import SimpleNamespace
+
+import pytest
+
+from cylc.flow.parsec import template_cache
+from cylc.flow.parsec.fileparse import read_and_proc
+from cylc.flow.parsec.template_cache import get_cache_dir, prune
+
+
+@pytest.fixture
+def renders(monkeypatch, tmp_path):
+    """Use a temporary cache and count calls to the Jinja2 processor."""
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    calls = []
+    jinja2process = template_cache.jinja2process
+
+    def _jinja2process(*args, **kwargs):
+        calls.append(args)
+        return jinja2process(*args, **kwargs)
+
+    monkeypatch.setattr(template_cache, 'jinja2process', _jinja2process)
+    return calls
+
+
+@pytest.fixture
+def flow_file(tmp_path):
+    src = tmp_path / 'src'
+    src.mkdir()
+    flow_file = src / 'flow.cylc'
+    flow_file.write_text('#!jinja2\n[meta]\n    title = {{ TITLE }}\n')
+    return flow_file
+
+
+def test_cache_hit(renders, flow_file):
+    """It should only render the same file with the same inputs once."""
+    for _ in range(3):
+        assert read_and_proc(
+            str(flow_file), template_vars={'TITLE': '"x"'}
+        ) == ['[meta]', '    title = "x"']
+    assert len(renders) == 1
+    assert len(list(get_cache_dir().glob('*.json'))) == 1
+
+    # change the template variables
+    assert read_and_proc(
+        str(flow_file), template_vars={'TITLE': '"y"'}
+    ) == ['[meta]', '    title = "y"']
+    assert len(renders) == 2
+
+    # change the file
+    flow_file.write_text('#!jinja2\n[meta]\n    description = {{ TITLE }}\n')
+    assert read_and_proc(
+        str(flow_file), template_vars={'TITLE': '"y"'}
+    ) == ['[meta]', '    description = "y"']
+    assert len(renders) == 3
+
+
+def test_concatenate(renders, flow_file):
+    """It should cache the output with continuation lines concatenated.
+
+    Or not, as requested.
+    """
+    flow_file.write_text('#!jinja2\n[meta]\n    title = {{ 1 }} \\\n 2\n')
+    viewcfg = {
+        'jinja2': True,
+        'contin': True,
+        'inline': True,
+        'mark': False,
+        'single': False,
+        'label': False,
+    }
+    for _ in range(2):
+        assert read_and_proc(str(flow_file), viewcfg=viewcfg) == [
+            '[meta]', '    title = 1  2'
+        ]
+    viewcfg['contin'] = False
+    for _ in range(2):
+        assert read_and_proc(str(flow_file), viewcfg=viewcfg) == [
+            '[meta]', '    title = 1 \\', ' 2'
+        ]
+    assert len(renders) == 2
+
+
+def test_no_template_cache(renders, flow_file):
+    """It should not use the cache if the --no-template-cache is used."""
+    opts = SimpleNamespace(template_cache=False)
+    for _ in range(2):
+        read_and_proc(str(flow_file), template_vars={'TITLE': 1}, opts=opts)
+    # (bypasses cached_jinja2process entirely)
+    assert not renders
+    assert not get_cache_dir().exists()
+
+
+def test_not_jinja2(renders, flow_file):
+    """It should not cache files which aren't templated."""
+    flow_file.write_text('[meta]\n    title = x\n')
+    read_and_proc(str(flow_file))
+    assert not renders
+    assert not get_cache_dir().exists()
+
+
+@pytest.mark.parametrize('template, change', [
+    pytest.param(
+        '{% include "inc.cylc" %}',
+        lambda src, monkeypatch: (src / 'inc.cylc').write_text('title = b'),
+        id='include',
+    ),
+    pytest.param(
+        '{% include "new.cylc" ignore missing %}',
+        lambda src, monkeypatch: (src / 'new.cylc').write_text('title = b'),
+        id='include-missing',
+    ),
+    pytest.param(
+        '{% from "macros.cylc" import title %}{{ title() }}',
+        lambda src, monkeypatch: (src / 'macros.cylc').write_text(
+            '{% macro title() %}title = b{% endmacro %}'
+        ),
+        id='import',
+    ),
+    pytest.param(
+        'title = {{ environ["FOO"] }}',
+        lambda src, monkeypatch: monkeypatch.setenv('FOO', 'b'),
+        id='environ',
+    ),
+    pytest.param(
+        'title = {{ environ.get("BAR", "") }}',
+        lambda src, monkeypatch: monkeypatch.setenv('BAR', 'b'),
+        id='environ-unset',
+    ),
+    pytest.param(
+        'title = {{ CYLC_FOO }}',
+        lambda src, monkeypatch: monkeypatch.setenv('CYLC_FOO', 'b'),
+        id='cylc-env-var',
+    ),
+    pytest.param(
+        'title = {{ "x" | foo }}',
+        lambda src, monkeypatch: (src / 'Jinja2Filters/foo.py').write_text(
+            'def foo(value):\n    return "b"\n'
+        ),
+        id='filter',
+    ),
+])
+def test_invalidation(renders, flow_file, monkeypatch, template, change):
+    """It should re-render if any input to the render changes."""
+    src = flow_file.parent
+    (src / 'inc.cylc').write_text('title = a')
+    (src / 'macros.cylc').write_text(
+        '{% macro title() %}title = a{% endmacro %}'
+    )
+    (src / 'Jinja2Filters').mkdir()
+    (src / 'Jinja2Filters/foo.py').write_text(
+        'def foo(value):\n    return "a"\n'
+    )
+    monkeypatch.setenv('FOO', 'a')
+    monkeypatch.delenv('BAR', raising=False)
+    monkeypatch.setenv('CYLC_FOO', 'a')
+    flow_file.write_text(f'#!jinja2\n[meta]\n{template}\n')
+
+    read_and_proc(str(flow_file))
+    read_and_proc(str(flow_file))
+    assert len(renders) == 1
+
+    change(src, monkeypatch)
+    # (custom filters are imported once per process)
+    monkeypatch.delitem(__import__('sys').modules, 'foo', raising=False)
+    lines = read_and_proc(str(flow_file))
+    assert len(renders) == 2
+    assert lines[-1] == 'title = b'
+
+
+@pytest.mark.parametrize('template', [
+    pytest.param(
+        '{% from "__python__.os" import getpid %}# {{ getpid() }}',
+        id='python-module',
+    ),
+    pytest.param('# {{ environ | length }}', id='environ-iteration'),
+    pytest.param(
+        '{% do environ.update({"CYLC_TEST_FOO": "1"}) %}',
+        id='environ-update',
+    ),
+])
+def test_not_cacheable(renders, flow_file, monkeypatch, template):
+    """It should not cache renders which depend on untracked inputs."""
+    monkeypatch.delenv('CYLC_TEST_FOO', raising=False)
+    flow_file.write_text(f'#!jinja2\n{template}\n[meta]\n')
+    read_and_proc(str(flow_file))
+    read_and_proc(str(flow_file))
+    assert len(renders) == 2
+    assert not list(get_cache_dir().glob('*.json'))
+
+
+def test_prune(tmp_path, monkeypatch):
+    """It should remove the least recently used entries."""
+    monkeypatch.setattr(template_cache, 'TEMPLATE_CACHE_MAX_ENTRIES', 2)
+    for mtime, name in enumerate('abc'):
+        path = tmp_path / f'{name}.json'
+        path.touch()
+        template_cache.os.utime(path, (mtime, mtime))
+    prune(tmp_path)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        'b.json', 'c.json'
+    ]
@@ -29,6 +29,7 @@ from cylc.flow.parsec.util import (
     poverride,
     printcfg,
     replicate,
+    replicate_shared,
     un_many,
 )
 
@@ -134,6 +135,42 @@ def test_replicate():
     assert str(target_3) == str(source_3)
 
 
+# --- replicate_shared
+
+def test_replicate_shared():
+    """It should replicate sources into base, sharing unchanged sections."""
+    base = OrderedDictWithDefaults()
+    base['script'] = 'a'
+    base['environment'] = OrderedDictWithDefaults([('X', '1')])
+    base['directives'] = OrderedDictWithDefaults([('-a', '1')])
+    base['retries'] = [1, 2]
+    source = OrderedDictWithDefaults()
+    source['script'] = 'b'
+    source['environment'] = OrderedDictWithDefaults([('Y', '2')])
+    # (an empty section overrides nothing)
+    source['directives'] = OrderedDictWithDefaults()
+
+    target = replicate_shared(base, [source])
+
+    # it should be equivalent to replicating base then source
+    expected = OrderedDictWithDefaults()
+    replicate(expected, base)
+    replicate(expected, source)
+    assert target == expected
+
+    # sections (and lists) which are not overridden should be shared
+    assert target['directives'] is base['directives']
+    assert target['retries'] is base['retries']
+
+    # base should not have been changed
+    assert target['environment'] is not base['environment']
+    assert base['script'] == 'a'
+    assert base['environment'] == {'X': '1'}
+
+    # it should work with no base
+    assert replicate_shared(None, [base, source]) == expected
+
+
 # --- pdeepcopy
 
 def test_pdeepcopy():
@@ -221,6 +258,31 @@ def test_m_override():
     assert target["name"]["index"] == "oil"
 
 
+def test_m_override_shared():
+    """Sections shared in the source should be shared in the target."""
+    section = OrderedDictWithDefaults([('X', '1')])
+    source = OrderedDictWithDefaults()
+    source['a'] = OrderedDictWithDefaults([('environment', section)])
+    source['b'] = OrderedDictWithDefaults([('environment', section)])
+    source['c'] = OrderedDictWithDefaults([
+        ('environment', OrderedDictWithDefaults([('X', '1')]))
+    ])
+
+    target = OrderedDictWithDefaults()
+    target['__MANY__'] = OrderedDictWithDefaults()
+    target['__MANY__']['environment'] = OrderedDictWithDefaults()
+    target['__MANY__']['environment']['__MANY__'] = None
+
+    m_override(target, source)
+    un_many(target)
+    assert target['a']['environment'] is target['b']['environment']
+    assert target['a']['environment'] is not target['c']['environment']
+    assert target['a']['environment'] is not section
+    assert target['a'] == target['b'] == target['c'] == {
+        'environment': {'X': '1'}
+    }
+
+
 def test_m_override_many_with_many():
     source = OrderedDictWithDefaults()
     source["name"] = OrderedDictWithDefaults()
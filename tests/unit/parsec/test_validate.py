@@ -316,6 +316,36 @@ def test_parsec_validator(sample_spec):
     # TBD assertIsNotNone when 2.6+
     assert parsec_validator is not None
 
+
+def test_parsec_validator_repeated_values(sample_spec):
+    """Identical raw values should be coerced to equal, independent values."""
+    cfg = OrderedDictWithDefaults()
+    for name in ('foo', 'bar'):
+        cfg[name] = OrderedDictWithDefaults()
+        cfg[name]['ids'] = '1..3'
+    ParsecValidator().validate(cfg, sample_spec)
+    assert cfg['foo']['ids'] == cfg['bar']['ids'] == [1, 2, 3]
+    assert cfg['foo']['ids'] is not cfg['bar']['ids']
+
+    # repeated bad values should be reported against their own item
+    validator = ParsecValidator()
+    for name in ('baz', 'qux'):
+        cfg = OrderedDictWithDefaults()
+        cfg[name] = OrderedDictWithDefaults()
+        cfg[name]['ids'] = 'a'
+        with pytest.raises(IllegalValueError, match=rf'\[{name}\]ids'):
+            validator.validate(cfg, sample_spec)
+
+
+def test_parsec_validator_repeated_xtriggers():
+    """Xtrigger contexts should not be shared between items."""
+    with Conf('base') as spec:
+        Conf('<xtrigger name>', VDR.V_XTRIGGER)
+    cfg = {'x': 'wall_clock()', 'y': 'wall_clock()'}
+    VDR().validate(cfg, spec)
+    assert cfg['x'].label == 'x'
+    assert cfg['y'].label == 'y'
+
 # --- static methods
 
 
@@ -0,0 +1,91 @@
+# THIS FILE IS PART OF THE CYLC WORKFLOW ENGINE.
+# Copyright (C) NIWA & British Crown (Met Office) & Contributors.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Guard the import cost of commands which run on the job host.
+
+Commands such as "cylc message" are run (many times) from within jobs, so
+their start-up time matters. These tests check (with "python -X importtime")
+that they don't pull in any of the scheduler-side machinery.
+"""
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+
+# modules which job-side commands should never need to import
+HEAVY_MODULES = {
+    'graphene',
+    'graphql',
+    'google.protobuf',
+    'jinja2',
+    'cylc.flow.cfgspec.workflow',
+    'cylc.flow.config',
+    'cylc.flow.data_store_mgr',
+    'cylc.flow.network.schema',
+    'cylc.flow.network.server',
+    'cylc.flow.prerequisite',
+    'cylc.flow.scheduler',
+}
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """Import a module in a fresh interpreter.
+
+    Returns:
+        {module: cumulative import time (microseconds)}
+
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        # import time: <self [us]> | <cumulative [us]> | <module>
+        if not line.startswith('import time:'):
+            continue
+        _self, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():  # (skip the header line)
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize('module', [
+    'cylc.flow.scripts.message',
+    'cylc.flow.scripts.jobs_kill',
+    'cylc.flow.scripts.jobs_poll',
+    'cylc.flow.scripts.jobs_submit',
+    'cylc.flow.network.client',
+])
+def test_job_side_imports(module):
+    """Job-side commands must not import heavyweight modules."""
+    times = import_times(module)
+    assert module in times
+    heavy = {
+        name: time
+        for name, time in times.items()
+        if any(
+            name == heavy_module or name.startswith(f'{heavy_module}.')
+            for heavy_module in HEAVY_MODULES
+        )
+    }
+    assert not heavy, (
+        f'{module} imports heavyweight modules (cumulative us): {heavy}'
+    )
@@ -39,6 +39,7 @@ from cylc.flow import (
 )
 from cylc.flow.config import WorkflowConfig
 from cylc.flow.cycling import loader
+from cylc.flow.cycling.integer import IntegerPoint
 from cylc.flow.cycling.iso8601 import ISO8601Point
 from cylc.flow.cycling.loader import (
     INTEGER_CYCLING_TYPE,
@@ -262,6 +263,58 @@ def test_family_inheritance_and_quotes(
             config.runtime['descendants']['SOMEFAM'])
 
 
+def test_inheritance_shared_sections(tmp_flow_config: Callable) -> None:
+    """Tasks should share the runtime sections they don't override."""
+    id_ = 'test'
+    file_path = tmp_flow_config(id_, '''
+        [scheduler]
+            allow implicit tasks = True
+        [scheduling]
+            [[graph]]
+                R1 = a & b & c & d
+        [runtime]
+            [[root]]
+                [[[meta]]]
+                    URL = http://example.com/%(task)s
+            [[FAM1]]
+                [[[environment]]]
+                    X = 1
+                [[[directives]]]
+                    -x = 1
+            [[FAM2]]
+                inherit = FAM1
+                [[[environment]]]
+                    Y = 2
+            [[a, b]]
+                inherit = FAM2
+            [[c]]
+                inherit = FAM2
+                [[[directives]]]
+                    -c = 3
+            [[FAM3]]
+                [[[environment]]]
+                    X = 3
+            [[d]]
+                inherit = FAM3, FAM2
+    ''')
+    config = WorkflowConfig(
+        id_, file_path, template_vars={}, options=Values()
+    )
+    rtconfig = {
+        name: taskdef.rtconfig for name, taskdef in config.taskdefs.items()
+    }
+    assert rtconfig['a']['environment'] is rtconfig['b']['environment']
+    assert rtconfig['a']['environment'] is rtconfig['c']['environment']
+    assert rtconfig['a']['environment'] == {'X': '1', 'Y': '2'}
+    assert rtconfig['d']['environment'] == {'X': '3', 'Y': '2'}
+    assert rtconfig['a']['directives'] is rtconfig['b']['directives']
+    assert rtconfig['a']['directives'] == {'-x': '1'}
+    assert rtconfig['c']['directives'] == {'-x': '1', '-c': '3'}
+    # task specific settings should not be shared
+    assert rtconfig['a']['meta']['URL'] == 'http://example.com/a'
+    assert rtconfig['b']['meta']['URL'] == 'http://example.com/b'
+
+
 @pytest.mark.parametrize(
     ('cycling_type', 'scheduling_cfg', 'expected_icp', 'expected_eval_icp',
      'expected_err'),
@@ -1128,45 +1181,177 @@ def test_process_runahead_limit(
 
 
 @pytest.mark.parametrize(
-    'opt', [None, 'check_circular']
+    'cycling, graph, circular',
+    [
+        param(
+            'integer',
+            {'R1': 'a => b => c => d => e => a'},
+            True,
+            id='circular',
+        ),
+        param(
+            'integer',
+            {'P1': 'a => b => c', 'R1': 'c => a'},
+            True,
+            id='across-sequences',
+        ),
+        param(
+            'integer',
+            {'P1': 'a[-P1] => b', 'R1/2': 'b[+P1] => a'},
+            True,
+            id='opposing-offsets',
+        ),
+        param(
+            'integer',
+            {'P1': 'a[-P1] => b => a'},
+            False,
+            id='inter-cycle',
+        ),
+        param(
+            'integer',
+            {'P1': 'a[+P1] => b => a'},
+            False,
+            id='future-trigger',
+        ),
+        param(
+            'integer',
+            {'R1': 'a => b', 'R1/$': 'b => a'},
+            False,
+            id='different-points',
+        ),
+        param(
+            'iso8601',
+            {'P1D': 'a => b => c', 'T12': 'c[-PT12H] => a'},
+            False,
+            id='iso8601-inter-cycle',
+        ),
+        param(
+            'iso8601',
+            {'P1D': 'a => b', 'R1': 'b[^] => a'},
+            True,
+            id='iso8601-icp-offset',
+        ),
+    ]
 )
-def test_check_circular(opt, monkeypatch, caplog, tmp_flow_config):
+def test_check_circular(cycling, graph, circular, tmp_flow_config):
     """Test WorkflowConfig._check_circular()."""
-    # ----- Setup -----
-    caplog.set_level(logging.INFO, CYLC_LOG)
-
+    id_ = 'circular'
+    graph_str = '\n'.join(
+        f'{recurrence} = "{line}"' for recurrence, line in graph.items()
+    )
+    flow_file = tmp_flow_config(id_, f"""
+    [scheduler]
+        allow implicit tasks = True
+    [scheduling]
+        cycling mode = {'integer' if cycling == 'integer' else 'gregorian'}
+        initial cycle point = {1 if cycling == 'integer' else 2000}
+        final cycle point = {5 if cycling == 'integer' else 2001}
+        [[graph]]
+            {graph_str}
+    """)
     options = SimpleNamespace(is_validate=True)
-    if opt:
-        setattr(options, opt, True)
+    if circular:
+        with pytest.raises(WorkflowConfigError) as exc:
+            WorkflowConfig(workflow=id_, fpath=flow_file, options=options)
+        assert "circular edges detected" in str(exc.value)
+    else:
+        WorkflowConfig(workflow=id_, fpath=flow_file, options=options)
+
 
+def test_check_circular_large_graph(tmp_flow_config):
+    """It should check large graphs for circular dependence.
+
+    Only the tasks which might be circular should be checked in the concrete
+    graph.
+    """
     id_ = 'circular'
     flow_file = tmp_flow_config(id_, """
+    [scheduler]
+        allow implicit tasks = True
+    [task parameters]
+        m = 0..999
     [scheduling]
         cycling mode = integer
+        initial cycle point = 1
         [[graph]]
-            R1 = "a => b => c => d => e => a"
-    [runtime]
-        [[a, b, c, d, e]]
-            script = True
+            P1 = \"""
+                a<m>[-P1] => a<m> => b<m> => c
+                c => d => e => c
+            \"""
     """)
+    options = SimpleNamespace(is_validate=True)
+    with pytest.raises(WorkflowConfigError) as exc:
+        WorkflowConfig(workflow=id_, fpath=flow_file, options=options)
+    msg = str(exc.value)
+    assert msg.startswith('circular edges detected:')
+    assert '1/c => 1/d' in msg
+    assert '_m' not in msg
 
-    def WorkflowConfig__assert_err_raised():
-        with pytest.raises(WorkflowConfigError) as exc:
-            WorkflowConfig(workflow=id_, fpath=flow_file, options=options)
-        assert "circular edges detected" in str(exc.value)
 
-    # ----- The actual test -----
-    WorkflowConfig__assert_err_raised()
-    # Now artificially lower the limit and re-test:
-    monkeypatch.setattr(
-        'cylc.flow.config.WorkflowConfig.CHECK_CIRCULAR_LIMIT', 4)
-    if opt != 'check_circular':
-        # Will no longer raise
-        WorkflowConfig(workflow='circular', fpath=flow_file, options=options)
-        msg = "will not check graph for circular dependencies"
-        assert msg in caplog.text
-    else:
-        WorkflowConfig__assert_err_raised()
+def test_get_graph_raw(tmp_flow_config):
+    """Test WorkflowConfig.get_graph_raw().
+
+    Covers offsets, offsets from the ICP, pre-initial dependencies, xtriggers
+    and closed families.
+    """
+    id_ = 'graph-raw'
+    flow_file = tmp_flow_config(id_, """
+    [scheduler]
+        allow implicit tasks = True
+    [scheduling]
+        cycling mode = integer
+        initial cycle point = 1
+        final cycle point = 3
+        [[xtriggers]]
+            x = xrandom(0)
+        [[graph]]
+            R1 = "@x => a"
+            P1 = \"""
+                a[-P1] => a => FAM:succeed-all => b
+                a[^] => c
+            \"""
+    [runtime]
+        [[FAM]]
+        [[m1, m2]]
+            inherit = FAM
+    """)
+    config = WorkflowConfig(
+        workflow=id_, fpath=flow_file, options=SimpleNamespace()
+    )
+    # pre-initial dependency on 1/a, ICP offset relative to the start point
+    assert config.get_graph_raw('2', '2') == [
+        ('2/a', None, None, False, False),
+        ('2/a', '2/c', None, False, False),
+        ('2/a', '2/m1', None, False, False),
+        ('2/a', '2/m2', None, False, False),
+        ('2/m1', '2/b', None, False, False),
+        ('2/m2', '2/b', None, False, False),
+    ]
+    # closed family
+    assert config.get_graph_raw('1', '2', grouping=['FAM']) == [
+        ('1/@x', '1/a', None, False, False),
+        ('1/FAM', '1/b', None, False, False),
+        ('1/FAM', '1/b', None, False, False),
+        ('1/a', None, None, False, False),
+        ('1/a', '1/FAM', None, False, False),
+        ('1/a', '1/FAM', None, False, False),
+        ('1/a', '1/c', None, False, False),
+        ('1/a', '2/a', None, False, False),
+        ('1/a', '2/c', None, False, False),
+        ('2/FAM', '2/b', None, False, False),
+        ('2/FAM', '2/b', None, False, False),
+        ('2/a', '2/FAM', None, False, False),
+        ('2/a', '2/FAM', None, False, False),
+    ]
+    # validation: only non-suicide edges between tasks (as node tuples)
+    config.options.is_validate = True
+    assert sorted(config.get_graph_raw(
+        '1', '2', tasks={'a', 'c'}, sort=False
+    )) == [
+        (('a', IntegerPoint('1')), ('a', IntegerPoint('2'))),
+        (('a', IntegerPoint('1')), ('c', IntegerPoint('1'))),
+        (('a', IntegerPoint('1')), ('c', IntegerPoint('2'))),
+    ]
 
 
 @pytest.mark.parametrize(
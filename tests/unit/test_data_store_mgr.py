@@ -17,14 +17,28 @@
 from copy import deepcopy
 from time import time
 
+import pytest
+
+from cylc.flow.data_messages_pb2 import (
+    PbPrerequisite,
+    PbTask,
+    PbTaskProxy,
+    PbWorkflow,
+)
 from cylc.flow.data_store_mgr import (
+    set_task_elapsed_times,
     task_mean_elapsed_time,
     apply_delta,
+    deltas_mergeable,
+    merge_deltas,
+    TASKS,
+    TASK_PROXIES,
     WORKFLOW,
     DELTAS_MAP,
     ALL_DELTAS,
     DATA_TEMPLATE
 )
+from cylc.flow.taskdef import ElapsedTimes
 
 
 def int_id():
@@ -32,16 +46,38 @@ def int_id():
 
 
 class FakeTDef:
-    elapsed_times = (0.0, 10.0)
+    def __init__(self, *elapsed_times, rtconfig=None):
+        self.elapsed_times = ElapsedTimes(10)
+        self.elapsed_times.extend(elapsed_times)
+        self.rtconfig = rtconfig or {}
 
 
 def test_task_mean_elapsed_time():
-    tdef = FakeTDef()
+    tdef = FakeTDef(0.0, 10.0)
     result = task_mean_elapsed_time(tdef)
     assert result == 5
     assert isinstance(result, int)
 
 
+def test_set_task_elapsed_times():
+    task = PbTask()
+    assert not set_task_elapsed_times(task, FakeTDef())
+    assert not task.ListFields()
+
+    # falls back to the execution time limit, no quantiles without data
+    assert set_task_elapsed_times(
+        task, FakeTDef(rtconfig={'execution time limit': 60})
+    )
+    assert task == PbTask(mean_elapsed_time=60)
+
+    # only the latest 10 times are considered
+    task = PbTask()
+    assert set_task_elapsed_times(task, FakeTDef(1000, *range(1, 11)))
+    assert task == PbTask(
+        mean_elapsed_time=6, p50_elapsed_time=6, p95_elapsed_time=10
+    )
+
+
 def test_apply_delta():
     """Test delta application.
 
@@ -67,3 +103,136 @@ def test_apply_delta():
 
     assert data[WORKFLOW].id == w_id
     assert data[WORKFLOW].pruned is True
+
+
+def make_deltas(tasks=None, task_proxies=None, workflow=None):
+    """Return a batch of deltas {key: delta}.
+
+    Args:
+        tasks, task_proxies, workflow: {delta field: value}
+    """
+    deltas = {}
+    for key, fields in (
+        (TASKS, tasks),
+        (TASK_PROXIES, task_proxies),
+        (WORKFLOW, workflow),
+    ):
+        if fields:
+            delta = DELTAS_MAP[key]()
+            for field, value in fields.items():
+                if key == WORKFLOW:
+                    getattr(delta, field).CopyFrom(value)
+                else:
+                    getattr(delta, field).extend(value)
+            deltas[key] = delta
+    return deltas
+
+
+DELTA_BATCHES = [
+    make_deltas(
+        tasks={'added': [PbTask(id='foo', proxies=['1/foo'])]},
+        task_proxies={'added': [
+            PbTaskProxy(
+                id='1/foo',
+                task='foo',
+                state='waiting',
+                prerequisites=[PbPrerequisite(expression='a')],
+            ),
+        ]},
+        workflow={'added': PbWorkflow(id='w', states=['waiting'])},
+    ),
+    make_deltas(
+        tasks={'updated': [PbTask(id='foo', proxies=['2/foo'])]},
+        task_proxies={
+            'added': [PbTaskProxy(id='2/foo', task='foo', state='waiting')],
+            'updated': [
+                PbTaskProxy(
+                    id='1/foo',
+                    state='running',
+                    jobs=['1/foo/01'],
+                    prerequisites=[PbPrerequisite(expression='b')],
+                ),
+            ],
+        },
+        workflow={'updated': PbWorkflow(id='w', states=['running'])},
+    ),
+    make_deltas(
+        task_proxies={
+            'updated': [
+                PbTaskProxy(
+                    id='1/foo',
+                    jobs=['1/foo/02'],
+                    prerequisites=[PbPrerequisite(expression='c')],
+                ),
+                PbTaskProxy(id='2/foo', state='running'),
+            ],
+            'pruned': ['2/foo'],
+        },
+        workflow={'updated': PbWorkflow(
+            id='w', states=['succeeded'], states_updated=True
+        )},
+    ),
+]
+
+
+def apply_deltas(*batches):
+    """Apply batches of deltas to a new data store in turn."""
+    data = deepcopy(DATA_TEMPLATE)
+    for deltas in batches:
+        for key in (TASKS, TASK_PROXIES, WORKFLOW):
+            if key in deltas:
+                apply_delta(key, deltas[key], data)
+    return data
+
+
+@pytest.mark.parametrize('start', range(len(DELTA_BATCHES)))
+def test_merge_deltas(start):
+    """Applying merged deltas should be the same as applying them in turn."""
+    # (note applying deltas modifies them, so use fresh copies each time)
+    batches = deepcopy(DELTA_BATCHES)
+    merged = batches[start]
+    for deltas in batches[start + 1:]:
+        for key, delta in deltas.items():
+            if key in merged:
+                assert deltas_mergeable(key, merged[key], delta)
+                merge_deltas(key, merged[key], delta)
+            else:
+                merged[key] = delta
+    expected = apply_deltas(*deepcopy(DELTA_BATCHES))
+    assert apply_deltas(*deepcopy(DELTA_BATCHES[:start]), merged) == expected
+
+    # the task's proxies should have been cleaned up after the prune
+    assert list(expected[TASKS]['foo'].proxies) == ['1/foo']
+    # "clear" fields should have been overwritten, others appended to
+    assert expected[TASK_PROXIES]['1/foo'] == PbTaskProxy(
+        id='1/foo',
+        task='foo',
+        state='running',
+        jobs=['1/foo/01', '1/foo/02'],
+        prerequisites=[PbPrerequisite(expression='c')],
+    )
+    assert list(expected[WORKFLOW].states) == ['succeeded']
+
+
+def test_merge_deltas_reloaded():
+    """A reloaded delta replaces the preceding one."""
+    delta, new_delta = DELTAS_MAP[TASKS](), DELTAS_MAP[TASKS]()
+    delta.added.append(PbTask(id='foo'))
+    new_delta.added.append(PbTask(id='bar'))
+    new_delta.reloaded = True
+    merge_deltas(TASKS, delta, new_delta)
+    assert delta == new_delta
+
+
+def test_deltas_mergeable():
+    """Deltas which re-add a pruned element cannot be merged."""
+    pruned = make_deltas(task_proxies={'pruned': ['1/foo']})[TASK_PROXIES]
+    added = make_deltas(
+        task_proxies={'added': [PbTaskProxy(id='1/foo')]}
+    )[TASK_PROXIES]
+    updated = make_deltas(
+        task_proxies={'updated': [PbTaskProxy(id='1/foo')]}
+    )[TASK_PROXIES]
+    assert not deltas_mergeable(TASK_PROXIES, pruned, added)
+    assert deltas_mergeable(TASK_PROXIES, pruned, updated)
+    assert deltas_mergeable(TASK_PROXIES, added, pruned)
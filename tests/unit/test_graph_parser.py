@@ -24,7 +24,7 @@ from types import SimpleNamespace
 
 from cylc.flow import CYLC_LOG
 from cylc.flow.exceptions import GraphParseError, ParamExpandError
-from cylc.flow.graph_parser import GraphParser
+from cylc.flow.graph_parser import GraphParser, parse_graphs
 from cylc.flow.task_outputs import (
     TASK_OUTPUT_SUBMITTED,
     TASK_OUTPUT_STARTED,
@@ -995,3 +995,62 @@ def test_proc_dep_pair(args, err):
             gp._proc_dep_pair(*args)
     else:
         assert gp._proc_dep_pair(*args) is None
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_parse_graphs(processes):
+    """It should parse graph strings in order, serially or in parallel."""
+    family_map = {'FAM': ['m1', 'm2']}
+    parameters = ({'i': [1, 2]}, {'i': '_i%(i)d'})
+    graphs = ['a<i> => FAM', 'FAM:succeed-any => b?\nc? => b?', 'd']
+    task_output_opt = {}
+    parsers = list(parse_graphs(
+        graphs,
+        family_map,
+        parameters,
+        task_output_opt=task_output_opt,
+        processes=processes,
+    ))
+    assert len(parsers) == 3
+    for parser, graph in zip(parsers, graphs):
+        expected = GraphParser(family_map, parameters)
+        expected.parse_graph(graph)
+        assert parser.triggers == expected.triggers
+        assert parser.original == expected.original
+        assert parser.terminals == expected.terminals
+    assert parsers[0].triggers['m1'] == {
+        'a_i1:succeeded': (['a_i1:succeeded'], False),
+        'a_i2:succeeded': (['a_i2:succeeded'], False),
+    }
+    # output optionality should be collected across graph strings
+    assert task_output_opt[('b', TASK_OUTPUT_SUCCEEDED)] == (True, True, True)
+    assert task_output_opt[('m1', TASK_OUTPUT_SUCCEEDED)][0] is False
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+@pytest.mark.parametrize(
+    'graphs, expected_err',
+    [
+        param(
+            ['a => b', 'a? => c'],
+            "Output a:succeeded can't be both required and optional",
+            id='output-optionality-across-graphs',
+        ),
+        param(
+            ['a => b', 'a? => c', 'd && e'],
+            # (the first error in order should be raised)
+            "Output a:succeeded can't be both required and optional",
+            id='first-error-raised',
+        ),
+        param(
+            ['a => b', 'd && e', 'a? => c'],
+            "The graph AND operator is '&'",
+            id='parse-error',
+        ),
+    ]
+)
+def test_parse_graphs_errors(processes, graphs, expected_err):
+    """It should raise the same errors, serially or in parallel."""
+    with pytest.raises(GraphParseError, match=expected_err):
+        for _ in parse_graphs(graphs, task_output_opt={}, processes=processes):
+            pass
@@ -419,6 +419,27 @@ def test_write_task_environment():
         assert fake_file.getvalue() == expected
 
 
+def test_write_task_environment_message_spool():
+    """The message spool directory should be exported if configured."""
+    job_conf = {
+        "platform": {
+            'communication method': 'zmq',
+            'message spool directory': '$TMPDIR/cylc-messages',
+        },
+        "job_d": "1/moo/01",
+        "namespace_hierarchy": ["moo"],
+        "try_num": 1,
+        "flow_nums": {1},
+        "param_var": {},
+        "work_d": None,
+    }
+    with io.StringIO() as fake_file:
+        JobFileWriter()._write_task_environment(fake_file, job_conf)
+        assert (
+            '\n    export CYLC_TASK_MESSAGE_SPOOL="$TMPDIR/cylc-messages"'
+        ) in fake_file.getvalue()
+
+
 def test_write_runtime_environment():
     """Test runtime environment is correctly written in jobscript"""
 
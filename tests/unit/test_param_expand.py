@@ -37,7 +37,7 @@ class TestParamExpand(unittest.TestCase):
     def test_name_one_param(self):
         """Test name expansion and returned value for a single parameter."""
         self.assertEqual(
-            self.name_expander.expand('foo<j>'),
+            list(self.name_expander.expand('foo<j>')),
             [('foo_j0', {'j': 0}),
              ('foo_j1', {'j': 1}),
              ('foo_j2', {'j': 2})]
@@ -46,7 +46,7 @@ class TestParamExpand(unittest.TestCase):
     def test_name_two_params(self):
         """Test name expansion and returned values for two parameters."""
         self.assertEqual(
-            self.name_expander.expand('foo<i,j>'),
+            list(self.name_expander.expand('foo<i,j>')),
             [('foo_i0_j0', {'i': 0, 'j': 0}),
              ('foo_i0_j1', {'i': 0, 'j': 1}),
              ('foo_i0_j2', {'i': 0, 'j': 2}),
@@ -58,7 +58,7 @@ class TestParamExpand(unittest.TestCase):
     def test_name_two_names(self):
         """Test name expansion for two names."""
         self.assertEqual(
-            self.name_expander.expand('foo<i>, bar<j>'),
+            list(self.name_expander.expand('foo<i>, bar<j>')),
             [('foo_i0', {'i': 0}),
              ('foo_i1', {'i': 1}),
              ('bar_j0', {'j': 0}),
@@ -69,14 +69,14 @@ class TestParamExpand(unittest.TestCase):
     def test_name_specific_val_1(self):
         """Test singling out a specific value, in name expansion."""
         self.assertEqual(
-            self.name_expander.expand('foo<i=0>'),
+            list(self.name_expander.expand('foo<i=0>')),
             [('foo_i0', {'i': 0})]
         )
 
     def test_name_specific_val_2(self):
         """Test specific value in the first parameter of a pair."""
         self.assertEqual(
-            self.name_expander.expand('foo<i=0,j>'),
+            list(self.name_expander.expand('foo<i=0,j>')),
             [('foo_i0_j0', {'i': 0, 'j': 0}),
              ('foo_i0_j1', {'i': 0, 'j': 1}),
              ('foo_i0_j2', {'i': 0, 'j': 2})]
@@ -85,7 +85,7 @@ class TestParamExpand(unittest.TestCase):
     def test_name_specific_val_3(self):
         """Test specific value in the second parameter of a pair."""
         self.assertEqual(
-            self.name_expander.expand('foo<i,j=1>'),
+            list(self.name_expander.expand('foo<i,j=1>')),
             [('foo_i0_j1', {'i': 0, 'j': 1}),
              ('foo_i1_j1', {'i': 1, 'j': 1})]
         )
@@ -111,7 +111,7 @@ class TestParamExpand(unittest.TestCase):
     def test_name_multiple(self):
         """Test expansion of two names, with one and two parameters."""
         self.assertEqual(
-            self.name_expander.expand('foo<i>, bar<i,j>'),
+            list(self.name_expander.expand('foo<i>, bar<i,j>')),
             [('foo_i0', {'i': 0}),
              ('foo_i1', {'i': 1}),
              ('bar_i0_j0', {'i': 0, 'j': 0}),
@@ -125,7 +125,7 @@ class TestParamExpand(unittest.TestCase):
     def test_graph_expand_1(self):
         """Test graph expansion with two parameters each side of an arrow."""
         self.assertEqual(
-            self.graph_expander.expand("bar<i,j>=>baz<i,j>"),
+            set(self.graph_expander.expand("bar<i,j>=>baz<i,j>")),
             set(["bar_i0_j1=>baz_i0_j1",
                  "bar_i1_j2=>baz_i1_j2",
                  "bar_i0_j2=>baz_i0_j2",
@@ -137,7 +137,7 @@ class TestParamExpand(unittest.TestCase):
     def test_graph_expand_2(self):
         """Test graph expansion to 'branch and merge' a workflow."""
         self.assertEqual(
-            self.graph_expander.expand("pre=>bar<i>=>baz<i,j>=>post"),
+            set(self.graph_expander.expand("pre=>bar<i>=>baz<i,j>=>post")),
             set(["pre=>bar_i0=>baz_i0_j1=>post",
                  "pre=>bar_i1=>baz_i1_j2=>post",
                  "pre=>bar_i0=>baz_i0_j2=>post",
@@ -149,13 +149,13 @@ class TestParamExpand(unittest.TestCase):
     def test_graph_expand_3(self):
         """Test graph expansion -ve integers."""
         self.assertEqual(
-            self.graph_expander.expand("bar<a>"),
+            set(self.graph_expander.expand("bar<a>")),
             set(["bar_a-1", "bar_a-3"]))
 
     def test_graph_expand_offset_1(self):
         """Test graph expansion with a -ve offset."""
         self.assertEqual(
-            self.graph_expander.expand("bar<i-1,j>=>baz<i,j>"),
+            set(self.graph_expander.expand("bar<i-1,j>=>baz<i,j>")),
             set(["bar_i-32768_j0=>baz_i0_j0",
                  "bar_i-32768_j1=>baz_i0_j1",
                  "bar_i-32768_j2=>baz_i0_j2",
@@ -167,7 +167,7 @@ class TestParamExpand(unittest.TestCase):
     def test_graph_expand_offset_2(self):
         """Test graph expansion with a +ve offset."""
         self.assertEqual(
-            self.graph_expander.expand("baz<i>=>baz<i+1>"),
+            set(self.graph_expander.expand("baz<i>=>baz<i+1>")),
             set(["baz_i0=>baz_i1",
                  "baz_i1=>baz_i-32768"])
         )
@@ -175,7 +175,7 @@ class TestParamExpand(unittest.TestCase):
     def test_graph_expand_specific(self):
         """Test graph expansion with a specific value."""
         self.assertEqual(
-            self.graph_expander.expand("bar<i=1,j>=>baz<i,j>"),
+            set(self.graph_expander.expand("bar<i=1,j>=>baz<i,j>")),
             set(["bar_i1_j0=>baz_i0_j0",
                  "bar_i1_j1=>baz_i0_j1",
                  "bar_i1_j2=>baz_i0_j2",
@@ -14,11 +14,18 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import json
 from socket import gaierror
+from unittest.mock import Mock
 
 import pytest
 
-from cylc.flow.task_message import send_messages
+from cylc.flow.exceptions import ClientTimeout
+from cylc.flow.task_message import (
+    CYLC_TASK_MESSAGE_SPOOL,
+    SPOOL_RETRY,
+    send_messages,
+)
 
 
 def test_send_messages_err(
@@ -36,3 +43,65 @@ def test_send_messages_err(
         'arasaka', '1/v/01', [['INFO', 'silverhand']], '2077-01-01T00:00:00Z'
     )
     assert f"gaierror: [Errno -2] {exc_msg}" in capsys.readouterr().err
+
+
+@pytest.fixture
+def spool(monkeypatch, tmp_path):
+    """Spool messages in a temporary directory with a mock client."""
+    monkeypatch.setenv(CYLC_TASK_MESSAGE_SPOOL, str(tmp_path))
+    client = Mock()
+    monkeypatch.setattr(
+        'cylc.flow.task_message.get_client', lambda *a, **k: client
+    )
+    return tmp_path / 'w', client
+
+
+def test_spool_messages(spool):
+    """Spooled messages should be sent together in one request."""
+    spool_path, client = spool
+    spool_path.mkdir()
+    # messages left in the spool by another job
+    (spool_path / '1-1.json').write_text(
+        json.dumps(['1/a/01', 'T1', [['INFO', 'started']]])
+    )
+    send_messages('w', '1/b/01', [['INFO', 'started']], 'T2')
+
+    assert client.call_count == 1
+    (command, kwargs), _ = client.call_args
+    assert command == 'graphql'
+    assert [
+        (kwargs['variables'][f'taskJob{ind}'],
+         kwargs['variables'][f'messages{ind}'])
+        for ind in range(2)
+    ] == [
+        ('1/a/01', [['INFO', 'started']]),
+        ('1/b/01', [['INFO', 'started']]),
+    ]
+    assert not list(spool_path.glob('*.json'))
+
+
+def test_spool_messages_retry(spool, capsys):
+    """Messages which cannot be sent should be kept for a later retry."""
+    spool_path, client = spool
+    client.side_effect = ClientTimeout('timeout')
+    with pytest.raises(ClientTimeout):
+        send_messages('w', '1/a/01', [['INFO', 'started']], 'T1')
+    assert len(list(spool_path.glob('*.json'))) == 1
+    assert (spool_path / SPOOL_RETRY).exists()
+
+    # don't keep trying while the scheduler is unreachable
+    client.reset_mock()
+    send_messages('w', '1/b/01', [['INFO', 'started']], 'T2')
+    assert not client.called
+    assert 'spooled for retry' in capsys.readouterr().err
+    assert len(list(spool_path.glob('*.json'))) == 2
+
+    # ... but retry after the delay
+    (spool_path / SPOOL_RETRY).unlink()
+    client.side_effect = None
+    send_messages('w', '1/c/01', [['INFO', 'started']], 'T3')
+    assert client.call_count == 1
+    (_, kwargs), _ = client.call_args
+    assert len(kwargs['variables']) == 1 + 3 * 3
+    assert not list(spool_path.glob('*.json'))
+    assert not (spool_path / SPOOL_RETRY).exists()